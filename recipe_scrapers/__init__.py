@@ -1,4 +1,5 @@
 from __future__ import annotations
+
 from .delishkitchen import DelishKitchen
 from .kurashiru import Kurashiru
 from .lettuceclub import LettuceClub
@@ -11,12 +12,20 @@ __all__ = (
     "ElementNotFoundInHtml",
     "FieldNotProvidedByWebsiteException",
     "NoSchemaFoundInWildMode",
+    "ParquetRecipeWriter",
+    "RecipeBatchBuilder",
     "RecipeSchemaNotFound",
+    "ScrapeLimitExceeded",
     "StaticValueException",
     "WebsiteNotImplementedError",
+    "export_parquet",
+    "recipe_schema",
+    "scrape_all",
     "scrape_html",
 )
 
+import mmap
+import os
 import warnings
 
 try:
@@ -29,14 +38,22 @@ else:
     requests_import_error = None
 
 from ._abstract import HEADERS, AbstractScraper
+from ._decoding import read_html
 from ._exceptions import (
     ElementNotFoundInHtml,
     FieldNotProvidedByWebsiteException,
     NoSchemaFoundInWildMode,
     RecipeSchemaNotFound,
+    ScrapeLimitExceeded,
     StaticValueException,
     WebsiteNotImplementedError,
 )
+from ._export import (
+    ParquetRecipeWriter,
+    RecipeBatchBuilder,
+    export_parquet,
+    recipe_schema,
+)
 from ._factory import SchemaScraperFactory
 from ._utils import get_host_name
 from .aberlehome import AberleHome
@@ -799,12 +816,13 @@ def scraper_exists_for(url_path: str) -> bool:
 
 
 def scrape_html(
-    html: str | None,
+    html: str | bytes | mmap.mmap | os.PathLike | None,
     org_url: str,
     *,
     online: bool = False,
     supported_only: bool | None = None,
     wild_mode: bool | None = None,
+    encoding: str | None = None,
 ) -> AbstractScraper:
     """
     Accepts optional HTML and a required URL as input, and returns a scraper object.
@@ -818,18 +836,23 @@ def scrape_html(
     to retrieve generic schema.org recipe metadata from the HTML.
 
     Args:
-        html (str | None): HTML of the recipe webpage.
+        html (str | bytes | mmap.mmap | os.PathLike | None): HTML of the recipe webpage,
+            as text, as bytes or an mmap, or as the path of a file holding it, possibly
+            gzip or zstd compressed.
         org_url (str): URL of the recipe.
 
     Kwargs:
         online (bool): whether the library may download HTML.
         supported_only (bool | None): whether to restrict to supported domains.
         wild_mode (bool | None): deprecated: whether to attempt scraping unsupported domains.
+        encoding (str | None): charset of bytes or file HTML given by the HTTP headers;
+            otherwise it is determined from the HTML itself.
 
     Raises:
         ElementNotFoundInHtml: Retrieval of data failed because an HTML element was not found.
         FieldNotProvidedByWebsiteException: This website doesn't seem to provide the requested field.
         NoSchemaFoundInWildMode: When no schema is found for an unsupported domain.
+        ScrapeLimitExceeded: The HTML is larger than settings.MAX_HTML_BYTES.
         StaticValueException: Wraps a static/constant value that was not retrieved dynamically.
         WebsiteNotImplementedError: When the recipe URL does not match any supported domains.
 
@@ -877,6 +900,9 @@ def scrape_html(
         )
         raise ValueError(msg)
 
+    if html is not None:
+        html = read_html(html, encoding)
+
     host_name = get_host_name(org_url)
     if host_name in SCRAPERS:
         return SCRAPERS[host_name](html=html, url=org_url)
@@ -895,3 +921,45 @@ def scrape_html(
         return schema_scraper
 
     raise NoSchemaFoundInWildMode(org_url)
+
+
+def scrape_all(
+    html: str | bytes | mmap.mmap | os.PathLike,
+    org_url: str,
+    *,
+    supported_only: bool | None = None,
+    encoding: str | None = None,
+) -> list[AbstractScraper]:
+    """
+    Accepts HTML and its URL as input, and returns a scraper object for each of
+    the recipes of the webpage, such as those of a roundup or collection page.
+
+    The first scraper is the one scrape_html() would return, if any; it is
+    followed by a schema.org scraper for each of the other Recipe entities of
+    the page, be they JSON-LD or microdata, standalone or the elements of an
+    ItemList. The page is parsed, and its schema.org data extracted, once for
+    all of them.
+
+    Args:
+        html (str | bytes | mmap.mmap | os.PathLike): HTML of the webpage, as for scrape_html().
+        org_url (str): URL of the webpage.
+
+    Kwargs:
+        supported_only (bool | None): whether to restrict to supported domains.
+        encoding (str | None): charset of bytes or file HTML given by the HTTP headers.
+
+    Raises:
+        ScrapeLimitExceeded: The HTML is larger than settings.MAX_HTML_BYTES.
+        WebsiteNotImplementedError: When the URL does not match any supported domains.
+
+    Returns:
+        list[AbstractScraper]: a scraper instance for each recipe found, possibly none.
+    """
+    html = read_html(html, encoding)
+    if get_host_name(org_url) in SCRAPERS or supported_only in (None, True):
+        page_scraper = scrape_html(html, org_url, supported_only=supported_only)
+        scrapers = [page_scraper]
+    else:
+        page_scraper = SchemaScraperFactory.generate(html=html, url=org_url)
+        scrapers = [page_scraper] if page_scraper.schema.data else []
+    return scrapers + SchemaScraperFactory.generate_all(page_scraper)
@@ -1,17 +1,29 @@
+import functools
 import inspect
+import re
 from collections import OrderedDict
-from typing import List
+from types import FunctionType, MethodType
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from recipe_scrapers.__version__ import __version__
 from recipe_scrapers.settings import settings
 
-from ._exceptions import ElementNotFoundInHtml
+from ._app_state import AppState
+from ._dom import DOMIndex, RegionStrainer, SelectorCache
+from ._exceptions import ElementNotFoundInHtml, ScrapeLimitExceeded
 from ._grouping_utils import IngredientGroup, group_ingredients_by_starting_char
+from ._json import dumps_bytes
+from ._limits import ScrapeLimits
+from ._metadata import PageMetadata
 from ._opengraph import OpenGraph
+from ._recipe import Recipe
 from ._schemaorg import SchemaOrg
+from ._wprm import WPRMRecipe
+
+HEAD_END_REGEX = re.compile(r"</head\s*>", re.IGNORECASE)
 
 # Some sites close their content for 'bots', so user-agent must be supplied
 HEADERS = {
@@ -19,25 +31,163 @@ HEADERS = {
 }
 
 
+def parse_metadata(html, limits):
+    """The <meta> and <link> elements and the <html> attributes of html, parsed."""
+    strainer = RegionStrainer(())
+    soup = BeautifulSoup(
+        html, "html.parser", parse_only=strainer, **limits.soup_options()
+    )
+    strainer.add_html_element(soup)
+    return soup
+
+
 class AbstractScraper:
     page_data: str
+    # CSS selectors compiled once per scraper class, see select()
+    selectors = SelectorCache()
+    # The regions of the page the scraper reads, as simple selectors such as
+    # "div.recipe-card" or "#recipe"; when set, only these regions and the
+    # page metadata are parsed into self.region_soup, which select(), dom and
+    # wprm read, see RegionStrainer. The whole page is parsed when a region is
+    # missing from it. Scrapers reading only the schema and the page metadata
+    # set it to (), see metadata. self.soup is the whole page either way.
+    parse_regions: Optional[Tuple[str, ...]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.selectors = SelectorCache()
 
     def __init__(self, html: str, url: str):
+        # the limits of settings.MAX_HTML_BYTES and the like, see ScrapeLimits
+        self.limits = ScrapeLimits()
+        self.limits.check_html(html)
         self.page_data = html
         self.url = url
-        self.soup = BeautifulSoup(self.page_data, "html.parser")
-        self.opengraph = OpenGraph(self.soup)
-        self.schema = SchemaOrg(self.page_data)
+        self.app_state = AppState(self.page_data)
 
         # attach the plugins as instructed in settings.PLUGINS
         if not hasattr(self.__class__, "plugins_initialized"):
-            for name, _ in inspect.getmembers(self, inspect.ismethod):
-                current_method = getattr(self.__class__, name)
-                for plugin in reversed(settings.PLUGINS):
-                    if plugin.should_run(self.host(), name):
-                        current_method = plugin.run(current_method)
-                setattr(self.__class__, name, current_method)
-            setattr(self.__class__, "plugins_initialized", True)
+            self._attach_plugins()
+
+    # The page tree, the schema and the helpers built on them are created on
+    # first use, so that scrapers reading only self.app_state never parse it
+
+    @functools.cached_property
+    def soup(self):
+        return BeautifulSoup(
+            self.page_data, "html.parser", **self.limits.soup_options()
+        )
+
+    @functools.cached_property
+    def region_soup(self):
+        if self.parse_regions is None:
+            return self.soup
+        strainer = RegionStrainer(self.parse_regions)
+        soup = BeautifulSoup(
+            self.page_data,
+            "html.parser",
+            parse_only=strainer,
+            **self.limits.soup_options(),
+        )
+        if not strainer.found_regions(soup):
+            return self.soup
+        strainer.add_html_element(soup)
+        return soup
+
+    @functools.cached_property
+    def dom(self):
+        return DOMIndex(self.region_soup)
+
+    @functools.cached_property
+    def metadata(self):
+        if self.parse_regions == () and "soup" not in self.__dict__:
+            # scrapers that read nothing but the metadata from the page parse
+            # its <head>, and the rest of it only for lookups that miss there
+            page_data = self.page_data
+            limits = self.limits
+            head_end = HEAD_END_REGEX.search(page_data)
+            if head_end is not None:
+                return PageMetadata(
+                    parse_metadata(page_data[: head_end.start()], limits),
+                    page_html=page_data,
+                    position=head_end.start(),
+                    fallback=lambda: PageMetadata(parse_metadata(page_data, limits)),
+                )
+        if "soup" in self.__dict__:
+            return PageMetadata(self.soup)
+        return PageMetadata(self.region_soup)
+
+    @functools.cached_property
+    def opengraph(self):
+        return OpenGraph(self.metadata.soup, self.metadata)
+
+    @functools.cached_property
+    def schema(self):
+        return SchemaOrg(self.page_data)
+
+    @functools.cached_property
+    def wprm(self):
+        return WPRMRecipe(self.region_soup)
+
+    def _is_method(self, name):
+        # attributes are looked up statically, which leaves the properties
+        # above untouched; these are the attributes that bind as methods
+        attribute = inspect.getattr_static(self, name)
+        return isinstance(attribute, (FunctionType, MethodType, classmethod))
+
+    def _attach_plugins(self):
+        for name in dir(self):
+            if not self._is_method(name):
+                continue
+            current_method = getattr(self.__class__, name)
+            for plugin in reversed(settings.PLUGINS):
+                if plugin.should_run(self.host(), name):
+                    current_method = plugin.run(current_method)
+            setattr(self.__class__, name, current_method)
+        setattr(self.__class__, "plugins_initialized", True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the parsed HTML tree, the page HTML and the schema data.
+
+        Results already retrieved from the scraper remain valid, but methods
+        that need the page should not be called after closing the scraper.
+        """
+        # decompose() breaks the parent/sibling reference cycles of the tree
+        # so that it can be freed without waiting for the garbage collector;
+        # it has to be applied to the top-level elements, since the document
+        # object itself is not linked to its descendants
+        trees = [
+            self.__dict__[tree]
+            for tree in ("region_soup", "soup")
+            if tree in self.__dict__
+        ]
+        if "metadata" in self.__dict__:
+            # such as the tree of the <head> of the page, see metadata
+            trees.extend(self.metadata.trees())
+        for soup in {id(soup): soup for soup in trees}.values():
+            for element in soup.find_all(recursive=False):
+                element.decompose()
+            soup.decompose()
+        for helper in ("dom", "wprm"):
+            if helper in self.__dict__:
+                self.__dict__[helper].clear()
+        if "metadata" in self.__dict__:
+            self.metadata.release()
+        self.__dict__.pop("opengraph", None)
+        self.page_data = ""
+        self.app_state = AppState(self.page_data)
+        if "schema" in self.__dict__:
+            self.schema.data = {}
+            self.schema.people = {}
+            self.schema.ratingsdata = {}
+            self.schema.clear_recipes()
 
     def author(self):
         """Author of the recipe."""
@@ -45,7 +195,7 @@ class AbstractScraper:
 
     def canonical_url(self):
         """Canonical or original URL of the recipe."""
-        canonical_link = self.soup.find("link", {"rel": "canonical", "href": True})
+        canonical_link = self.metadata.link("canonical", href=True)
         if canonical_link:
             return urljoin(self.url, canonical_link["href"])
         return self.url
@@ -62,18 +212,14 @@ class AbstractScraper:
     def language(self):
         """Language the recipe is written in."""
         candidate_languages = OrderedDict()
-        html = self.soup.find("html", {"lang": True})
+        html = self.metadata.html_lang()
         if html:
             candidate_languages[html.get("lang")] = True
 
         # Deprecated: check for a meta http-equiv header
         # See: https://www.w3.org/International/questions/qa-http-and-lang
-        meta_language = self.soup.find(
-            "meta",
-            {
-                "http-equiv": lambda x: x and x.lower() == "content-language",
-                "content": True,
-            },
+        meta_language = self.metadata.meta(
+            "http-equiv", "content-language", content=True
         )
         if meta_language:
             language = meta_language.get("content").split(",", 1)[0]
@@ -178,28 +324,108 @@ class AbstractScraper:
         """Keywords or tags used to describe the recipe"""
         raise NotImplementedError("This should be implemented.")
 
+    def select(self, selector):
+        """
+        Elements matching the CSS selector, like self.region_soup.select(selector).
+        """
+        return self.selectors[selector].select(self.region_soup)
+
+    def select_one(self, selector):
+        """The first element matching the CSS selector, or None."""
+        return self.selectors[selector].select_one(self.region_soup)
+
     def links(self):
         """Links found in the recipe."""
         invalid_href = {"#", ""}
-        links_html = self.soup.findAll("a", href=True)
-
-        return [link.attrs for link in links_html if link["href"] not in invalid_href]
+        if self.parse_regions is None:
+            anchors = self.dom.find_all("a")
+        else:
+            # the links of the whole page, not only those of the regions
+            anchors = BeautifulSoup(
+                self.page_data,
+                "html.parser",
+                parse_only=SoupStrainer("a"),
+                **self.limits.soup_options(),
+            ).find_all("a")
+        return [
+            link.attrs
+            for link in anchors
+            if link.get("href") is not None and link["href"] not in invalid_href
+        ]
 
     def to_json(self):
-        """Recipe information in JSON format."""
+        """
+        Recipe information in JSON format.
+
+        Raises ScrapeLimitExceeded once every field has been tried if a limit
+        was exceeded, with the fields retrieved as its partial_results.
+        """
         json_dict = {}
+        exceeded = None
         public_method_names = [
             method
             for method in dir(self)
-            if callable(getattr(self, method))
-            if not method.startswith("_") and method not in ["soup", "links", "to_json"]
+            if self._is_method(method)
+            if not method.startswith("_")
+            and method
+            not in [
+                "soup",
+                "links",
+                "to_json",
+                "to_json_bytes",
+                "to_recipe",
+                "close",
+                "select",
+                "select_one",
+            ]
         ]
         for method in public_method_names:
             try:
                 if method == "ingredient_groups":
-                    json_dict[method] = [i.__dict__ for i in getattr(self, method)()]
+                    json_dict[method] = [
+                        {"ingredients": i.ingredients, "purpose": i.purpose}
+                        for i in getattr(self, method)()
+                    ]
                 else:
                     json_dict[method] = getattr(self, method)()
+            except ScrapeLimitExceeded as e:
+                exceeded = exceeded or e
             except Exception:
                 pass
+        if exceeded is not None:
+            exceeded.partial_results = json_dict
+            raise exceeded
         return json_dict
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Recipe information in JSON format, as UTF-8 encoded bytes.
+
+        The results of to_json() are encoded at once, with orjson when it is
+        installed, rather than through a str. NaN and infinite floats are
+        encoded as null, see _json.dumps_bytes(). Raises ScrapeLimitExceeded
+        as to_json() does.
+        """
+        return dumps_bytes(self.to_json())
+
+    def to_recipe(self) -> Recipe:
+        """
+        Recipe information as a compact Recipe object.
+
+        Raises ScrapeLimitExceeded once every field has been tried if a limit
+        was exceeded, with the Recipe of the fields retrieved as its
+        partial_results.
+        """
+        fields = {}
+        exceeded = None
+        for name in Recipe.__slots__:
+            try:
+                fields[name] = getattr(self, name)()
+            except ScrapeLimitExceeded as e:
+                exceeded = exceeded or e
+            except Exception:
+                pass
+        if exceeded is not None:
+            exceeded.partial_results = Recipe(**fields)
+            raise exceeded
+        return Recipe(**fields)
@@ -0,0 +1,140 @@
+import re
+
+from ._json import loads, loads_prefix
+
+# Comments, and the start of <script> tags
+SCRIPT_OR_COMMENT_REGEX = re.compile(r"<!--|<script\b", re.IGNORECASE)
+COMMENT_END = "-->"
+SCRIPT_END_REGEX = re.compile(r"</script", re.IGNORECASE)
+# The extent of a start tag, as html.parser delimits it
+START_TAG_REGEX = re.compile(
+    r"""
+  <[a-zA-Z][^\t\n\r\f />\x00]*       # tag name
+  (?:[\s/]*                          # optional whitespace before attribute name
+    (?:(?<=['"\s/])[^\s/>][^\s/=>]*  # attribute name
+      (?:\s*=+\s*                    # value indicator
+        (?:'[^']*'                   # LITA-enclosed value
+          |"[^"]*"                   # LIT-enclosed value
+          |(?!['"])[^>\s]*           # bare value
+         )
+        \s*                          # possibly followed by a space
+       )?(?:\s|/(?!>))*
+     )*
+   )?
+  \s*                                # trailing whitespace
+""",
+    re.VERBOSE,
+)
+ID_ATTRIBUTE_REGEX = re.compile(
+    r"""(?<=['"\s/])id\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""",
+    re.IGNORECASE,
+)
+
+
+class AppState:
+    """
+    The JSON state that JavaScript frameworks embed in a page, such as the
+    __NEXT_DATA__ script of Next.js, read directly from the page HTML.
+
+    Payloads are located with a single scan of the HTML, without building a
+    tree, and are decoded once.
+    """
+
+    def __init__(self, page_data):
+        self.page_data = page_data
+        self._scripts = None
+        # the (start, end) of the contents of every <script> element
+        self._spans = None
+        self._decoded = {}
+
+    def _scan_scripts(self):
+        scripts = {}
+        spans = []
+        position = 0
+        while True:
+            found = SCRIPT_OR_COMMENT_REGEX.search(self.page_data, position)
+            if found is None:
+                break
+            if found.group() == "<!--":
+                # scripts inside comments are not part of the page
+                comment_end = self.page_data.find(COMMENT_END, found.end())
+                if comment_end == -1:
+                    break
+                position = comment_end + len(COMMENT_END)
+                continue
+
+            tag_end = START_TAG_REGEX.match(self.page_data, found.start()).end()
+            if self.page_data[tag_end : tag_end + 1] != ">":
+                position = found.end()
+                continue
+            end = SCRIPT_END_REGEX.search(self.page_data, tag_end + 1)
+            content_end = end.start() if end else len(self.page_data)
+            spans.append((tag_end + 1, content_end))
+
+            # like html.parser, the last of repeated attributes wins
+            id_attribute = None
+            for id_attribute in ID_ATTRIBUTE_REGEX.finditer(
+                self.page_data, found.end(), tag_end
+            ):
+                pass
+            if id_attribute:
+                script_id = next(
+                    value for value in id_attribute.groups() if value is not None
+                )
+                # the first script with a given id wins, as with soup.find()
+                scripts.setdefault(script_id, (tag_end + 1, content_end))
+            position = content_end
+        self._scripts = scripts
+        self._spans = spans
+
+    def script(self, script_id):
+        """The raw contents of the <script> element with the given id, or None."""
+        if self._scripts is None:
+            self._scan_scripts()
+        span = self._scripts.get(script_id)
+        if span is None:
+            return None
+        start, end = span
+        return self.page_data[start:end]
+
+    def script_json(self, script_id):
+        """The decoded JSON contents of the <script> element with the given id, or None."""
+        key = ("script", script_id)
+        if key not in self._decoded:
+            contents = self.script(script_id)
+            self._decoded[key] = None if contents is None else loads(contents)
+        return self._decoded[key]
+
+    def next_data(self):
+        """The page state of a Next.js site, or None."""
+        return self.script_json("__NEXT_DATA__")
+
+    def nuxt_data(self):
+        """The page state of a Nuxt 3 site, or None."""
+        return self.script_json("__NUXT_DATA__")
+
+    def window_global(self, name):
+        """
+        The JSON value assigned to window.<name> by an inline script, e.g.
+        window.__INITIAL_STATE__ = {...}, or None.
+
+        Only the contents of <script> elements are searched, not comments or
+        the text of the page. Values that are JavaScript rather than JSON raise
+        a ValueError.
+        """
+        key = ("window", name)
+        if key not in self._decoded:
+            if self._spans is None:
+                self._scan_scripts()
+            assignment_regex = re.compile(
+                rf"""window(?:\.{re.escape(name)}|\[["']{re.escape(name)}["']\])"""
+                r"\s*=(?!=)"
+            )
+            value = None
+            for start, end in self._spans:
+                assignment = assignment_regex.search(self.page_data, start, end)
+                if assignment:
+                    value = loads_prefix(self.page_data[assignment.end() : end])
+                    break
+            self._decoded[key] = value
+        return self._decoded[key]
@@ -0,0 +1,126 @@
+import codecs
+import gzip
+import mmap
+import os
+import re
+
+try:
+    # zstandard is an optional dependency, used to read zstd-compressed pages
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+)
+
+# Browsers look for a <meta charset> declaration in the first 1024 bytes
+PRESCAN_LENGTH = 1024
+META_CHARSET_REGEX = re.compile(
+    rb"""<meta\b[^>]*?charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE
+)
+
+
+def read_html(source, encoding=None):
+    """
+    The HTML of source as a str.
+
+    source is either the HTML itself, as a str or as a bytes-like object such
+    as bytes or an mmap, or a path-like object naming a file holding it.
+    Files are mapped into memory rather than read, and gzip or zstd
+    compressed contents are decompressed.
+
+    encoding is the charset of the bytes given by HTTP headers, if any; see
+    sniff_charset().
+    """
+    if isinstance(source, str):
+        return source
+    if isinstance(source, os.PathLike):
+        return _read_file(source, encoding)
+    return decode_html(source, encoding)
+
+
+def _read_file(path, encoding):
+    with open(path, "rb") as f:
+        magic = f.read(len(ZSTD_MAGIC))
+        if magic.startswith(GZIP_MAGIC) or magic == ZSTD_MAGIC:
+            # the compressed contents are read, and decompressed at once
+            f.seek(0)
+            return decode_html(f.read(), encoding)
+        if not magic:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_html(mapped, encoding)
+
+
+def decode_html(data, encoding=None):
+    """
+    The HTML of the bytes-like object data, decompressed if it is gzip or zstd
+    compressed, and decoded with the charset sniff_charset() finds.
+
+    Bytes invalid in the charset are replaced with U+FFFD, and line breaks
+    are normalized to line feeds.
+    """
+    with memoryview(data) as view:
+        if view[: len(GZIP_MAGIC)] == GZIP_MAGIC:
+            return decode_html(gzip.decompress(view), encoding)
+        if view[: len(ZSTD_MAGIC)] == ZSTD_MAGIC:
+            if zstandard is None:
+                raise ImportError(
+                    "Unable to import the 'zstandard' library to decompress the "
+                    "zstd-compressed HTML.\n"
+                    "Did you install using 'pip install recipe-scrapers[zstd]'?"
+                )
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            return decode_html(decompressor.decompress(view), encoding)
+
+        charset, bom_length = sniff_charset(bytes(view[:PRESCAN_LENGTH]), encoding)
+        # decoding straight from the buffer avoids copying it first
+        with view[bom_length:] as body:
+            html = str(body, charset, "replace")
+    # as browsers do, carriage returns are normalized to line feeds
+    if "\r" in html:
+        html = html.replace("\r\n", "\n").replace("\r", "\n")
+    return html
+
+
+def sniff_charset(head, encoding=None):
+    """
+    The charset of a page starting with the bytes head, as browsers determine
+    it, and the length of its byte order mark.
+
+    A byte order mark comes first, then the encoding given by HTTP headers,
+    then a <meta charset> or <meta http-equiv="Content-Type"> declaration in
+    the first 1024 bytes. Pages declaring none of these are taken as UTF-8.
+    """
+    for bom, charset in BOMS:
+        if head.startswith(bom):
+            return charset, len(bom)
+
+    charset = _charset_name(encoding) if encoding else None
+    if charset is None:
+        declared = META_CHARSET_REGEX.search(head, 0, PRESCAN_LENGTH)
+        if declared is not None:
+            charset = _charset_name(declared.group(1).decode("ascii"))
+            # a page that could declare itself as UTF-16 is not UTF-16
+            if charset is not None and charset.startswith("utf-16"):
+                charset = "utf-8"
+    return charset or "utf-8", 0
+
+
+def _charset_name(label):
+    try:
+        name = codecs.lookup(label.strip()).name
+        # codecs such as base64 are not text encodings
+        "".encode(name)
+    except LookupError:
+        return None
+    # browsers decode pages labelled ASCII or Latin-1 as windows-1252
+    if name in ("ascii", "iso8859-1"):
+        return "cp1252"
+    return name
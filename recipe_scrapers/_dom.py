@@ -0,0 +1,232 @@
+import re
+from collections import defaultdict
+
+import soupsieve
+from bs4 import SoupStrainer
+
+# Compound selectors the index can answer: an optional tag name followed by
+# any number of .class and #id parts, e.g. "li.wprm-recipe-ingredient"
+SIMPLE_SELECTOR_REGEX = re.compile(
+    r"(?P<name>[a-zA-Z][\w-]*)?(?P<parts>(?:[.#][\w-]+)*)"
+)
+SELECTOR_PART_REGEX = re.compile(r"([.#])([\w-]+)")
+
+
+class DOMIndex:
+    """
+    Index of the elements of a page by tag name, class, id and data-*
+    attribute, in document order.
+
+    The index is built with a single pass over the document on first use.
+    Its find(), find_all(), select_one() and select() answer the simple
+    queries scrapers make most often, and fall back to the soup otherwise.
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.clear()
+
+    def clear(self):
+        """Drop the index; it is rebuilt on the next lookup."""
+        self._by_name = None
+        self._by_class = None
+        self._by_id = None
+        self._by_data = None
+
+    def _build(self):
+        by_name = defaultdict(list)
+        by_class = defaultdict(list)
+        by_id = defaultdict(list)
+        by_data = defaultdict(list)
+
+        for element in self.soup.descendants:
+            name = element.name
+            if name is None:
+                continue
+            by_name[name].append(element)
+            for attribute, value in element.attrs.items():
+                if attribute == "class":
+                    values = value if isinstance(value, list) else [value]
+                    # dict.fromkeys drops repeated classes, e.g. class="a a"
+                    for class_name in dict.fromkeys(values):
+                        by_class[class_name].append(element)
+                elif attribute == "id":
+                    by_id[value].append(element)
+                elif attribute.startswith("data-"):
+                    by_data[attribute].append(element)
+
+        self._by_name = by_name
+        self._by_class = by_class
+        self._by_id = by_id
+        self._by_data = by_data
+
+    def find_all(self, name=None, class_=None, id=None, data=None):
+        """
+        Elements with the given tag name, class, id and data-* attributes,
+        like soup.find_all(name, class_=class_, id=id, attrs=data).
+
+        data maps attribute names to a value, or to True for any value.
+        """
+        if class_ is not None and " " in class_:
+            # a class string with spaces matches the whole attribute value
+            attrs = dict(data or {})
+            if id is not None:
+                attrs["id"] = id
+            return self.soup.find_all(name, attrs, class_=class_)
+        if self._by_name is None:
+            self._build()
+
+        candidates = []
+        if name is not None:
+            candidates.append(self._by_name.get(name, []))
+        if class_ is not None:
+            candidates.append(self._by_class.get(class_, []))
+        if id is not None:
+            candidates.append(self._by_id.get(id, []))
+        for attribute in data or {}:
+            candidates.append(self._by_data.get(attribute, []))
+        if not candidates:
+            raise ValueError("DOMIndex lookups need at least one criterion.")
+
+        elements = min(candidates, key=len)
+        if len(candidates) == 1 and not data:
+            return list(elements)
+        return [
+            element
+            for element in elements
+            if (name is None or element.name == name)
+            and (class_ is None or class_ in _classes(element))
+            and (id is None or element.get("id") == id)
+            and all(
+                (
+                    element.get(attribute) is not None
+                    if value is True
+                    else element.get(attribute) == value
+                )
+                for attribute, value in (data or {}).items()
+            )
+        ]
+
+    def find(self, name=None, class_=None, id=None, data=None):
+        """The first element find_all() would return, or None."""
+        elements = self.find_all(name, class_=class_, id=id, data=data)
+        return elements[0] if elements else None
+
+    def select(self, selector):
+        """Like soup.select(selector), answered from the index for simple selectors."""
+        match = SIMPLE_SELECTOR_REGEX.fullmatch(selector.strip())
+        if match is None or not selector.strip():
+            return self.soup.select(selector)
+
+        classes = []
+        ids = []
+        for prefix, value in SELECTOR_PART_REGEX.findall(match.group("parts")):
+            (classes if prefix == "." else ids).append(value)
+        if len(ids) > 1:
+            return self.soup.select(selector)
+
+        name = match.group("name")
+        elements = self.find_all(
+            name.lower() if name else None,
+            class_=classes[0] if classes else None,
+            id=ids[0] if ids else None,
+        )
+        if len(classes) > 1:
+            elements = [
+                element
+                for element in elements
+                if all(class_ in _classes(element) for class_ in classes[1:])
+            ]
+        return elements
+
+    def select_one(self, selector):
+        """Like soup.select_one(selector), answered from the index for simple selectors."""
+        elements = self.select(selector)
+        return elements[0] if elements else None
+
+
+def _classes(element):
+    value = element.get("class")
+    if value is None:
+        return ()
+    return value if isinstance(value, list) else [value]
+
+
+class SelectorCache(dict):
+    """
+    CSS selectors compiled with soupsieve, keyed by selector string.
+
+    A selector is compiled on its first lookup only, whereas soup.select()
+    parses it again whenever it has dropped out of soupsieve's own small cache.
+    """
+
+    def __missing__(self, selector):
+        compiled = self[selector] = soupsieve.compile(selector)
+        return compiled
+
+
+class RegionStrainer(SoupStrainer):
+    """
+    Restricts the parsing of a page to the regions a scraper declares, see
+    AbstractScraper.parse_regions, and to the page metadata: the <meta> and
+    <link> elements and the attributes of the <html> element.
+
+    Regions are simple selectors, a tag name followed by any number of .class
+    and #id parts, e.g. "div.recipe-card" or "#recipe". Their elements are
+    parsed with all of their descendants; nothing else is.
+    """
+
+    metadata_tags = frozenset(("meta", "link"))
+
+    def __init__(self, regions):
+        super().__init__()
+        self.regions = []
+        for region in regions:
+            match = SIMPLE_SELECTOR_REGEX.fullmatch(region.strip())
+            if match is None or not region.strip():
+                raise ValueError(f"Unsupported parse region {region!r}.")
+            classes = set()
+            ids = set()
+            for prefix, value in SELECTOR_PART_REGEX.findall(match.group("parts")):
+                (classes if prefix == "." else ids).add(value)
+            name = match.group("name")
+            self.regions.append((region, name and name.lower(), classes, ids))
+        self.html_attrs = None
+
+    def _allows(self, name, attrs):
+        if name in self.metadata_tags:
+            return True
+        if name == "html":
+            # its attributes are kept, see add_html_element()
+            if self.html_attrs is None:
+                self.html_attrs = dict(attrs or {})
+            return False
+        attrs = attrs or {}
+        value = attrs.get("class") or ""
+        classes = set(value.split() if isinstance(value, str) else value)
+        return any(
+            (region_name is None or region_name == name)
+            and region_classes <= classes
+            and all(attrs.get("id") == id for id in region_ids)
+            for _, region_name, region_classes, region_ids in self.regions
+        )
+
+    # beautifulsoup4 >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self._allows(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # beautifulsoup4 < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return self._allows(markup_name, markup_attrs)
+
+    def found_regions(self, soup):
+        """Whether every region has an element in the soup parsed with this strainer."""
+        return all(soup.select_one(region) is not None for region, *_ in self.regions)
+
+    def add_html_element(self, soup):
+        """Add an empty <html> element with the attributes of the page's."""
+        if self.html_attrs is not None:
+            soup.insert(0, soup.new_tag("html", attrs=self.html_attrs))
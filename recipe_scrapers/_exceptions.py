@@ -36,6 +36,18 @@ class ElementNotFoundInHtml(RecipeScrapersExceptions):
         super().__init__(message)
 
 
+class ScrapeLimitExceeded(RecipeScrapersExceptions):
+    """A limit on the page size or on the scraping time set in settings was exceeded."""
+
+    def __init__(self, setting, limit, partial_results=None):
+        self.setting = setting
+        self.limit = limit
+        # what to_json() or to_recipe() gathered before giving up, if raised by them
+        self.partial_results = partial_results
+        message = f"The {setting} limit of {limit} was exceeded."
+        super().__init__(message)
+
+
 class FillPluginException(RecipeScrapersExceptions):
     """Inability to locate an element on a page by using a fill plugin"""
 
@@ -0,0 +1,281 @@
+from ._exceptions import ScrapeLimitExceeded
+from ._recipe import Recipe
+from ._utils import get_abstract_methods
+
+DEFAULT_BATCH_SIZE = 1024
+
+# The properties of https://schema.org/NutritionInformation, which nutrients()
+# returns for most websites; other nutrients are kept in an "other" map
+NUTRIENTS = (
+    "calories",
+    "carbohydrateContent",
+    "cholesterolContent",
+    "fatContent",
+    "fiberContent",
+    "proteinContent",
+    "saturatedFatContent",
+    "servingSize",
+    "sodiumContent",
+    "sugarContent",
+    "transFatContent",
+    "unsaturatedFatContent",
+)
+
+# The column kind of each scraper method; the others are string columns.
+# Times are floats, as some scrapers return fractions of minutes
+FIELD_KINDS = {
+    "ingredients": "strings",
+    "instructions_list": "strings",
+    "equipment": "strings",
+    "dietary_restrictions": "strings",
+    "keywords": "strings",
+    "total_time": "float",
+    "cook_time": "float",
+    "prep_time": "float",
+    "ratings": "float",
+    "ratings_count": "int",
+    "ingredient_groups": "ingredient_groups",
+    "nutrients": "nutrients",
+    "reviews": "reviews",
+}
+
+
+def _require_pyarrow():
+    # pyarrow is an optional dependency, used to export results as Arrow record
+    # batches and Parquet files; it is imported on first use, so that importing
+    # the library does not load it
+    try:
+        import pyarrow  # type: ignore[import-not-found]
+        import pyarrow.parquet  # type: ignore[import-not-found]
+    except ImportError:
+        raise ImportError(
+            "Unable to import the 'pyarrow' library to export recipes.\n"
+            "Did you install using 'pip install recipe-scrapers[arrow]'?"
+        ) from None
+    return pyarrow
+
+
+def _arrow_type(pyarrow, kind):
+    if kind == "strings":
+        return pyarrow.list_(pyarrow.string())
+    if kind == "float":
+        return pyarrow.float64()
+    if kind == "int":
+        return pyarrow.int64()
+    if kind == "ingredient_groups":
+        return pyarrow.list_(
+            pyarrow.struct(
+                [
+                    ("ingredients", pyarrow.list_(pyarrow.string())),
+                    ("purpose", pyarrow.string()),
+                ]
+            )
+        )
+    if kind == "nutrients":
+        return pyarrow.struct(
+            [(name, pyarrow.string()) for name in NUTRIENTS]
+            + [("other", pyarrow.map_(pyarrow.string(), pyarrow.string()))]
+        )
+    if kind == "reviews":
+        return pyarrow.list_(pyarrow.map_(pyarrow.string(), pyarrow.string()))
+    return pyarrow.string()
+
+
+def recipe_schema():
+    """
+    The Arrow schema of exported recipes: a nullable column for each of the
+    methods of get_abstract_methods(), in that order.
+    """
+    pyarrow = _require_pyarrow()
+    return pyarrow.schema(
+        [
+            (name, _arrow_type(pyarrow, FIELD_KINDS.get(name, "string")))
+            for name in get_abstract_methods()
+        ]
+    )
+
+
+def _string(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        # as SchemaOrg.category() joins the categories of a recipe
+        return ",".join(str(item) for item in value)
+    return str(value)
+
+
+def _strings(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [value] if value else []
+    return [_string(item) for item in value]
+
+
+def _float(value):
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value):
+    number = _float(value)
+    if number is None or not number.is_integer():
+        return None
+    return int(number)
+
+
+def _ingredient_groups(value):
+    if value is None:
+        return None
+    return [
+        {
+            "ingredients": _strings(group.get("ingredients")),
+            "purpose": _string(group.get("purpose")),
+        }
+        for group in value
+    ]
+
+
+def _nutrients(value):
+    if not isinstance(value, dict):
+        return None
+    nutrients = {name: _string(value.get(name)) for name in NUTRIENTS}
+    nutrients["other"] = [
+        (name, _string(amount))
+        for name, amount in value.items()
+        if name not in NUTRIENTS
+    ]
+    return nutrients
+
+
+def _reviews(value):
+    if value is None:
+        return None
+    return [
+        [(str(key), _string(item)) for key, item in review.items()] for review in value
+    ]
+
+
+CONVERTERS = {
+    "string": _string,
+    "strings": _strings,
+    "float": _float,
+    "int": _int,
+    "ingredient_groups": _ingredient_groups,
+    "nutrients": _nutrients,
+    "reviews": _reviews,
+}
+
+
+class RecipeBatchBuilder:
+    """
+    Accumulates the results of scrapers into Arrow record batches of the
+    schema of recipe_schema().
+
+    Results are appended column by column, and converted to Arrow arrays a
+    batch at a time; values that do not fit the type of their column are
+    converted to it where possible, and are left null otherwise.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.schema = recipe_schema()
+        self.batch_size = batch_size
+        self._converters = [
+            (name, CONVERTERS[FIELD_KINDS.get(name, "string")])
+            for name in self.schema.names
+        ]
+        self._columns = {name: [] for name in self.schema.names}
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def append(self, results):
+        """
+        Append the results of a scraper, given as the scraper itself, as the
+        dict of its to_json(), or as the Recipe of its to_recipe().
+
+        Scrapers that exceed a limit of settings contribute the results they
+        retrieved. Returns the completed record batch once batch_size results
+        have been appended, and None otherwise.
+        """
+        if isinstance(results, Recipe):
+            results = results.to_dict()
+        elif not isinstance(results, dict):
+            try:
+                results = results.to_json()
+            except ScrapeLimitExceeded as e:
+                results = e.partial_results or {}
+
+        for name, converter in self._converters:
+            self._columns[name].append(converter(results.get(name)))
+        self._length += 1
+        if self._length >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self):
+        """The record batch of the results appended since the last one, or None."""
+        if not self._length:
+            return None
+        pyarrow = _require_pyarrow()
+        batch = pyarrow.RecordBatch.from_pydict(self._columns, schema=self.schema)
+        for column in self._columns.values():
+            column.clear()
+        self._length = 0
+        return batch
+
+
+class ParquetRecipeWriter:
+    """
+    Streams the results of scrapers to a Parquet file, a row group of at most
+    batch_size recipes at a time, so that memory use does not grow with the
+    number of recipes written.
+
+    where is a path or a writable binary file; compression is any of the
+    codecs of pyarrow.parquet.ParquetWriter.
+    """
+
+    def __init__(self, where, batch_size=DEFAULT_BATCH_SIZE, compression="zstd"):
+        pyarrow = _require_pyarrow()
+        self.builder = RecipeBatchBuilder(batch_size)
+        self.writer = pyarrow.parquet.ParquetWriter(
+            where, self.builder.schema, compression=compression
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, results):
+        """Write the results of a scraper, as for RecipeBatchBuilder.append()."""
+        batch = self.builder.append(results)
+        if batch is not None:
+            self.writer.write_batch(batch)
+
+    def close(self):
+        """Write the remaining results, and the footer of the file."""
+        batch = self.builder.flush()
+        if batch is not None:
+            self.writer.write_batch(batch)
+        self.writer.close()
+
+
+def export_parquet(scrapers, where, batch_size=DEFAULT_BATCH_SIZE, **kwargs):
+    """
+    Write the results of each of scrapers, an iterable such as the list that
+    scrape_all() returns, to the Parquet file where. Returns the number of
+    recipes written.
+    """
+    count = 0
+    with ParquetRecipeWriter(where, batch_size, **kwargs) as writer:
+        for scraper in scrapers:
+            writer.write(scraper)
+            count += 1
+    return count
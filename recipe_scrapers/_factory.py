@@ -4,6 +4,8 @@ from ._utils import get_host_name
 
 class SchemaScraperFactory:
     class SchemaScraper(AbstractScraper):
+        parse_regions = ()
+
         def host(self) -> str:  # type: ignore [override]
             return get_host_name(self.url) if self.url is not None else ""
 
@@ -46,6 +48,56 @@ class SchemaScraperFactory:
         def description(self):
             return self.schema.description()
 
+    class RecipeEntityScraper(SchemaScraper):
+        """
+        The SchemaScraper of one of the Recipe entities of a page with several,
+        reading the page as parsed by the scraper of the page.
+        """
+
+        def __init__(self, page_scraper, schema):
+            # the state AbstractScraper.__init__ builds from the page is that
+            # of page_scraper, rather than built and checked again
+            self.page_scraper = page_scraper
+            self.page_data = page_scraper.page_data
+            self.url = page_scraper.url
+            self.limits = page_scraper.limits
+            self.app_state = page_scraper.app_state
+            self.schema = schema
+
+            if not hasattr(self.__class__, "plugins_initialized"):
+                self._attach_plugins()
+
+        @property
+        def soup(self):
+            return self.page_scraper.soup
+
+        @property
+        def region_soup(self):
+            return self.page_scraper.region_soup
+
+        @property
+        def dom(self):
+            return self.page_scraper.dom
+
+        @property
+        def metadata(self):
+            return self.page_scraper.metadata
+
+        @property
+        def opengraph(self):
+            return self.page_scraper.opengraph
+
     @classmethod
     def generate(cls, html, url):
         return cls.SchemaScraper(html=html, url=url)
+
+    @classmethod
+    def generate_all(cls, page_scraper):
+        """
+        A scraper for each of the Recipe entities of the page of page_scraper
+        other than the one it reads.
+        """
+        return [
+            cls.RecipeEntityScraper(page_scraper, schema)
+            for schema in page_scraper.schema.recipe_schemas()
+        ]
@@ -1,19 +1,35 @@
-import re
-from collections import defaultdict
+import functools
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Callable, Dict, FrozenSet, List, Optional, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
+from ._dom import SelectorCache
 from ._utils import normalize_string
+from ._utils_jp import get_marker, is_non_japanese_character
 
+# Heading and element selectors of the scrapers, compiled once
+GROUPING_SELECTORS = SelectorCache()
 
-@dataclass
+# Below this many (ingredient, target) pairs the pure-Python scoring is faster
+VECTORIZED_SCORING_MIN_PAIRS = 1000
+
+
+@dataclass(init=False)
 class IngredientGroup:
+    # declared explicitly, rather than with dataclass(slots=True), to keep
+    # supporting Python versions before 3.10
+    __slots__ = ("ingredients", "purpose")
+
     ingredients: List[str]
-    purpose: Optional[str] = (
-        None  # this group of ingredients is {purpose} (e.g. "For the dressing")
-    )
+    # this group of ingredients is {purpose} (e.g. "For the dressing")
+    purpose: Optional[str]
+
+    def __init__(self, ingredients: List[str], purpose: Optional[str] = None):
+        self.ingredients = ingredients
+        self.purpose = purpose
 
 
 def score_sentence_similarity(first: str, second: str) -> float:
@@ -78,6 +94,133 @@ def best_match(test_string: str, target_strings: List[str]) -> str:
     return target_strings[best_match_index]
 
 
+def _bigrams(string: str) -> set:
+    return {string[i : i + 2] for i in range(len(string) - 1)}
+
+
+class BigramIndex:
+    """Finds best matches within a fixed list of target strings.
+
+    Gives the same results as best_match, but the bigrams of the targets are
+    computed once, and an inverted index from bigram to targets restricts the
+    scoring to targets that share at least one bigram with the test string.
+    """
+
+    def __init__(self, target_strings: List[str]):
+        self.target_strings = target_strings
+        self.target_bigrams = [_bigrams(target) for target in target_strings]
+        self.targets_by_bigram: Dict[str, List[int]] = defaultdict(list)
+        # first targets that score 1: equal strings, or equal sets of bigrams
+        self.perfect_matches: Dict[Union[str, FrozenSet[str]], int] = {}
+
+        for index, (target, bigrams) in enumerate(
+            zip(target_strings, self.target_bigrams)
+        ):
+            for bigram in bigrams:
+                self.targets_by_bigram[bigram].append(index)
+            self.perfect_matches.setdefault(target, index)
+            if len(target) >= 2:
+                self.perfect_matches.setdefault(frozenset(bigrams), index)
+
+    def _perfect_match(self, test_string: str) -> Optional[int]:
+        """Index of the first target scoring 1 against test_string, if any."""
+        indices = [self.perfect_matches.get(test_string)]
+        if len(test_string) >= 2:
+            indices.append(self.perfect_matches.get(frozenset(_bigrams(test_string))))
+        return min((index for index in indices if index is not None), default=None)
+
+    def best_match(self, test_string: str) -> str:
+        """The target string with the highest score_sentence_similarity to test_string."""
+        perfect_index = self._perfect_match(test_string)
+        if perfect_index is not None:
+            return self.target_strings[perfect_index]
+
+        test_bigrams = _bigrams(test_string)
+        shared = Counter(
+            chain.from_iterable(
+                self.targets_by_bigram.get(bigram, ()) for bigram in test_bigrams
+            )
+        )
+
+        # targets that share nothing score 0; ties go to the first target
+        best_index, best_score = 0, 0.0
+        for index, count in shared.items():
+            score = 2 * count / (len(test_bigrams) + len(self.target_bigrams[index]))
+            if score > best_score or (score == best_score and index < best_index):
+                best_index, best_score = index, score
+        return self.target_strings[best_index]
+
+    def best_matches(self, test_strings: List[str]) -> List[str]:
+        """
+        best_match for every test string. When NumPy is installed, strings
+        without a perfect match are scored in one batch if there are enough.
+        """
+        perfect_indices = [self._perfect_match(test) for test in test_strings]
+        remaining = [row for row, index in enumerate(perfect_indices) if index is None]
+
+        pairs = len(remaining) * len(self.target_strings)
+        numpy = _import_numpy() if pairs >= VECTORIZED_SCORING_MIN_PAIRS else None
+        if numpy is None:
+            return [
+                (
+                    self.best_match(test_string)
+                    if index is None
+                    else self.target_strings[index]
+                )
+                for test_string, index in zip(test_strings, perfect_indices)
+            ]
+
+        vectorized_matches = iter(
+            self._vectorized_best_matches(
+                numpy, [test_strings[row] for row in remaining]
+            )
+        )
+        return [
+            next(vectorized_matches) if index is None else self.target_strings[index]
+            for index in perfect_indices
+        ]
+
+    def _vectorized_best_matches(self, numpy, test_strings: List[str]) -> List[str]:
+        # Bigrams are encoded as column ids; the shared bigram counts of every
+        # (test, target) pair are then the product of the two incidence matrices
+        bigram_ids = {bigram: i for i, bigram in enumerate(self.targets_by_bigram)}
+
+        def incidence(bigram_sets):
+            matrix = numpy.zeros((len(bigram_sets), len(bigram_ids)), numpy.float32)
+            for row, bigrams in enumerate(bigram_sets):
+                columns = [bigram_ids[b] for b in bigrams if b in bigram_ids]
+                matrix[row, columns] = 1
+            return matrix
+
+        test_bigrams = [_bigrams(test_string) for test_string in test_strings]
+        shared = incidence(test_bigrams) @ incidence(self.target_bigrams).T
+
+        test_sizes = numpy.array([len(bigrams) for bigrams in test_bigrams])
+        target_sizes = numpy.array([len(bigrams) for bigrams in self.target_bigrams])
+        sizes = test_sizes[:, None] + target_sizes[None, :]
+        # the same float64 division as score_sentence_similarity; 0 when
+        # neither string has a bigram
+        scores = numpy.divide(
+            2 * shared.astype(numpy.float64),
+            sizes,
+            out=numpy.zeros(sizes.shape),
+            where=sizes > 0,
+        )
+        # argmax returns the first maximum, so ties go to the first target
+        return [self.target_strings[index] for index in scores.argmax(axis=1)]
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy():
+    # numpy is an optional dependency, used to score large ingredient lists; it
+    # is imported by the first list large enough, rather than with the library
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 def group_ingredients(
     ingredients_list: List[str],
     soup: BeautifulSoup,
@@ -114,25 +257,50 @@ def group_ingredients(
         If the number of elements selected does not match the length of ingredients_list.
     """
 
-    found_ingredients = soup.select(group_element)
+    found_ingredients = GROUPING_SELECTORS[group_element].select(soup)
     if len(found_ingredients) != len(ingredients_list):
         raise ValueError(
             f"Found {len(found_ingredients)} grouped ingredients but was expecting to find {len(ingredients_list)}."
         )
 
+    heading_selector = GROUPING_SELECTORS[group_heading]
+    elements = GROUPING_SELECTORS[f"{group_heading}, {group_element}"].select(soup)
+    return group_ingredient_elements(ingredients_list, elements, heading_selector.match)
+
+
+def group_ingredient_elements(
+    ingredients_list: List[str],
+    elements: List[Tag],
+    is_heading: Callable[[Tag], bool],
+) -> List[IngredientGroup]:
+    """
+    Group ingredients by the headings found among the given elements.
+
+    elements are the group headings and ingredient items of the page, in
+    document order; every ingredient item is matched against ingredients_list
+    and belongs to the group of the heading before it.
+    """
     groupings: Dict[Optional[str], List[str]] = defaultdict(list)
     current_heading = None
 
-    elements = soup.select(f"{group_heading}, {group_element}")
+    ingredients_index = BigramIndex(ingredients_list)
+
+    # ingredient texts and the groups they belong to, matched in one batch
+    ingredient_texts = []
+    ingredient_groups = []
+
     for element in elements:
-        if element in element.parent.select(group_heading):
+        if is_heading(element):
             current_heading = normalize_string(element.text) or None
             if current_heading not in groupings:
                 groupings[current_heading] = []
         else:
-            ingredient_text = normalize_string(element.text)
-            matched_ingredient = best_match(ingredient_text, ingredients_list)
-            groupings[current_heading].append(matched_ingredient)
+            ingredient_texts.append(normalize_string(element.text))
+            ingredient_groups.append(groupings[current_heading])
+
+    matched_ingredients = ingredients_index.best_matches(ingredient_texts)
+    for group, matched_ingredient in zip(ingredient_groups, matched_ingredients):
+        group.append(matched_ingredient)
 
     return [
         IngredientGroup(purpose=heading, ingredients=items)
@@ -141,21 +309,6 @@ def group_ingredients(
     ]
 
 
-def get_marker(ingredient: str) -> Optional[str]:
-    """Checks if the ingredient starts with a marker like (A), (B), etc."""
-    match = re.match(r"^\([A-Za-z0-9]+\)", ingredient)
-    return match.group(0) if match else None
-
-
-def is_non_japanese_character(first_char: str) -> bool:
-    """Checks if the first character is not Kanji, Hiragana, or Katakana."""
-    return bool(
-        re.search(
-            r"^[^\u4E00-\u9FAF\u3040-\u309F\u30A0-\u30FF\uFF66-\uFF9F]", first_char
-        )
-    )
-
-
 def group_ingredients_jp(
     soup,
     ingredients_selector: str,
@@ -204,7 +357,7 @@ def group_ingredients_jp(
                 continue
 
             # Ingredient grouping by class or marker
-            ingredient = normalize_string(li.get_text())
+            ingredient = li_text
             marker_match = get_marker(ingredient)
             first_char = ingredient[0]
 
@@ -0,0 +1,114 @@
+import json
+import math
+
+try:
+    # orjson is an optional dependency, used to decode and encode JSON faster
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    # pysimdjson is an optional dependency, used to decode JSON faster when
+    # orjson is unavailable
+    import simdjson  # type: ignore[import-not-found]
+except ImportError:
+    simdjson = None  # type: ignore[assignment]
+
+# Digits are mapped to 0, so that integer literals of 19 digits or more, which
+# may not fit in 64 bits, are found by a substring search, see loads()
+DIGITS_TABLE = bytes.maketrans(b"123456789", b"000000000")
+LONG_INTEGER = b"0" * 19
+
+
+def loads(data, strict=True):
+    """
+    The value of the JSON document data, a str or bytes.
+
+    Documents are decoded with orjson or pysimdjson when either is installed,
+    and otherwise with the json module, to the same values. Documents the
+    faster library rejects are decoded with the json module too, so that they
+    raise the same errors, and so that its extensions remain supported: NaN
+    and Infinity values, and control characters in strings when strict is
+    false. So are documents with integers that may not fit in 64 bits, which
+    orjson would decode as floats.
+    """
+    if isinstance(data, str) and type(data) is not str:
+        # such as the strings of lxml and BeautifulSoup, which orjson rejects
+        data = str(data)
+    if orjson is None and simdjson is None:
+        return json.loads(data, strict=strict)
+    if not _has_long_integer(data):
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        else:
+            try:
+                return simdjson.loads(data)
+            except (ValueError, RuntimeError):
+                pass
+    return json.loads(data, strict=strict)
+
+
+def loads_prefix(data, strict=True):
+    """
+    The value of the JSON document at the start of data, a str, which may be
+    followed by something else, such as the rest of the script assigning it.
+
+    The common case of a document followed by nothing but a semicolon is
+    decoded as by loads(); otherwise the json module finds where the document
+    ends.
+    """
+    document = data.strip()
+    if document.endswith(";"):
+        document = document[:-1]
+    try:
+        return loads(document, strict=strict)
+    except ValueError:
+        pass
+    return json.JSONDecoder(strict=strict).raw_decode(data.lstrip())[0]
+
+
+def _has_long_integer(data):
+    # digits in strings and in fractions count too, and only cost the faster
+    # decoding of the document
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    return LONG_INTEGER in bytes(data).translate(DIGITS_TABLE)
+
+
+def dumps_bytes(value):
+    """
+    The compact JSON document of value, encoded as UTF-8 bytes.
+
+    Values are encoded by orjson when it is installed, and otherwise, or when
+    orjson rejects them, by the json module. Either way, NaN and infinite
+    floats, which JSON has no literal for, are encoded as null; floats in
+    exponent notation are the only values that may be spelled differently,
+    such as 1e20 by orjson and 1e+20 by the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # such as dicts with keys that are not str, or large integers
+            pass
+    try:
+        document = json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        )
+    except ValueError:
+        document = json.dumps(_finite(value), ensure_ascii=False, separators=(",", ":"))
+    return document.encode("utf-8")
+
+
+def _finite(value):
+    # value with its NaN and infinite floats replaced by None, as orjson does
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
@@ -0,0 +1,120 @@
+import contextlib
+import time
+
+from bs4.element import Tag
+
+from recipe_scrapers.settings import settings
+
+from ._exceptions import ScrapeLimitExceeded
+
+# Elements built between two checks of the clock while a page is parsed
+ELEMENTS_PER_CLOCK_CHECK = 256
+
+
+class ScrapeLimits:
+    """
+    The limits of settings.MAX_HTML_BYTES, MAX_ELEMENTS, FIELD_TIME_BUDGET and
+    SCRAPE_TIME_BUDGET, applied to the scraping of one page.
+
+    The size of the page is checked when the scraper is created, the number
+    of elements while the page is parsed: the limit is on the elements of
+    each parse, as a page may be parsed more than once, such as its <head>
+    before the rest of it. The time budgets are checked
+    before and after each scraper method call, see TimeBudgetPlugin, and
+    while the page is parsed: work done between two checks, such as a single
+    regular expression search, is not interrupted.
+    """
+
+    def __init__(self):
+        self.max_html_bytes = settings.MAX_HTML_BYTES
+        self.max_elements = settings.MAX_ELEMENTS
+        self.field_time_budget = settings.FIELD_TIME_BUDGET
+        self.scrape_time_budget = settings.SCRAPE_TIME_BUDGET
+        self.timed = (
+            self.field_time_budget is not None or self.scrape_time_budget is not None
+        )
+        # the elements built by the current parse of the page
+        self.elements = 0
+        self._elements_exceeded = False
+        self._element_class = None
+        # the (deadline, setting, limit) in force, the innermost call last
+        self._deadlines = []
+        if self.scrape_time_budget is not None:
+            self._deadlines.append(
+                (
+                    time.monotonic() + self.scrape_time_budget,
+                    "SCRAPE_TIME_BUDGET",
+                    self.scrape_time_budget,
+                )
+            )
+
+    def check_html(self, html):
+        """Raise ScrapeLimitExceeded if html is larger than MAX_HTML_BYTES in UTF-8."""
+        if self.max_html_bytes is None:
+            return
+        # a character takes one to four bytes, so most pages are told apart
+        # from their length alone
+        if len(html) > self.max_html_bytes or (
+            len(html) * 4 > self.max_html_bytes
+            and len(html.encode("utf-8", "surrogatepass")) > self.max_html_bytes
+        ):
+            raise ScrapeLimitExceeded("MAX_HTML_BYTES", self.max_html_bytes)
+
+    def check_time(self):
+        """Raise ScrapeLimitExceeded if a time budget in force is spent."""
+        if not self._deadlines:
+            return
+        now = time.monotonic()
+        for deadline, setting, limit in self._deadlines:
+            if now > deadline:
+                raise ScrapeLimitExceeded(setting, limit)
+
+    @contextlib.contextmanager
+    def field(self):
+        """Put the FIELD_TIME_BUDGET of a scraper method call in force."""
+        if self.field_time_budget is None:
+            yield
+            return
+        self._deadlines.append(
+            (
+                time.monotonic() + self.field_time_budget,
+                "FIELD_TIME_BUDGET",
+                self.field_time_budget,
+            )
+        )
+        try:
+            yield
+        finally:
+            self._deadlines.pop()
+
+    def count_element(self):
+        self.elements += 1
+        if self.max_elements is not None and self.elements > self.max_elements:
+            self._elements_exceeded = True
+            raise ScrapeLimitExceeded("MAX_ELEMENTS", self.max_elements)
+        if not self.elements % ELEMENTS_PER_CLOCK_CHECK:
+            self.check_time()
+
+    def soup_options(self):
+        """
+        The keyword arguments making BeautifulSoup() enforce the limits while
+        it parses a page, empty when no limit applies.
+        """
+        if self.max_elements is None and not self.timed:
+            return {}
+        # a page that has already gone over the limits is not parsed again
+        if self._elements_exceeded:
+            raise ScrapeLimitExceeded("MAX_ELEMENTS", self.max_elements)
+        self.check_time()
+        self.elements = 0
+
+        if self._element_class is None:
+            limits = self
+
+            class LimitedTag(Tag):
+                def __init__(self, *args, **kwargs):
+                    super().__init__(*args, **kwargs)
+                    limits.count_element()
+
+            self._element_class = LimitedTag
+        return {"element_classes": {Tag: self._element_class}}
@@ -0,0 +1,202 @@
+import re
+from collections import defaultdict
+from html.parser import HTMLParser
+
+from ._app_state import START_TAG_REGEX
+
+# The start of <html>, <meta> and <link> tags
+METADATA_TAG_REGEX = re.compile(r"<(html|meta|link)\b", re.IGNORECASE)
+
+
+class PageMetadata:
+    """
+    Index of the <html lang>, <meta> and <link> elements of a page.
+
+    The index is built with a single pass over the document on first use;
+    lookups then return the first matching element in document order, as
+    soup.find() would.
+
+    soup may hold only the start of the page, e.g. its <head>: the part of
+    page_html before position. fallback is then a callable returning the
+    PageMetadata of the whole page. It answers the lookups that find nothing
+    in soup, unless a scan of the rest of page_html shows that they find
+    nothing in the whole page either.
+    """
+
+    indexed_tags = frozenset(("html", "meta", "link"))
+    # <meta> attributes that identify the metadata item
+    meta_attributes = ("name", "property", "http-equiv")
+
+    def __init__(self, soup, page_html="", position=0, fallback=None):
+        self.soup = soup
+        self.page_html = page_html
+        self.position = position
+        self.fallback = fallback
+        self.clear()
+
+    def clear(self):
+        """Drop the index; it is rebuilt on the next lookup."""
+        self._html_lang = None
+        self._meta = None
+        self._links = None
+        self._page = None
+        self._candidates = None
+
+    def release(self):
+        """Drop the index, the parsed trees and the page HTML it reads."""
+        self.clear()
+        self.soup = None
+        self.page_html = ""
+        self.fallback = None
+
+    def trees(self):
+        """The parsed trees the index reads, the one of the whole page last."""
+        trees = [self.soup] if self.soup is not None else []
+        if self._page is not None:
+            trees.extend(self._page.trees())
+        return trees
+
+    def _whole_page(self):
+        if self._page is None:
+            self._page = self.fallback()
+        return self._page
+
+    def _may_have(self, name, attribute, value):
+        if self.fallback is None:
+            return False
+        if self._candidates is None:
+            self._candidates = StartTagScan(self.page_html, self.position)
+        return self._candidates.may_have(name, attribute, value)
+
+    def _build(self):
+        self._meta = defaultdict(list)
+        self._links = defaultdict(list)
+        # iterating over the descendants is several times faster than find_all()
+        for tag in self.soup.descendants:
+            if tag.name not in self.indexed_tags:
+                continue
+            if tag.name == "html":
+                if self._html_lang is None and tag.get("lang") is not None:
+                    self._html_lang = tag
+            elif tag.name == "meta":
+                for attribute in self.meta_attributes:
+                    value = tag.get(attribute)
+                    if value is None:
+                        continue
+                    # http-equiv names are case-insensitive
+                    if attribute == "http-equiv":
+                        value = value.lower()
+                    self._meta[(attribute, value)].append(tag)
+            else:
+                # rel is a multi-valued attribute, see soup.find semantics
+                rel = tag.get("rel")
+                if rel is None:
+                    continue
+                values = rel if isinstance(rel, list) else [rel]
+                for value in {*values, " ".join(values)}:
+                    self._links[value].append(tag)
+
+    def html_lang(self):
+        """The first <html> element with a lang attribute, or None."""
+        if self._meta is None:
+            self._build()
+        if self._html_lang is None and self._may_have("html", "lang", None):
+            return self._whole_page().html_lang()
+        return self._html_lang
+
+    def meta(self, attribute, value, content=False):
+        """
+        The first <meta> element whose attribute equals value, or None.
+
+        With content=True only elements that have a content attribute match.
+        """
+        if self._meta is None:
+            self._build()
+        for tag in self._meta.get((attribute, value), ()):
+            if not content or tag.get("content") is not None:
+                return tag
+        if self._may_have("meta", attribute, value):
+            return self._whole_page().meta(attribute, value, content)
+        return None
+
+    def link(self, rel, href=False):
+        """
+        The first <link> element with the given rel value, or None.
+
+        With href=True only elements that have an href attribute match.
+        """
+        if self._links is None:
+            self._build()
+        for tag in self._links.get(rel, ()):
+            if not href or tag.get("href") is not None:
+                return tag
+        if self._may_have("link", "rel", rel):
+            return self._whole_page().link(rel, href)
+        return None
+
+
+class StartTagScan:
+    """
+    The <html>, <meta> and <link> start tags of html from position on, found
+    by a scan of its text rather than by parsing it.
+
+    The scan also finds tags the parser would not create, such as those in
+    comments or scripts, but never misses one it would create. A lookup
+    that matches none of the tags found matches no element of the page.
+    """
+
+    def __init__(self, html, position=0):
+        self.tags = defaultdict(list)
+        # tags whose attributes could not be read
+        self.unreadable = set()
+        for found in METADATA_TAG_REGEX.finditer(html, position):
+            name = found.group(1).lower()
+            tag_end = START_TAG_REGEX.match(html, found.start()).end()
+            if html[tag_end : tag_end + 1] not in (">", "/"):
+                self.unreadable.add(name)
+                continue
+            parser = _StartTagParser()
+            parser.feed(html[found.start() : tag_end] + ">")
+            parser.close()
+            if parser.attrs is None:
+                self.unreadable.add(name)
+            else:
+                self.tags[name].append(parser.attrs)
+
+    def may_have(self, name, attribute, value):
+        """
+        Whether a <name> element may have the attribute with the value, or
+        with any value if value is None. As for PageMetadata lookups,
+        http-equiv values are case-insensitive and rel values multi-valued.
+        """
+        if name in self.unreadable:
+            return True
+        for attrs in self.tags.get(name, ()):
+            found = attrs.get(attribute)
+            if found is None:
+                continue
+            if value is None:
+                return True
+            if attribute == "http-equiv":
+                found = found.lower()
+            if attribute == "rel":
+                values = found.split()
+                if value in values or value == " ".join(values):
+                    return True
+            elif value == found:
+                return True
+        return False
+
+
+class _StartTagParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.attrs = None
+
+    def handle_starttag(self, tag, attrs):
+        # like the soup, the last of repeated attributes wins; valueless
+        # attributes have an empty value
+        self.attrs = {name: value or "" for name, value in attrs}
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
@@ -1,20 +1,22 @@
 from ._exceptions import OpenGraphException
+from ._metadata import PageMetadata
 
 
 class OpenGraph:
-    def __init__(self, soup):
+    def __init__(self, soup, metadata=None):
         self.soup = soup
+        self.metadata = metadata if metadata is not None else PageMetadata(soup)
 
     def site_name(self):
-        meta = self.soup.find("meta", {"property": "og:site_name"})
-        meta = meta or self.soup.find("meta", {"name": "og:site_name"})
+        meta = self.metadata.meta("property", "og:site_name")
+        meta = meta or self.metadata.meta("name", "og:site_name")
         if not meta:
             raise OpenGraphException("Site name not found in OpenGraph metadata.")
 
         return meta.get("content")
 
     def image(self):
-        image = self.soup.find("meta", {"property": "og:image", "content": True})
+        image = self.metadata.meta("property", "og:image", content=True)
         if not image:
             raise OpenGraphException("Image not found in OpenGraph metadata.")
 
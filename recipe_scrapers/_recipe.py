@@ -0,0 +1,81 @@
+import json
+import sys
+from typing import Any, Dict
+
+
+class Recipe:
+    """
+    Compact container for the information retrieved by a scraper.
+
+    Fields that the scraper could not retrieve are left unset: accessing them
+    raises AttributeError, and they are omitted from to_dict() and to_json().
+    """
+
+    __slots__ = (
+        "author",
+        "canonical_url",
+        "site_name",
+        "host",
+        "language",
+        "title",
+        "ingredients",
+        "ingredient_groups",
+        "instructions",
+        "instructions_list",
+        "category",
+        "yields",
+        "description",
+        "total_time",
+        "cook_time",
+        "prep_time",
+        "cuisine",
+        "cooking_method",
+        "ratings",
+        "ratings_count",
+        "equipment",
+        "reviews",
+        "nutrients",
+        "dietary_restrictions",
+        "image",
+        "keywords",
+    )
+
+    # values repeated across many recipes share a single string object
+    _interned_fields = frozenset(("host", "site_name", "language"))
+
+    def __init__(self, **fields: Any):
+        for name, value in fields.items():
+            if name in self._interned_fields and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, Recipe):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        title = getattr(self, "title", None)
+        host = getattr(self, "host", None)
+        return f"Recipe(title={title!r}, host={host!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Recipe information as a dictionary, in the same format as to_json() of scrapers."""
+        result = {}
+        for name in self.__slots__:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            if name == "ingredient_groups":
+                # a dict per group, sharing its ingredient list
+                value = [
+                    {"ingredients": group.ingredients, "purpose": group.purpose}
+                    for group in value
+                ]
+            result[name] = value
+        return result
+
+    def to_json(self) -> str:
+        """Recipe information serialized as a JSON document."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
@@ -2,6 +2,8 @@
 # find a package that parses https://schema.org/Recipe properly (or create one ourselves).
 from __future__ import annotations
 
+import copy
+import json
 from itertools import chain
 
 import extruct
@@ -9,6 +11,7 @@ import extruct
 from recipe_scrapers.settings import settings
 
 from ._exceptions import SchemaOrgException
+from ._json import loads
 from ._utils import (
     csv_to_tags,
     format_diet_name,
@@ -21,6 +24,12 @@ SCHEMA_ORG_HOST = "schema.org"
 
 SYNTAXES = ["json-ld", "microdata"]
 
+JSON_LD_XPATH = 'descendant-or-self::script[@type="application/ld+json"]'
+
+# The microdata of a page does not bear on a recipe found in JSON-LD unless it
+# has items of these types
+MICRODATA_DETAIL_TYPES = ("website", "person", "aggregaterating")
+
 
 class SchemaOrg:
     @staticmethod
@@ -43,13 +52,35 @@ class SchemaOrg:
         self.people = {}
         self.ratingsdata = {}
         self.website_name = None
-
-        data = extruct.extract(
-            page_data,
-            syntaxes=SYNTAXES,
-            errors="log" if settings.LOG_LEVEL <= 10 else "ignore",
-            uniform=True,
-        )
+        # the syntaxes extracted from the page so far; self.format is the one
+        # the recipe was found in
+        self.syntaxes = []
+        self._extracted = {}
+        # the page, while its microdata remains to be extracted
+        self._page_data = None
+
+        try:
+            document = extruct.utils.parse_html(page_data, encoding="UTF-8")
+        except Exception:
+            # extruct fails to parse it again, and reports the error
+            document = page_data
+
+        # The microdata of a page is only extracted when it may change the
+        # result; extracting it walks every item, while JSON-LD is found
+        # with a lookup of the <script> elements
+        self._extract_json_ld(document)
+        self._find_main_recipe(self._extracted)
+        if self.format is None:
+            self._extract(document, "microdata")
+            self._find_main_recipe(self._extracted)
+        elif items := document.xpath("//*[@itemscope]"):
+            itemtypes = " ".join(item.get("itemtype", "") for item in items).lower()
+            if any(schematype in itemtypes for schematype in MICRODATA_DETAIL_TYPES):
+                self._extract(document, "microdata")
+            else:
+                # it can only hold further recipes, see recipe_schemas()
+                self._page_data = page_data
+        data = self._extracted
 
         # Extract website data
         for syntax in SYNTAXES:
@@ -78,6 +109,116 @@ class SchemaOrg:
                     if rating_id:
                         self.ratingsdata[rating_id] = rating
 
+        self._main_recipe = self.data
+
+    def _extract_json_ld(self, document):
+        # the JSON-LD of the page, as extruct extracts it, decoded by the JSON
+        # backend of the library; extruct is left to handle the pages it could
+        # not parse and the scripts that are not valid JSON
+        if isinstance(document, str):
+            self._extract(document, "json-ld")
+            return
+        items = []
+        try:
+            for script in document.xpath(JSON_LD_XPATH):
+                data = loads(script.xpath("string()"), strict=False)
+                if isinstance(data, list):
+                    items.extend(item for item in data if item)
+                elif isinstance(data, dict) and data:
+                    items.append(data)
+        except ValueError:
+            self._extract(document, "json-ld")
+            return
+        self._extracted["json-ld"] = items
+        self.syntaxes.append("json-ld")
+
+    def _extract(self, document, syntax):
+        self._extracted.update(
+            extruct.extract(
+                document,
+                syntaxes=[syntax],
+                errors="log" if settings.LOG_LEVEL <= 10 else "ignore",
+                uniform=True,
+            )
+        )
+        self.syntaxes.append(syntax)
+
+    def _find_recipes(self, data):
+        """
+        The syntax and the entity of each Recipe of the extracted data, in page
+        order: the items that are recipes, the recipe nodes of their @graph, the
+        recipes that are the main entity of a WebPage, and the recipe elements
+        of an ItemList. Recipes given more than once, as told by their @id or,
+        for recipes without one, by their content, are only listed the first
+        time.
+        """
+        seen = set()
+        for syntax in SYNTAXES:
+            for item in data.get(syntax, []):
+                if SCHEMA_ORG_HOST not in item.get("@context", ""):
+                    continue
+                for recipe in self._recipe_entities(item):
+                    key, keys = self._recipe_keys(recipe)
+                    if key in seen:
+                        continue
+                    seen.update(keys)
+                    yield syntax, recipe
+
+    @staticmethod
+    def _recipe_keys(recipe):
+        # the key that tells whether a recipe was given before, and the keys
+        # that it registers: recipes with an @id are the same only when their
+        # @id is, and the others when their content is, as told by their name
+        # and ingredients, or by all of their properties when they list none
+        name = recipe.get("name")
+        ingredients = recipe.get("recipeIngredient")
+        if (
+            isinstance(name, str)
+            and isinstance(ingredients, list)
+            and ingredients
+            and all(isinstance(ingredient, str) for ingredient in ingredients)
+        ):
+            content_key = ("content", name, tuple(ingredients))
+        else:
+            content = {
+                key: value
+                for key, value in recipe.items()
+                if key not in ("@id", "@context")
+            }
+            content_key = ("content", json.dumps(content, sort_keys=True, default=str))
+        recipe_id = recipe.get("@id")
+        if isinstance(recipe_id, str) and recipe_id:
+            id_key = ("@id", recipe_id)
+            return id_key, {id_key, content_key}
+        return content_key, {content_key}
+
+    def _recipe_entities(self, item):
+        nodes = [item]
+        for graph in item.get("@graph", []):
+            nodes.extend(graph if isinstance(graph, list) else [graph])
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+            if self._contains_schematype(node, "Recipe"):
+                yield node
+            elif self._contains_schematype(node, "WebPage"):
+                main_entity = node.get("mainEntity", {})
+                if isinstance(main_entity, dict) and self._contains_schematype(
+                    main_entity, "Recipe"
+                ):
+                    yield main_entity
+            elif self._contains_schematype(node, "ItemList"):
+                elements = node.get("itemListElement", [])
+                for element in elements if isinstance(elements, list) else [elements]:
+                    # the elements are recipes, or list items of recipes
+                    if isinstance(element, dict) and "item" in element:
+                        element = element["item"]
+                    if isinstance(element, dict) and self._contains_schematype(
+                        element, "Recipe"
+                    ):
+                        yield element
+
+    def _find_main_recipe(self, data):
         for syntax in SYNTAXES:
             # Make sure entries of type Recipe are always parsed first
             syntax_data = data.get(syntax, [])
@@ -105,6 +246,34 @@ class SchemaOrg:
                         self.data = main_entity
                         return
 
+    def recipe_schemas(self):
+        """
+        A SchemaOrg for each of the other Recipe entities of the page, in page
+        order, sharing the site, people and ratings data of this one.
+        """
+        if self._page_data is not None:
+            self._extract(self._page_data, "microdata")
+            self._page_data = None
+
+        schemas = []
+        # scrapers may have replaced self.data with a copy of one of them
+        _, main_keys = self._recipe_keys(self.data)
+        for syntax, recipe in self._find_recipes(self._extracted):
+            if recipe is self._main_recipe or self._recipe_keys(recipe)[0] in main_keys:
+                continue
+            schema = copy.copy(self)
+            schema.format = syntax
+            schema.data = recipe
+            schema.clear_recipes()
+            schemas.append(schema)
+        return schemas
+
+    def clear_recipes(self):
+        """Drop the extracted data of the other recipes of the page."""
+        self._extracted = {}
+        self._main_recipe = None
+        self._page_data = None
+
     def site_name(self):
         if not self.website_name:
             raise SchemaOrgException("Site name not found in SchemaOrg")
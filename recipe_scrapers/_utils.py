@@ -2,8 +2,10 @@ import html
 import inspect
 import math
 import re
+from html.parser import HTMLParser
 
 import isodate
+from bs4 import BeautifulSoup, Tag
 
 from ._exceptions import ElementNotFoundInHtml
 
@@ -25,13 +27,25 @@ FRACTIONS = {
     "⅞": 0.875,
 }
 
-TIME_REGEX = re.compile(
-    r"(?:\D*(?P<days>\d+)\s*(?:days|D))?"
-    r"(?:\D*(?P<hours>[\d.\s/?¼½¾⅓⅔⅕⅖⅗]+)\s*(?:hours|hrs|hr|h|óra|:))?"
-    r"(?:\D*(?P<minutes>\d+)\s*(?:minutes|mins|min|m|perc|$))?"
-    r"(?:\D*(?P<seconds>\d+)\s*(?:seconds|secs|sec|s))?",
-    re.IGNORECASE,
+# Duration components in the order they are looked for, with their units
+TIME_UNITS = (
+    ("days", re.compile(r"days|d", re.IGNORECASE)),
+    ("hours", re.compile(r"hours|hrs|hr|h|óra|:", re.IGNORECASE)),
+    ("minutes", re.compile(r"minutes|mins|min|m|perc|\Z", re.IGNORECASE)),
+    ("seconds", re.compile(r"seconds|secs|sec|s", re.IGNORECASE)),
 )
+# Longer strings are not durations, e.g. descriptions scraped by mistake
+MAX_TIME_TEXT_LENGTH = 1000
+
+NON_DIGITS_REGEX = re.compile(r"\D*")
+DIGITS_REGEX = re.compile(r"\d*")
+WHITESPACE_REGEX = re.compile(r"\s*")
+HOURS_VALUE_REGEX = re.compile(r"[\d.\s/?¼½¾⅓⅔⅕⅖⅗]*")
+HOURS_SEPARATORS_REGEX = re.compile(r"[.\s/?¼½¾⅓⅔⅕⅖⅗]+")
+HTML_TAG_REGEX = re.compile("<[^>]*>")
+
+NORMALIZE_TRANSLATION = str.maketrans({"\u200b": None})
+
 SERVE_REGEX_NUMBER = re.compile(r"(\D*(?P<items>\d+)?\D*)")
 
 SERVE_REGEX_ITEMS = re.compile(
@@ -71,6 +85,82 @@ RECIPE_YIELD_TYPES = (
 )
 
 
+def _word_trie_pattern(words):
+    """
+    Regular expression source matching any of the given words. The words are
+    folded into a trie so that only branches sharing the next character are
+    tried, and the longest word wins at any position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [
+            re.escape(char) + build(child) for char, child in node.items() if char
+        ]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(trie)
+
+
+class YieldTypeMatcher:
+    """
+    Finds the best yield type for a lowercase text in one left-to-right scan.
+
+    The yield type whose singular, or failing that plural, is the longest
+    word found in the text wins; on ties the first listed type wins.
+    """
+
+    def __init__(self, yield_types):
+        self.yield_types = tuple(yield_types)
+        self._types_by_word = {}
+        for index, (singular, plural) in enumerate(self.yield_types):
+            for word in {singular, plural}:
+                self._types_by_word.setdefault(word, []).append(index)
+
+        # The scan reports the longest word starting at every matching position,
+        # which implies the shorter words it starts with, e.g. "cupcakes" -> "cup"
+        self._implied_words = {
+            word: [other for other in self._types_by_word if word.startswith(other)]
+            for word in self._types_by_word
+        }
+        self._regex = re.compile(_word_trie_pattern(self._types_by_word))
+
+    def match(self, text):
+        """Returns the best (singular, plural) yield type found in text, or None."""
+        found = set()
+        search = self._regex.search
+        match = search(text)
+        while match is not None:
+            found.update(self._implied_words[match.group()])
+            match = search(text, match.start() + 1)
+        if not found:
+            return None
+
+        best_match = None
+        best_match_length = 0
+        for index in sorted({i for word in found for i in self._types_by_word[word]}):
+            singular, plural = self.yield_types[index]
+            match_length = len(singular) if singular in found else len(plural)
+            if match_length > best_match_length:
+                best_match_length = match_length
+                best_match = self.yield_types[index]
+        return best_match
+
+
+# Yield types by language; add a YieldTypeMatcher to classify yields of other languages
+YIELD_TYPE_MATCHERS = {
+    "en": YieldTypeMatcher(RECIPE_YIELD_TYPES),
+}
+
+
 def format_diet_name(diet_input):
     replacements = {
         # https://schema.org/RestrictedDiet
@@ -127,6 +217,58 @@ def _extract_fractional(input_string: str) -> float:
     raise ValueError(f"Unrecognized fraction format: '{input_string}'")
 
 
+def _match_time_component(text, pos, unit_pattern, fractional=False):
+    """
+    Finds the value of a duration component that follows pos.
+
+    Returns the value and the position after its unit, or None and pos when
+    the component is not present. Every scan only moves forward, so the cost
+    is linear in the length of the text.
+    """
+    start = NON_DIGITS_REGEX.match(text, pos).end()
+
+    if not fractional:
+        value_end = DIGITS_REGEX.match(text, start).end()
+        if value_end == start:
+            return None, pos
+        unit = unit_pattern.match(text, WHITESPACE_REGEX.match(text, value_end).end())
+        if unit is None:
+            return None, pos
+        return text[start:value_end], unit.end()
+
+    # e.g. "1 1/2 hours" or "1½ hrs"
+    value_end = HOURS_VALUE_REGEX.match(text, start).end()
+    if value_end > start:
+        unit = unit_pattern.match(text, value_end)
+        if unit is not None:
+            return text[start:value_end], unit.end()
+
+    # Otherwise a unit may directly follow a separator before the first digit,
+    # e.g. ". hours"; the value is then the last separator character
+    separators = list(HOURS_SEPARATORS_REGEX.finditer(text, pos, start))
+    for separator in reversed(separators):
+        if separator.end() == start:
+            continue
+        unit = unit_pattern.match(text, separator.end())
+        if unit is not None:
+            return text[separator.end() - 1 : separator.end()], unit.end()
+    return None, pos
+
+
+def parse_time_units(time_text, time_units=TIME_UNITS):
+    """
+    Splits a duration such as "1 hr 30 mins" into the values of its
+    components, e.g. {"days": None, "hours": "1", "minutes": "30", "seconds": None}.
+    """
+    values = {}
+    pos = 0
+    for name, unit_pattern in time_units:
+        values[name], pos = _match_time_component(
+            time_text, pos, unit_pattern, fractional=name == "hours"
+        )
+    return values
+
+
 def get_minutes(element):
     if element is None:
         raise ElementNotFoundInHtml(element)
@@ -162,7 +304,10 @@ def get_minutes(element):
         except Exception:
             pass
 
-    time_units = TIME_REGEX.search(time_text).groupdict()
+    if len(time_text) > MAX_TIME_TEXT_LENGTH:
+        return None
+
+    time_units = parse_time_units(time_text)
     if not any(time_units.values()):
         return None
 
@@ -181,7 +326,19 @@ def get_minutes(element):
     return round(total_minutes)
 
 
-def get_yields(element):
+def get_yield_type_matcher(language=None):
+    """YieldTypeMatcher for a language code such as "de" or "en-US", defaulting to English."""
+    if language:
+        language = language.lower()
+        matcher = YIELD_TYPE_MATCHERS.get(language) or YIELD_TYPE_MATCHERS.get(
+            language.split("-")[0]
+        )
+        if matcher is not None:
+            return matcher
+    return YIELD_TYPE_MATCHERS["en"]
+
+
+def get_yields(element, language=None):
     """
     Will return a string of servings or items, if the recipe is for number of items and not servings
     the method will return the string "x item(s)" where x is the quantity.
@@ -190,6 +347,7 @@ def get_yields(element):
     such as "4 dozen cookies", returning "4 dozen" instead of "4 servings". Additionally
     accommodates yields specified in batches (e.g., "2 batches of brownies"), returning the yield as stated.
     :param element: Should be BeautifulSoup.TAG, in some cases not feasible and will then be text.
+    :param language: Language code selecting the yield types, see YIELD_TYPE_MATCHERS.
     :return: The number of servings or items.
     :return: The number of servings, items, dozen, batches, etc...
     """
@@ -204,22 +362,11 @@ def get_yields(element):
         serve_text = serve_text.split(SERVE_REGEX_TO.split(serve_text, 2)[1], 2)[1]
 
     matched = SERVE_REGEX_NUMBER.search(serve_text).groupdict().get("items") or 0
-    serve_text_lower = serve_text.lower()
-
-    best_match = None
-    best_match_length = 0
-
-    for singular, plural in RECIPE_YIELD_TYPES:
-        if singular in serve_text_lower or plural in serve_text_lower:
-            match_length = (
-                len(singular) if singular in serve_text_lower else len(plural)
-            )
-            if match_length > best_match_length:
-                best_match_length = match_length
-                best_match = f"{matched} {singular if int(matched) == 1 else plural}"
 
-    if best_match:
-        return best_match
+    yield_type = get_yield_type_matcher(language).match(serve_text.lower())
+    if yield_type:
+        singular, plural = yield_type
+        return f"{matched} {singular if int(matched) == 1 else plural}"
 
     if SERVE_REGEX_ITEMS.search(serve_text) is not None:
         return "{} item{}".format(matched, "" if int(matched) == 1 else "s")
@@ -240,20 +387,62 @@ def get_equipment(equipment_items):
 
 def normalize_string(string):
     # Convert all named and numeric character references (e.g. &gt;, &#62;)
-    unescaped_string = html.unescape(string)
+    if "&" in string:
+        string = html.unescape(string)
     # Remove HTML tags
-    no_html_string = re.sub("<[^>]*>", "", unescaped_string)
-    return re.sub(
-        r"\s+",
-        " ",
-        no_html_string.replace("\xc2\xa0", " ")
-        .replace("\xa0", " ")
-        .replace("\u200b", "")
-        .replace("\r\n", " ")
-        .replace("\n", " ")  # &nbsp;
-        .replace("\t", " ")
-        .strip(),
-    )
+    if "<" in string:
+        string = HTML_TAG_REGEX.sub("", string)
+    if not string.isascii():
+        # Replace mis-decoded &nbsp; ("\xc2\xa0") and drop zero-width spaces
+        string = string.replace("\xc2\xa0", " ").translate(NORMALIZE_TRANSLATION)
+    # Collapse all whitespace (including newlines, tabs and &nbsp;) into single spaces
+    return " ".join(string.split())
+
+
+class FragmentTextParser(HTMLParser):
+    """Collects the text of an HTML fragment, much like Tag.get_text()."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+
+    def handle_data(self, data):
+        # the contents of <script> and <style> elements are not text
+        if self.cdata_elem is None:
+            self.text.append(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA["):
+            self.text.append(data[len("CDATA[") :])
+
+
+def fragment_text(fragment):
+    """
+    The text of a node, or of a small HTML string such as a schema.org field,
+    without building a tree for it.
+    """
+    if isinstance(fragment, Tag):
+        return fragment.get_text()
+    fragment = str(fragment)
+    if "<" not in fragment and "&" not in fragment:
+        return fragment
+    parser = FragmentTextParser()
+    parser.feed(fragment)
+    parser.close()
+    return "".join(parser.text)
+
+
+def fragment_elements(fragment, name):
+    """
+    The elements with the given tag name in a node, or in a small HTML string
+    such as a schema.org field, which is parsed on its own.
+    """
+    if isinstance(fragment, Tag):
+        return fragment.find_all(name)
+    fragment = str(fragment)
+    if "<" not in fragment:
+        return []
+    return BeautifulSoup(fragment, "html.parser").find_all(name)
 
 
 def csv_to_tags(csv, lowercase=False):
@@ -317,12 +506,22 @@ def get_url_slug(url):
 def get_abstract_methods():
     from ._abstract import AbstractScraper
 
+    special_cases = {
+        "links",
+        "to_json",
+        "to_json_bytes",
+        "to_recipe",
+        "close",
+        "select",
+        "select_one",
+    }
+
     return [
         name
         for name, value in AbstractScraper.__dict__.items()  # Attributes of the abstract scraper class..
         if not name.startswith("_")  # ... that are not private ...
         and inspect.isfunction(value)  # ... and are functions ...
-        and name not in {"links", "to_json"}  # ... and not excluded as special-cases.
+        and name not in special_cases  # ... and not excluded as special-cases.
         or name == "host"  # ... explicitly include the `host` method.
     ]
 
@@ -1,130 +1,47 @@
-import html
-import inspect
 import math
 import re
+from typing import Optional
 
 import isodate
 
 from ._exceptions import ElementNotFoundInHtml
-
-FRACTIONS = {
-    "½": 0.5,
-    "⅓": 1 / 3,
-    "⅔": 2 / 3,
-    "¼": 0.25,
-    "¾": 0.75,
-    "⅕": 0.2,
-    "⅖": 0.4,
-    "⅗": 0.6,
-    "⅘": 0.8,
-    "⅙": 1 / 6,
-    "⅚": 5 / 6,
-    "⅛": 0.125,
-    "⅜": 0.375,
-    "⅝": 0.625,
-    "⅞": 0.875,
-}
-
-TIME_REGEX = re.compile(
-    r"(?:\D*(?P<days>\d+)\s*(?:days|D))?"
-    r"(?:\D*(?P<hours>[\d.\s/?¼½¾⅓⅔⅕⅖⅗]+)\s*(?:hours|hrs|hr|h|óra|:))?"
-    r"(?:\D*(?P<minutes>\d+)\s*(?:minutes|mins|min|m|perc|$))?"
-    r"(?:\D*(?P<seconds>\d+)\s*(?:seconds|secs|sec|s))?",
-    re.IGNORECASE,
+from ._utils import MAX_TIME_TEXT_LENGTH, _extract_fractional, parse_time_units
+
+# Japanese units of the duration components, see TIME_UNITS in _utils
+TIME_UNITS_JP = (
+    ("days", re.compile(r"日")),
+    ("hours", re.compile(r"時間")),
+    ("minutes", re.compile(r"分")),
+    ("seconds", re.compile(r"秒")),
 )
-SERVE_REGEX_NUMBER = re.compile(r"(\D*(?P<items>\d+)?\D*)")
 
-SERVE_REGEX_ITEMS = re.compile(
-    r"\bsandwiches\b |\btacquitos\b | \bmakes\b | \bcups\b | \bappetizer\b | \bporzioni\b | \bcookies\b | \b(large |small )?buns\b",
-    flags=re.I | re.X,
-)
+# Ingredients prefixed with a marker such as (A) or (B) belong to the same group
+MARKER_REGEX = re.compile(r"\([A-Za-z0-9]+\)")
 
-SERVE_REGEX_TO = re.compile(r"\d+(\s+to\s+|-)\d+", flags=re.I | re.X)
-
-RECIPE_YIELD_TYPES = (
-    ("dozen", "dozen"),
-    ("batch", "batches"),
-    ("cake", "cakes"),
-    ("sandwich", "sandwiches"),
-    ("bun", "buns"),
-    ("cookie", "cookies"),
-    ("muffin", "muffins"),
-    ("cupcake", "cupcakes"),
-    ("loaf", "loaves"),
-    ("pie", "pies"),
-    ("cup", "cups"),
-    ("pint", "pints"),
-    ("gallon", "gallons"),
-    ("ounce", "ounces"),
-    ("pound", "pounds"),
-    ("gram", "grams"),
-    ("liter", "liters"),
-    ("piece", "pieces"),
-    ("layer", "layers"),
-    ("scoop", "scoops"),
-    ("bar", "bars"),
-    ("patty", "patties"),
-    ("hamburger bun", "hamburger buns"),
-    ("pancake", "pancakes"),
-    ("item", "items"),
-    # ... add more types as needed, in (singular, plural) format ...
+# Inclusive codepoint ranges of Kanji, Hiragana, Katakana and half-width Katakana
+JAPANESE_CHARACTER_RANGES = (
+    (0x4E00, 0x9FAF),
+    (0x3040, 0x309F),
+    (0x30A0, 0x30FF),
+    (0xFF66, 0xFF9F),
 )
 
 
-def format_diet_name(diet_input):
-    replacements = {
-        # https://schema.org/RestrictedDiet
-        "DiabeticDiet": "Diabetic Diet",
-        "GlutenFreeDiet": "Gluten Free Diet",
-        "HalalDiet": "Halal Diet",
-        "HinduDiet": "Hindu Diet",
-        "KosherDiet": "Kosher Diet",
-        "LowCalorieDiet": "Low Calorie Diet",
-        "LowFatDiet": "Low Fat Diet",
-        "LowLactoseDiet": "Low Lactose Diet",
-        "LowSaltDiet": "Low Salt Diet",
-        "VeganDiet": "Vegan Diet",
-        "VegetarianDiet": "Vegetarian Diet",
-    }
-    if "https://schema.org/" in diet_input:
-        diet_input = diet_input.replace("https://schema.org/", "")
-
-    for key, value in replacements.items():
-        if key in diet_input:
-            return value
-
-    return diet_input
+def get_marker(ingredient: str) -> Optional[str]:
+    """Checks if the ingredient starts with a marker like (A), (B), etc."""
+    match = MARKER_REGEX.match(ingredient)
+    return match.group(0) if match else None
 
 
-def _extract_fractional(input_string: str) -> float:
-    input_string = input_string.strip()
-
-    # Handling mixed numbers with unicode fractions e.g., '1⅔'
-    for unicode_fraction, fraction_part in FRACTIONS.items():
-        if unicode_fraction in input_string:
-            whole_number_part, _, _ = input_string.partition(unicode_fraction)
-
-            whole_number = float(whole_number_part or 0)
-            return whole_number + fraction_part
-
-    if input_string in FRACTIONS:
-        return FRACTIONS[input_string]
-
-    try:
-        return float(input_string)
-    except ValueError:
-        pass
-
-    if " " in input_string and "/" in input_string:
-        whole_part, fractional_part = input_string.split(" ", 1)
-        numerator, denominator = fractional_part.split("/")
-        return float(whole_part) + float(numerator) / float(denominator)
-
-    elif "/" in input_string:
-        numerator, denominator = input_string.split("/")
-        return float(numerator) / float(denominator)
-
-    raise ValueError(f"Unrecognized fraction format: '{input_string}'")
+def is_non_japanese_character(first_char: str) -> bool:
+    """Checks if the first character is not Kanji, Hiragana, or Katakana."""
+    if not first_char:
+        return False
+    codepoint = ord(first_char[0])
+    for start, end in JAPANESE_CHARACTER_RANGES:
+        if start <= codepoint <= end:
+            return False
+    return True
 
 
 def get_minutes_jp(element):
@@ -146,7 +63,7 @@ def get_minutes_jp(element):
     time_text = element.strip()
 
     # Handle Japanese time units and ranges (e.g., '12〜15分' or '12分〜15分')
-    time_text = re.sub(r"〜", " to ", time_text)  # Normalize Japanese '〜' to 'to'
+    time_text = time_text.replace("〜", " to ")  # Normalize Japanese '〜' to 'to'
 
     # Handle cases like '12-15 分'
     if "-" in time_text:
@@ -166,16 +83,10 @@ def get_minutes_jp(element):
         except Exception:
             pass
 
-    # Define regex for Japanese time units
-    TIME_REGEX_JP = re.compile(
-        r"(?:\D*(?P<days>\d+)\s*(?:日))?"
-        r"(?:\D*(?P<hours>[\d.\s/?¼½¾⅓⅔⅕⅖⅗]+)\s*(?:時間))?"
-        r"(?:\D*(?P<minutes>\d+)\s*(?:分))?"
-        r"(?:\D*(?P<seconds>\d+)\s*(?:秒))?",
-        re.IGNORECASE,
-    )
+    if len(time_text) > MAX_TIME_TEXT_LENGTH:
+        return None
 
-    time_units = TIME_REGEX_JP.search(time_text).groupdict()
+    time_units = parse_time_units(time_text, TIME_UNITS_JP)
     if not any(time_units.values()):
         return None
 
@@ -0,0 +1,114 @@
+from collections import defaultdict
+from typing import List
+
+from ._grouping_utils import IngredientGroup, group_ingredient_elements
+from ._utils import get_equipment, normalize_string
+
+CONTAINER_CLASS = "wprm-recipe-container"
+GROUP_NAME_CLASS = "wprm-recipe-ingredient-group-name"
+INGREDIENT_CLASS = "wprm-recipe-ingredient"
+EQUIPMENT_NAME_CLASS = "wprm-recipe-equipment-name"
+INSTRUCTION_TEXT_CLASS = "wprm-recipe-instruction-text"
+
+INDEXED_CLASSES = frozenset(
+    (GROUP_NAME_CLASS, INGREDIENT_CLASS, EQUIPMENT_NAME_CLASS, INSTRUCTION_TEXT_CLASS)
+)
+
+
+class WPRMRecipe:
+    """
+    The recipe card of a page made with the WP Recipe Maker WordPress plugin.
+
+    The card is located once, and the elements of every field are collected
+    with a single walk of its subtree on first use. Pages without a
+    .wprm-recipe-container element are walked as a whole.
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.clear()
+
+    def clear(self):
+        """Drop the collected elements; they are collected again on next use."""
+        self._elements = None
+
+    def _walk(self):
+        container = self.soup.find(class_=CONTAINER_CLASS)
+        root = container if container is not None else self.soup
+
+        elements = defaultdict(list)
+        for element in root.descendants:
+            if element.name is None:
+                continue
+            classes = element.get("class")
+            if not classes:
+                continue
+            for class_name in INDEXED_CLASSES.intersection(classes):
+                elements[class_name].append(element)
+            # group names and ingredients, in document order, for grouping
+            if GROUP_NAME_CLASS in classes or INGREDIENT_CLASS in classes:
+                elements[None].append(element)
+        self._elements = elements
+
+    def elements(self, class_name):
+        """The elements of the card that have one of the indexed classes."""
+        if self._elements is None:
+            self._walk()
+        return self._elements.get(class_name, [])
+
+    def ingredient_groups(self, ingredients_list: List[str]) -> List[IngredientGroup]:
+        """
+        The ingredients of ingredients_list, grouped under the ingredient group
+        names of the card, as group_ingredients() would group them.
+        """
+        found_ingredients = self.elements(INGREDIENT_CLASS)
+        if len(found_ingredients) != len(ingredients_list):
+            raise ValueError(
+                f"Found {len(found_ingredients)} grouped ingredients but was expecting to find {len(ingredients_list)}."
+            )
+        return group_ingredient_elements(
+            ingredients_list,
+            self.elements(None),
+            lambda element: GROUP_NAME_CLASS in element["class"],
+        )
+
+    def equipment(self) -> List[str]:
+        """The names of the equipment of the card, without duplicates."""
+        names = (
+            normalize_string(element.get_text())
+            for element in self.elements(EQUIPMENT_NAME_CLASS)
+        )
+        return get_equipment([name for name in names if name])
+
+    def instructions(self) -> str:
+        """The instruction steps of the card, one per line."""
+        return "\n".join(
+            normalize_string(element.get_text())
+            for element in self.elements(INSTRUCTION_TEXT_CLASS)
+        )
+
+
+# Scrapers opt into the engine per field by assigning these as methods, e.g.
+#
+#     class Example(AbstractScraper):
+#         ingredient_groups = wprm_ingredient_groups
+#
+# They are named after the methods they stand for, as plugins tell the methods
+# they decorate apart by their __name__.
+
+
+def ingredient_groups(self):
+    return self.wprm.ingredient_groups(self.ingredients())
+
+
+def equipment(self):
+    return self.wprm.equipment()
+
+
+def instructions(self):
+    return self.wprm.instructions()
+
+
+wprm_ingredient_groups = ingredient_groups
+wprm_equipment = equipment
+wprm_instructions = instructions
@@ -1,5 +1,5 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class AddAPinch(AbstractScraper):
@@ -7,13 +7,7 @@ class AddAPinch(AbstractScraper):
     def host(cls):
         return "addapinch.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient-group li",
-        )
+    ingredient_groups = wprm_ingredient_groups
 
     def equipment(self):
         return list(
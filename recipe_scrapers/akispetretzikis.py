@@ -1,14 +1,10 @@
-import json
-
 from ._abstract import AbstractScraper
 
 
 class AkisPetretzikis(AbstractScraper):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.recipe_json = json.loads(
-            self.soup.find("script", {"id": "__NEXT_DATA__"}).get_text()
-        )
+        self.recipe_json = self.app_state.next_data()
 
     @classmethod
     def host(cls):
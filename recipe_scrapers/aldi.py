@@ -19,7 +19,7 @@ class Aldi(AbstractScraper):
         return self.soup.find("h1").text
 
     def category(self):
-        element = self.soup.select_one("a.tab-nav--link.dropdown--list--link.m-active")
+        element = self.select_one("a.tab-nav--link.dropdown--list--link.m-active")
         if element:
             title = element.text
             recipe_position = title.find(" Recipe")
@@ -15,7 +15,7 @@ class ALittleBitYummy(AbstractScraper):
             return author_tag.text.replace("Author:", "").strip()
 
     def ingredients(self):
-        ingredient_blocks = self.soup.select(".ingredients-tab-content div")
+        ingredient_blocks = self.select(".ingredients-tab-content div")
         seen = set()
         ingredients = []
         for block in ingredient_blocks:
@@ -41,7 +41,7 @@ class ALittleBitYummy(AbstractScraper):
         return ingredients
 
     def instructions(self):
-        instruction_steps = self.soup.select("#method ol li")
+        instruction_steps = self.select("#method ol li")
         return "\n".join(
             normalize_string(step.get_text())
             for step in instruction_steps
@@ -1,6 +1,6 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
 from ._utils import get_equipment, normalize_string
+from ._wprm import wprm_ingredient_groups
 
 
 class AmazingRibs(AbstractScraper):
@@ -8,13 +8,7 @@ class AmazingRibs(AbstractScraper):
     def host(cls):
         return "amazingribs.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredients li",
-        )
+    ingredient_groups = wprm_ingredient_groups
 
     def equipment(self):
         equipment_items = [
@@ -1,5 +1,4 @@
 import functools
-import json
 
 from recipe_scrapers._grouping_utils import IngredientGroup
 
@@ -70,6 +69,6 @@ class AmericasTestKitchen(AbstractScraper):
 
     @functools.cached_property
     def _get_additional_details(self):
-        j = json.loads(self.soup.find(type="application/json").string)
+        j = self.app_state.next_data()
         name = list(j["props"]["initialState"]["content"]["documents"])[0]
         return j["props"]["initialState"]["content"]["documents"][name]
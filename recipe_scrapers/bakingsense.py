@@ -1,25 +1,13 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
-from ._utils import get_equipment
+from ._wprm import wprm_equipment, wprm_ingredient_groups
 
 
 class BakingSense(AbstractScraper):
+    parse_regions = (".wprm-recipe-container",)
+
     @classmethod
     def host(cls):
         return "baking-sense.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient-group li",
-        )
-
-    def equipment(self):
-        equipment_items = [
-            equip.get_text()
-            for equip in self.soup.find_all("div", class_="wprm-recipe-equipment-name")
-            if equip.get_text()
-        ]
-        return get_equipment(equipment_items)
+    ingredient_groups = wprm_ingredient_groups
+    equipment = wprm_equipment
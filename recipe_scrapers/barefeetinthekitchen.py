@@ -1,16 +1,12 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class BarefeetInTheKitchen(AbstractScraper):
+    parse_regions = (".wprm-recipe-container",)
+
     @classmethod
     def host(cls):
         return "barefeetinthekitchen.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient",
-        )
+    ingredient_groups = wprm_ingredient_groups
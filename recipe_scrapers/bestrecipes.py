@@ -3,6 +3,8 @@ from ._exceptions import StaticValueException
 
 
 class BestRecipes(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "bestrecipes.com.au"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class BettyBossi(AbstractScraper):
+    parse_regions = ()
+
     """Scrape BettyBossi.ch recipes."""
 
     @classmethod
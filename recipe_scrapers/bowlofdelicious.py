@@ -10,7 +10,7 @@ class BowlOfDelicious(AbstractScraper):
     def equipment(self):
         equipment_items = [
             link.get_text()
-            for link in self.soup.select(
+            for link in self.select(
                 "div.wprm-recipe-equipment-name a.wprm-recipe-equipment-link"
             )
         ]
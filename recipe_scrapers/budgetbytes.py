@@ -1,6 +1,6 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
 from ._utils import get_equipment
+from ._wprm import wprm_ingredient_groups
 
 
 class BudgetBytes(AbstractScraper):
@@ -8,18 +8,12 @@ class BudgetBytes(AbstractScraper):
     def host(cls):
         return "budgetbytes.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient",
-        )
+    ingredient_groups = wprm_ingredient_groups
 
     def equipment(self):
         equipment_items = [
             link.get_text()
-            for link in self.soup.select(
+            for link in self.select(
                 "div.wprm-recipe-equipment-name a.wprm-recipe-equipment-link"
             )
         ]
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class CastIronKeto(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "castironketo.net"
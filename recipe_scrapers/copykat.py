@@ -9,6 +9,8 @@ from ._abstract import AbstractScraper
 
 
 class CopyKat(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "copykat.com"
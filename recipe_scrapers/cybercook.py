@@ -3,6 +3,8 @@ from ._exceptions import StaticValueException
 
 
 class Cybercook(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "cybercook.com.br"
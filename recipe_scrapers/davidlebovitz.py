@@ -3,6 +3,8 @@ from ._exceptions import FieldNotProvidedByWebsiteException
 
 
 class DavidLebovitz(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "davidlebovitz.com"
@@ -1,5 +1,5 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class DomesticateMe(AbstractScraper):
@@ -16,10 +16,4 @@ class DomesticateMe(AbstractScraper):
         author_name = author_meta_tag["content"] if author_meta_tag else None
         return author_name
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient-group li",
-        )
+    ingredient_groups = wprm_ingredient_groups
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class EatingBirdFood(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "eatingbirdfood.com"
@@ -3,6 +3,8 @@ from ._exceptions import SchemaOrgException
 
 
 class Eatsmarter(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls, domain="com"):
         return f"eatsmarter.{domain}"
@@ -1,6 +1,6 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
 from ._utils import get_equipment
+from ._wprm import wprm_ingredient_groups
 
 
 class ElaVegan(AbstractScraper):
@@ -8,13 +8,7 @@ class ElaVegan(AbstractScraper):
     def host(cls):
         return "elavegan.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient-group li",
-        )
+    ingredient_groups = wprm_ingredient_groups
 
     def equipment(self):
         equipment_items = [
@@ -12,7 +12,7 @@ class FelixKitchen(AbstractScraper):
         return "felix.kitchen"
 
     def author(self):
-        result = self.soup.select("span.author > a")
+        result = self.select("span.author > a")
         if not result:
             return None
         return result[0].text
@@ -77,4 +77,4 @@ class FelixKitchen(AbstractScraper):
         return "\n".join(lines)
 
     def _get_step_divs(self):
-        return self.soup.select('div[class*="wp-block-columns is-layout-flex"]')
+        return self.select('div[class*="wp-block-columns is-layout-flex"]')
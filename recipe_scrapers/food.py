@@ -3,6 +3,8 @@ from ._exceptions import StaticValueException
 
 
 class Food(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "food.com"
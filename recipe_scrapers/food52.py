@@ -2,6 +2,8 @@ from recipe_scrapers._abstract import AbstractScraper
 
 
 class Food52(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "food52.com"
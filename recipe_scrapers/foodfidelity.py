@@ -1,5 +1,5 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class FoodFidelity(AbstractScraper):
@@ -7,13 +7,7 @@ class FoodFidelity(AbstractScraper):
     def host(cls):
         return "foodfidelity.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient",
-        )
+    ingredient_groups = wprm_ingredient_groups
 
     def description(self):
         img_tag = self.soup.find("img", {"data-pin-description": True})
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class FoodNetwork(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls, domain="co.uk"):
         return f"foodnetwork.{domain}"
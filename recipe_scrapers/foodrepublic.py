@@ -38,7 +38,7 @@ class FoodRepublic(AbstractScraper):
         return get_yields(servings_amount)
 
     def ingredients(self):
-        ingredients = self.soup.select("ul.recipe-ingredients li")
+        ingredients = self.select("ul.recipe-ingredients li")
 
         return [normalize_string(ingredient.get_text()) for ingredient in ingredients]
 
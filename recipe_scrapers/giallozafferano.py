@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class GialloZafferano(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "ricette.giallozafferano.it"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Globo(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "receitas.globo.com"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Godt(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "godt.no"
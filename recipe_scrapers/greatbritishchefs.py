@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class GreatBritishChefs(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "greatbritishchefs.com"
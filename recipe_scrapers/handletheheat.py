@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class HandleTheHeat(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls, domain="handletheheat.com"):
         return domain
@@ -10,18 +10,16 @@ class HelloFresh(AbstractScraper):
         return f"hellofresh.{domain}"
 
     def cook_time(self):
-        script_tag = self.soup.find("script", {"id": "__NEXT_DATA__"})
-        if script_tag:
-            script_content = script_tag.string
+        script_content = self.app_state.script("__NEXT_DATA__")
+        if script_content:
             total_time_match = re.search(r'"totalTime":"(PT\d+M)"', script_content)
             if total_time_match:
                 total_time_str = total_time_match.group(1)
                 return get_minutes(total_time_str)
 
     def prep_time(self):
-        script_tag = self.soup.find("script", {"id": "__NEXT_DATA__"})
-        if script_tag:
-            script_content = script_tag.string
+        script_content = self.app_state.script("__NEXT_DATA__")
+        if script_content:
             prep_time_match = re.search(r'"prepTime":"(PT\d+M)"', script_content)
             if prep_time_match:
                 prep_time_str = prep_time_match.group(1)
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class ImWorthy(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "im-worthy.com"
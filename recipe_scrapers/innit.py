@@ -7,6 +7,8 @@ from ._exceptions import StaticValueException
 
 
 class Innit(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls, domain="com"):
         return f"innit.{domain}"
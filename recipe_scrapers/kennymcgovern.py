@@ -1,17 +1,12 @@
 from ._abstract import AbstractScraper
-from ._utils import normalize_string
+from ._wprm import wprm_instructions
 
 
 class KennyMcGovern(AbstractScraper):
+    parse_regions = (".wprm-recipe-container",)
+
     @classmethod
     def host(cls):
         return "kennymcgovern.com"
 
-    def instructions(self):
-        instructions = self.soup.findAll(
-            "div", {"class": "wprm-recipe-instruction-text"}
-        )
-
-        return "\n".join(
-            [normalize_string(instruction.get_text()) for instruction in instructions]
-        )
+    instructions = wprm_instructions
@@ -1,10 +1,10 @@
-from bs4 import BeautifulSoup
-
 from ._abstract import AbstractScraper
-from ._utils import normalize_string
+from ._utils import fragment_elements, normalize_string
 
 
 class KingArthur(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "kingarthurbaking.com"
@@ -16,8 +16,7 @@ class KingArthur(AbstractScraper):
         returning the schema instructions in case this is changed, again.
         """
         schema_instructions = self.schema.instructions()
-        soup = BeautifulSoup(schema_instructions, "html.parser")
-        instruction_elms = soup.findAll("p")
+        instruction_elms = fragment_elements(schema_instructions, "p")
         if instruction_elms:
             return "\n".join(
                 [normalize_string(elm.get_text()) for elm in instruction_elms]
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Koket(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "koket.se"
@@ -8,6 +8,8 @@ from ._utils import normalize_string
 
 
 class KuchynaLidla(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "kuchynalidla.sk"
@@ -1,7 +1,5 @@
-from bs4 import BeautifulSoup
-
 from ._abstract import AbstractScraper
-from ._utils import normalize_string
+from ._utils import fragment_text, normalize_string
 
 
 class LeanAndGreenRecipes(AbstractScraper):
@@ -18,8 +16,7 @@ class LeanAndGreenRecipes(AbstractScraper):
         )
 
     def cuisine(self):
-        soup = BeautifulSoup(str(self.schema.cuisine()), features="html.parser")
-        return soup.get_text()
+        return fragment_text(self.schema.cuisine())
 
     def description(self):
         descriptions = self.soup.find(
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class LettuceClub(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "lettuceclub.net"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class LittleSpiceJar(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "littlespicejar.com"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class LittleSunnyKitchen(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "littlesunnykitchen.com"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Lovingitvegan(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "lovingitvegan.com"
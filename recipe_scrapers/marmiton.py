@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Marmiton(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "marmiton.org"
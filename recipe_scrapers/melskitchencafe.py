@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class MelsKitchenCafe(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "melskitchencafe.com"
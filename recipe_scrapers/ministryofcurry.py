@@ -1,17 +1,12 @@
 from ._abstract import AbstractScraper
+from ._wprm import wprm_equipment
 
 
 class MinistryOfCurry(AbstractScraper):
+    parse_regions = (".wprm-recipe-container",)
+
     @classmethod
     def host(cls):
         return "ministryofcurry.com"
 
-    def equipment(self):
-        return list(
-            {
-                (item.get_text())
-                for item in self.soup.find_all(
-                    "div", class_="wprm-recipe-equipment-name"
-                )
-            }
-        )
+    equipment = wprm_equipment
@@ -3,6 +3,8 @@ from ._exceptions import StaticValueException
 
 
 class Misya(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "misya.info"
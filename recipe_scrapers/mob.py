@@ -1,5 +1,3 @@
-import json
-
 from ._abstract import AbstractScraper
 from ._grouping_utils import IngredientGroup
 
@@ -8,9 +6,7 @@ class Mob(AbstractScraper):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.recipe_json = json.loads(
-            self.soup.find("script", {"id": "__NEXT_DATA__"}).get_text()
-        )["props"]["pageProps"]["recipe"]
+        self.recipe_json = self.app_state.next_data()["props"]["pageProps"]["recipe"]
 
     @classmethod
     def host(cls):
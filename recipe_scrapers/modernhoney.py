@@ -1,15 +1,12 @@
 from ._abstract import AbstractScraper
-from ._utils import get_equipment
+from ._wprm import wprm_equipment
 
 
 class ModernHoney(AbstractScraper):
+    parse_regions = (".wprm-recipe-container",)
+
     @classmethod
     def host(cls):
         return "modernhoney.com"
 
-    def equipment(self):
-        equipment_items = [
-            item.get_text()
-            for item in self.soup.find_all("div", class_="wprm-recipe-equipment-name")
-        ]
-        return get_equipment(equipment_items)
+    equipment = wprm_equipment
@@ -3,6 +3,8 @@ from ._utils import re
 
 
 class Moulinex(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "moulinex.fr"
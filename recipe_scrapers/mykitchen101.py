@@ -1,7 +1,5 @@
 import re
 
-from bs4 import BeautifulSoup
-
 from ._abstract import AbstractScraper
 from ._utils import get_yields, normalize_string
 
@@ -21,19 +19,17 @@ class MyKitchen101(AbstractScraper):
         return get_yields(self.soup.find("p", string=re.compile("分量：")).get_text())
 
     def ingredients(self):
-        soup = BeautifulSoup(str(self.soup), features="html.parser")
         ingredients = (
-            soup.find(name="p", string=re.compile("材料："))
+            self.soup.find(name="p", string=re.compile("材料："))
             .find_next("ul")
             .find_all("li")
         )
         return [normalize_string(ingredient.get_text()) for ingredient in ingredients]
 
     def instructions(self):
-        soup = BeautifulSoup(str(self.soup), features="html.parser")
-        instructions = soup.find(name="p", string=re.compile("做法：")).find_all_next(
-            "p"
-        )
+        instructions = self.soup.find(
+            name="p", string=re.compile("做法：")
+        ).find_all_next("p")
         return "\n".join(
             [
                 normalize_string(instruction.get_text())
@@ -1,8 +1,10 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class NoRecipes(AbstractScraper):
+    parse_regions = (".wprm-recipe-container",)
+
     @classmethod
     def host(cls):
         return "norecipes.com"
@@ -17,11 +19,4 @@ class NoRecipes(AbstractScraper):
     def ingredients(self):
         return self._cleaned_ingredients()
 
-    def ingredient_groups(self):
-        cleaned_ingredients = self._cleaned_ingredients()
-        return group_ingredients(
-            cleaned_ingredients,
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient-group li",
-        )
+    ingredient_groups = wprm_ingredient_groups
@@ -1,5 +1,5 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class Number2Pencil(AbstractScraper):
@@ -37,10 +37,4 @@ class Number2Pencil(AbstractScraper):
         entry_content_div = self.soup.find("div", {"class": "entry-content"})
         return entry_content_div.find("em").text
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            ingredients_list=self.ingredients(),
-            soup=self.soup,
-            group_heading="div.wprm-recipe-ingredient-group-name",
-            group_element="li.wprm-recipe-ingredient",
-        )
+    ingredient_groups = wprm_ingredient_groups
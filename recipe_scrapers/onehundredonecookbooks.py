@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class OneHundredOneCookBooks(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "101cookbooks.com"
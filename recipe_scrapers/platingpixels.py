@@ -1,5 +1,5 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
+from ._wprm import wprm_ingredient_groups
 
 
 class PlatingPixels(AbstractScraper):
@@ -13,10 +13,4 @@ class PlatingPixels(AbstractScraper):
             return author_tag.next_sibling.strip()
         return "Plating Pixels"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            "h4.wprm-recipe-ingredient-group-name",
-            "li.wprm-recipe-ingredient",
-        )
+    ingredient_groups = wprm_ingredient_groups
@@ -1,17 +1,21 @@
 from .exception_handling import ExceptionHandlingPlugin
 from .html_tags_stripper import HTMLTagStripperPlugin
+from .instrumentation import InstrumentationPlugin
 from .normalize_string import NormalizeStringPlugin
 from .opengraph_fill import OpenGraphFillPlugin
 from .opengraph_image_fetch import OpenGraphImageFetchPlugin
 from .schemaorg_fill import SchemaOrgFillPlugin
 from .static_values import StaticValueExceptionHandlingPlugin
+from .time_budget import TimeBudgetPlugin
 
 __all__ = [
     "ExceptionHandlingPlugin",
     "StaticValueExceptionHandlingPlugin",
     "HTMLTagStripperPlugin",
+    "InstrumentationPlugin",
     "NormalizeStringPlugin",
     "OpenGraphImageFetchPlugin",
     "OpenGraphFillPlugin",
     "SchemaOrgFillPlugin",
+    "TimeBudgetPlugin",
 ]
@@ -1,6 +1,7 @@
 import functools
 import logging
 
+from recipe_scrapers._exceptions import ScrapeLimitExceeded
 from recipe_scrapers.settings import settings
 
 from ._interface import PluginInterface
@@ -13,11 +14,16 @@ class ExceptionHandlingPlugin(PluginInterface):
     """
     Plugin that is used only if settings.SUPPRESS_EXCEPTIONS is set to True.
 
-    The outer-most plugin and decorator.
+    The outer-most plugin and decorator but one: TimeBudgetPlugin comes first
+    in settings.PLUGINS, so that the time of this plugin counts against the
+    budgets.
 
     If ANY of the methods listed raises ANY kind of exception, silence it
     and return the respective value from settings.ON_EXCEPTION_RETURN_VALUES
 
+    ScrapeLimitExceeded is the exception: a page over the limits in settings
+    is not silently scraped as if it had no recipe.
+
     If settings.SUPPRESS_EXCEPTIONS is set to False this plugin is ignored and
     does nothing. (In other words exceptions won't be handled and will bubble up
     to program's explosion. Left to the end-user to handle them on his own).
@@ -52,6 +58,8 @@ class ExceptionHandlingPlugin(PluginInterface):
 
                 try:
                     return decorated(self, *args, **kwargs)
+                except ScrapeLimitExceeded:
+                    raise
                 except Exception as e:
                     logger.info(
                         f"ExceptionHandlingPlugin silenced exception: {str(e)} in {class_name}.{method_name}()"
@@ -1,4 +1,5 @@
 import functools
+import html
 import logging
 from html.parser import HTMLParser
 from io import StringIO
@@ -36,16 +37,31 @@ def strip_tags(html):
     return s.get_data()
 
 
+def strip_tags_once(string):
+    # Without any "<" the parser would only unescape the string
+    if "<" not in string:
+        return html.unescape(string)
+    # This is a workaround, since HTMLParser expects valid markup
+    return strip_tags(f"<tag>{string}<tag>")
+
+
 def stripper(string):
-    # Deal with HTML and HTML Encoded Characters
-    string = strip_tags(
-        f"<tag>{string}<tag>"
-    )  # This is a workaround, since HTMLParser expects valid markup
-    string = strip_tags(
-        f"<tag>{string}<tag>"
-    )  # This is another workaround, handles "&amp;amp;"
-
-    return string
+    if type(string) is not str:
+        # Deal with HTML and HTML Encoded Characters
+        string = strip_tags(
+            f"<tag>{string}<tag>"
+        )  # This is a workaround, since HTMLParser expects valid markup
+        string = strip_tags(
+            f"<tag>{string}<tag>"
+        )  # This is another workaround, handles "&amp;amp;"
+        return string
+
+    # Most strings carry neither tags nor entities
+    if "<" not in string and "&" not in string:
+        return string
+
+    # Run twice, which handles "&amp;amp;" and "&lt;p&gt;"
+    return strip_tags_once(strip_tags_once(string))
 
 
 class HTMLTagStripperPlugin(PluginInterface):
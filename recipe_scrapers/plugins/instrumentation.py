@@ -0,0 +1,209 @@
+import bisect
+import functools
+import logging
+import socket
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import NamedTuple, Optional
+
+from recipe_scrapers.settings import settings
+
+from ._interface import PluginInterface
+
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+
+
+class InstrumentationEvent(NamedTuple):
+    host: str
+    method: str
+    duration: float  # seconds
+    outcome: str  # "ok" or "error"
+    exception_type: Optional[str] = None
+
+
+class InstrumentationPlugin(PluginInterface):
+    """
+    Time every scraper method call and report it as an InstrumentationEvent
+    to each of the callables listed in settings.INSTRUMENTATION_SINKS.
+
+    The plugin is not enabled by default. Add it as the outer-most plugin to
+    record what the caller observes, or right after ExceptionHandlingPlugin to
+    see exceptions before they are silenced:
+
+    PLUGINS = (InstrumentationPlugin,) + PLUGINS
+
+    With no sinks configured the calls are passed straight through.
+    """
+
+    run_on_hosts = ("*",)
+    run_on_methods = (
+        "author",
+        "canonical_url",
+        "site_name",
+        "language",
+        "title",
+        "ingredients",
+        "ingredient_groups",
+        "instructions",
+        "instructions_list",
+        "category",
+        "yields",
+        "description",
+        "total_time",
+        "cook_time",
+        "prep_time",
+        "cuisine",
+        "cooking_method",
+        "ratings",
+        "ratings_count",
+        "equipment",
+        "reviews",
+        "nutrients",
+        "dietary_restrictions",
+        "image",
+        "keywords",
+        "links",
+        "to_json",
+    )
+
+    @classmethod
+    def run(cls, decorated):
+        @functools.wraps(decorated)
+        def decorated_method_wrapper(self, *args, **kwargs):
+            sinks = settings.INSTRUMENTATION_SINKS
+            if not sinks:
+                return decorated(self, *args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                result = decorated(self, *args, **kwargs)
+            except Exception as e:
+                cls._emit(sinks, self, decorated, start, "error", type(e).__name__)
+                raise
+            cls._emit(sinks, self, decorated, start, "ok")
+            return result
+
+        return decorated_method_wrapper
+
+    @staticmethod
+    def _emit(sinks, scraper, decorated, start, outcome, exception_type=None):
+        event = InstrumentationEvent(
+            host=scraper.host(),
+            method=decorated.__name__,
+            duration=time.perf_counter() - start,
+            outcome=outcome,
+            exception_type=exception_type,
+        )
+        for sink in sinks:
+            try:
+                sink(event)
+            except Exception as e:
+                logger.warning(f"Instrumentation sink {sink!r} failed: {str(e)}")
+
+
+# Upper bounds (in seconds) of the histogram buckets; the last one is +Inf
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class HistogramAggregator:
+    """
+    In-process sink that aggregates events into per (host, method) duration
+    histograms and outcome counters.
+
+    Can be rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event: InstrumentationEvent):
+        key = (event.host, event.method)
+        bucket = bisect.bisect_left(self.buckets, event.duration)
+        outcome = event.exception_type or event.outcome
+        with self._lock:
+            self.bucket_counts[key][bucket] += 1
+            self.durations[key] += event.duration
+            self.outcomes[key][outcome] += 1
+
+    def reset(self):
+        with self._lock:
+            self.bucket_counts = defaultdict(lambda: [0] * (len(self.buckets) + 1))
+            self.durations = defaultdict(float)
+            self.outcomes = defaultdict(Counter)
+
+    def to_prometheus(self, prefix="recipe_scrapers"):
+        lines = [
+            f"# TYPE {prefix}_method_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (host, method), counts in sorted(self.bucket_counts.items()):
+                labels = f'host="{host}",method="{method}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'{prefix}_method_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                    )
+                lines.append(
+                    f"{prefix}_method_duration_seconds_sum{{{labels}}} {self.durations[(host, method)]!r}"
+                )
+                lines.append(
+                    f"{prefix}_method_duration_seconds_count{{{labels}}} {cumulative}"
+                )
+
+            lines.append(f"# TYPE {prefix}_method_calls_total counter")
+            for (host, method), outcomes in sorted(self.outcomes.items()):
+                for outcome, count in sorted(outcomes.items()):
+                    lines.append(
+                        f'{prefix}_method_calls_total{{host="{host}",method="{method}",outcome="{outcome}"}} {count}'
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="recipe_scrapers"):
+        """Write the Prometheus text format, e.g. for node_exporter's textfile collector."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix=prefix))
+
+
+class StatsDSink:
+    """
+    Sink that formats every event as StatsD lines: a timer for the duration
+    and a counter for the outcome.
+
+    Lines are sent over UDP to the given address, or written to the given
+    file object instead when one is provided.
+    """
+
+    def __init__(
+        self, address=("localhost", 8125), prefix="recipe_scrapers", file=None
+    ):
+        self.address = address
+        self.prefix = prefix
+        self.file = file
+        self._socket = None
+        if file is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def format(self, event: InstrumentationEvent) -> str:
+        name = f"{self.prefix}.{event.host.replace('.', '_')}.{event.method}"
+        outcome = event.exception_type or event.outcome
+        return (
+            f"{name}.duration:{event.duration * 1000:.3f}|ms\n"
+            f"{name}.{outcome}:1|c\n"
+        )
+
+    def __call__(self, event: InstrumentationEvent):
+        lines = self.format(event)
+        if self.file is not None:
+            self.file.write(lines)
+        else:
+            self._socket.sendto(lines.encode("utf-8"), self.address)
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
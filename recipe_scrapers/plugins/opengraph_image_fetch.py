@@ -43,9 +43,7 @@ class OpenGraphImageFetchPlugin(PluginInterface):
                 logger.info(
                     f"{class_name}.{method_name}() did not manage to find recipe image. OpenGraphImageFetchPlugin will attempt to do its magic."
                 )
-                image = self.soup.find(
-                    "meta", {"property": "og:image", "content": True}
-                )
+                image = self.metadata.meta("property", "og:image", content=True)
                 return image.get("content") if image else None
 
         return decorated_method_wrapper
@@ -0,0 +1,62 @@
+import functools
+
+from ._interface import PluginInterface
+
+
+class TimeBudgetPlugin(PluginInterface):
+    """
+    Enforce settings.FIELD_TIME_BUDGET and settings.SCRAPE_TIME_BUDGET.
+
+    A scraper method is not called once the scrape budget is spent, and one
+    that runs over a budget raises ScrapeLimitExceeded instead of returning
+    its result. The outer-most plugin, so that the time of the other plugins
+    is counted, and that ExceptionHandlingPlugin does not silence it.
+
+    With no budgets configured the calls are passed straight through.
+    """
+
+    run_on_hosts = ("*",)
+    run_on_methods = (
+        "author",
+        "canonical_url",
+        "site_name",
+        "language",
+        "title",
+        "ingredients",
+        "ingredient_groups",
+        "instructions",
+        "instructions_list",
+        "category",
+        "yields",
+        "description",
+        "total_time",
+        "cook_time",
+        "prep_time",
+        "cuisine",
+        "cooking_method",
+        "ratings",
+        "ratings_count",
+        "equipment",
+        "reviews",
+        "nutrients",
+        "dietary_restrictions",
+        "image",
+        "keywords",
+        "links",
+    )
+
+    @classmethod
+    def run(cls, decorated):
+        @functools.wraps(decorated)
+        def decorated_method_wrapper(self, *args, **kwargs):
+            limits = self.limits
+            if not limits.timed:
+                return decorated(self, *args, **kwargs)
+
+            limits.check_time()
+            with limits.field():
+                result = decorated(self, *args, **kwargs)
+                limits.check_time()
+            return result
+
+        return decorated_method_wrapper
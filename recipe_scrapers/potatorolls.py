@@ -13,7 +13,7 @@ class PotatoRolls(AbstractScraper):
         return "Martin's Famous Potato Rolls and Bread"
 
     def ingredients(self):
-        ingredient_blocks = self.soup.select(
+        ingredient_blocks = self.select(
             'div[itemprop="ingredients recipeIngredient"] .ingredient p'
         )
         ingredients = [
@@ -33,7 +33,7 @@ class PotatoRolls(AbstractScraper):
         )
 
     def instructions(self):
-        instructions = self.soup.select('div[itemprop="recipeInstructions"] p')
+        instructions = self.select('div[itemprop="recipeInstructions"] p')
 
         return "\n".join(
             [normalize_string(instruction.get_text()) for instruction in instructions]
@@ -36,7 +36,7 @@ class ProjectGezond(AbstractScraper):
 
     def nutrients(self):
         nutrient_info = {}
-        nutrient_elements = self.soup.select("details.nutritions div.nutrition")
+        nutrient_elements = self.select("details.nutritions div.nutrition")
         for element in nutrient_elements:
             key = element.get("itemprop")
             value = element.find("dt").get_text(strip=True)
@@ -3,6 +3,8 @@ from ._utils import get_minutes
 
 
 class RachlMansfield(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "rachlmansfield.com"
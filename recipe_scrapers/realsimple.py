@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class RealSimple(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "realsimple.com"
@@ -1,6 +1,6 @@
 from ._abstract import AbstractScraper
-from ._grouping_utils import group_ingredients
 from ._utils import get_equipment
+from ._wprm import wprm_ingredient_groups
 
 
 class SavoryNothings(AbstractScraper):
@@ -8,24 +8,18 @@ class SavoryNothings(AbstractScraper):
     def host(cls):
         return "savorynothings.com"
 
-    def ingredient_groups(self):
-        return group_ingredients(
-            self.ingredients(),
-            self.soup,
-            ".wprm-recipe-ingredient-group h4",
-            ".wprm-recipe-ingredient",
-        )
+    ingredient_groups = wprm_ingredient_groups
 
     def equipment(self):
         equipment_items = [
             link.get_text()
-            for link in self.soup.select(
+            for link in self.select(
                 "div.wprm-recipe-equipment-name a.wprm-recipe-equipment-link"
             )
         ]
         equipment_items += [
             item.get_text()
-            for item in self.soup.select(
+            for item in self.select(
                 "div.wprm-recipe-equipment-name:not(:has(a.wprm-recipe-equipment-link))"
             )
         ]
@@ -6,12 +6,14 @@ from recipe_scrapers.plugins import (
     OpenGraphImageFetchPlugin,
     SchemaOrgFillPlugin,
     StaticValueExceptionHandlingPlugin,
+    TimeBudgetPlugin,
 )
 
 # Plugins to be attached.
 # The upper most plugin is the "outer most" executed.
 # Check recipe_scrapers.settings.template.py for ways to extend.
 PLUGINS = (
+    TimeBudgetPlugin,
     ExceptionHandlingPlugin,
     StaticValueExceptionHandlingPlugin,
     HTMLTagStripperPlugin,
@@ -40,6 +42,16 @@ ON_EXCEPTION_RETURN_VALUES = {
     "nutrients": None,
 }
 
+# Limits protecting against very large or pathological pages; None disables a
+# limit. Going over one raises ScrapeLimitExceeded, see recipe_scrapers._limits
+# size of the page HTML in UTF-8 bytes, checked when the scraper is created
+MAX_HTML_BYTES = None
+# number of elements built when parsing the page
+MAX_ELEMENTS = None
+# seconds a single scraper method may take, see TimeBudgetPlugin
+FIELD_TIME_BUDGET = None
+# seconds a scraper may take from its creation
+SCRAPE_TIME_BUDGET = None
 
 # logging.DEBUG     # 10
 # logging.INFO      # 20
@@ -48,3 +60,8 @@ ON_EXCEPTION_RETURN_VALUES = {
 # logging.CRITICAL  # 50
 # https://docs.python.org/3/howto/logging.html
 LOG_LEVEL = 30
+
+# Applicable only if InstrumentationPlugin is added to PLUGINS, otherwise ignored
+# callables receiving an InstrumentationEvent for every scraper method call,
+# e.g. recipe_scrapers.plugins.instrumentation.HistogramAggregator()
+INSTRUMENTATION_SINKS = ()
@@ -11,3 +11,18 @@ SUPPRESS_EXCEPTIONS = True
 # PLUGINS = (
 #     "path.to.my.custom_plugin",
 # ) + PLUGINS
+
+
+# Time every scraper method and aggregate the results in-process:
+# from recipe_scrapers.plugins import InstrumentationPlugin
+# from recipe_scrapers.plugins.instrumentation import HistogramAggregator
+#
+# PLUGINS = (InstrumentationPlugin,) + PLUGINS
+# INSTRUMENTATION_SINKS = (HistogramAggregator(),)
+
+
+# Bound the size of the pages scraped and the time spent on them:
+# MAX_HTML_BYTES = 10 * 1024 * 1024
+# MAX_ELEMENTS = 100_000
+# FIELD_TIME_BUDGET = 0.5
+# SCRAPE_TIME_BUDGET = 2.0
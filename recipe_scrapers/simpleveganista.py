@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class SimpleVeganista(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "simple-veganista.com"
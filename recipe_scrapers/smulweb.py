@@ -4,6 +4,8 @@ from ._abstract import AbstractScraper
 
 
 class Smulweb(AbstractScraper):
+    parse_regions = ()
+
     instruction_delimiter = re.compile(r"(\.|\))\s*([A-Z])")
 
     @classmethod
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class SouthernCastIron(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls, domain="southerncastiron.com"):
         return domain
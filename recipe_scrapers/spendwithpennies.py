@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class SpendWithPennies(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "spendwithpennies.com"
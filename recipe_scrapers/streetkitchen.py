@@ -14,7 +14,7 @@ class StreetKitchen(AbstractScraper):
         return self.soup.find("h1", {"class": "entry-title"}).text
 
     def total_time(self):
-        items = self.soup.select(".the-content-div li")
+        items = self.select(".the-content-div li")
         total_time = 0
         for item in items:
             total_time += get_minutes(item.text) or 0
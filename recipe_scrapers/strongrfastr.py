@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class StrongrFastr(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "strongrfastr.com"
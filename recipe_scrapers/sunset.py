@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Sunset(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "sunset.com"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class SweetPeasAndSaffron(AbstractScraper):
+    parse_regions = ()
+
     """
     Web scraper for Sweet Peas & Saffron website
     """
@@ -3,6 +3,8 @@ from ._utils import normalize_string
 
 
 class TasteAtlas(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "tasteatlas.com"
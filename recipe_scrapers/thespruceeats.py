@@ -8,7 +8,7 @@ class TheSpruceEats(AbstractScraper):
         return "thespruceeats.com"
 
     def ingredients(self):
-        ingredients = self.soup.select("li.structured-ingredients__list-item p")
+        ingredients = self.select("li.structured-ingredients__list-item p")
         extracted_ingredients = []
         for ingredient in ingredients:
             extracted_ingredients.append(normalize_string(ingredient.text))
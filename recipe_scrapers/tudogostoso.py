@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class TudoGostoso(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "tudogostoso.com.br"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class VarechaPravdaSK(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "varecha.pravda.sk"
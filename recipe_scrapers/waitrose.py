@@ -12,7 +12,7 @@ class Waitrose(AbstractScraper):
         raise StaticValueException(return_value="Waitrose")
 
     def site_name(self):
-        logo = next(iter(self.soup.select("div.logo")), None)
+        logo = next(iter(self.select("div.logo")), None)
         if not logo:
             raise StaticValueException(return_value="Waitrose")
         if home_link := logo.find("a", {"href": "/"}):
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class WholeFoods(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls, domain="com"):
         return f"wholefoodsmarket.{domain}"
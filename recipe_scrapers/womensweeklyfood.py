@@ -4,6 +4,8 @@ from ._abstract import AbstractScraper
 
 
 class WomensWeeklyFood(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "womensweeklyfood.com.au"
@@ -2,6 +2,8 @@ from ._abstract import AbstractScraper
 
 
 class Yemek(AbstractScraper):
+    parse_regions = ()
+
     @classmethod
     def host(cls):
         return "yemek.com"
@@ -23,7 +23,7 @@ class ZeitWochenmarkt(AbstractScraper):
 
     def ingredients(self):
         ingredients = []
-        for div_element in self.soup.select(".recipe-list-collection"):
+        for div_element in self.select(".recipe-list-collection"):
             special_ingredients = div_element.select(
                 ".recipe-list-collection__special-ingredient"
             )
@@ -0,0 +1,602 @@
+"""
+Replays every .testhtml file in tests/test_data and times each scraping phase.
+
+Usage (from the repository root):
+
+    python scripts/benchmark.py run --output before.json
+    # ... make some changes ...
+    python scripts/benchmark.py run --output after.json
+    python scripts/benchmark.py compare before.json after.json
+
+Phases recorded for every fixture:
+
+- parse: building the BeautifulSoup tree, which the fields needing it
+  trigger, so that it is also part of their timings
+- schema: extruct extraction and SchemaOrg setup
+- plugins: wiring settings.PLUGINS onto the scraper class
+- init: the remaining scraper construction time
+- fields: every public scraper method, timed individually
+- to_json: a complete to_json() call
+
+The memory command reports, for every fixture, the memory that a scraper
+leaves behind once it is released without a garbage collection pass, both
+with and without calling close() first:
+
+    python scripts/benchmark.py memory --output memory.json
+
+The micro command times a single helper against inputs harvested from the
+expected .json outputs of the test corpus:
+
+    python scripts/benchmark.py micro normalize_string
+    python scripts/benchmark.py micro html_tags_stripper
+
+Timings of fuzzed inputs are also reported per input length, which makes
+super-linear behaviour stand out as a growing cost per character or ingredient:
+
+    python scripts/benchmark.py micro parse_time_units --by-length
+    python scripts/benchmark.py micro group_ingredients --by-length
+
+The wprm_lookups_soup and wprm_lookups_dom entries run the same element
+lookups on the WP Recipe Maker pages of the corpus, through soup.find_all()
+and through a freshly built DOMIndex respectively.
+
+The json_loads and json_dumps_bytes entries decode the JSON-LD scripts and
+encode the expected .json outputs of the corpus with the JSON backend of the
+library, and json_loads_stdlib and json_dumps_stdlib with the json module,
+for comparison.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import warnings
+from collections import defaultdict
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers import SCRAPERS, _abstract
+from recipe_scrapers.__version__ import __version__
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._dom import DOMIndex
+from recipe_scrapers._factory import SchemaScraperFactory
+from recipe_scrapers._grouping_utils import group_ingredients
+from recipe_scrapers._json import dumps_bytes, loads
+from recipe_scrapers._schemaorg import SchemaOrg
+from recipe_scrapers._utils import (
+    get_abstract_methods,
+    normalize_string,
+    parse_time_units,
+)
+from recipe_scrapers.plugins.html_tags_stripper import stripper
+
+TEST_DATA_DIR = Path("tests/test_data")
+REPORT_VERSION = 1
+
+
+class PhaseTimer:
+    """Accumulates the time spent inside wrapped callables, keyed by phase."""
+
+    def __init__(self):
+        self.timings = defaultdict(float)
+
+    def wrap(self, phase, func):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.timings[phase] += time.perf_counter() - start
+
+        return timed
+
+    def reset(self):
+        self.timings.clear()
+
+
+def install_timers(timer):
+    _abstract.BeautifulSoup = timer.wrap("parse", _abstract.BeautifulSoup)
+    SchemaOrg.__init__ = timer.wrap("schema", SchemaOrg.__init__)
+    AbstractScraper._attach_plugins = timer.wrap(
+        "plugins", AbstractScraper._attach_plugins
+    )
+
+
+def iter_fixtures(host_filter=None):
+    for testhtml in sorted(TEST_DATA_DIR.glob("*/*.testhtml")):
+        host = testhtml.parent.name
+        if host_filter and host_filter not in host:
+            continue
+        yield host, testhtml
+
+
+def fresh_scraper_class(host):
+    # A throwaway subclass has no 'plugins_initialized' flag of its own, so
+    # every replay pays (and measures) the plugin wiring cost.
+    scraper_class = SCRAPERS.get(host, SchemaScraperFactory.SchemaScraper)
+    return type(scraper_class.__name__, (scraper_class,), {})
+
+
+def replay(timer, host, html):
+    timer.reset()
+    phases = {}
+    outcomes = {}
+
+    start = time.perf_counter()
+    scraper = fresh_scraper_class(host)(html=html, url=host)
+    # the schema is otherwise built on first use
+    scraper.schema
+    init = time.perf_counter() - start
+    phases["schema"] = timer.timings["schema"]
+    phases["plugins"] = timer.timings["plugins"]
+    phases["init"] = max(0.0, init - sum(phases.values()))
+
+    fields = {}
+    for method in get_abstract_methods():
+        start = time.perf_counter()
+        try:
+            getattr(scraper, method)()
+            outcomes[method] = "ok"
+        except Exception as e:
+            outcomes[method] = type(e).__name__
+        fields[method] = time.perf_counter() - start
+    phases["fields"] = fields
+    # the page is parsed by the first fields that need it, or only its
+    # <head> is, see AbstractScraper.metadata
+    phases["parse"] = timer.timings["parse"]
+
+    start = time.perf_counter()
+    scraper.to_json()
+    phases["to_json"] = time.perf_counter() - start
+
+    phases["total"] = init + sum(fields.values()) + phases["to_json"]
+    return phases, outcomes
+
+
+def merge_fastest(best, phases):
+    """Keep the fastest observation of every phase across repeats."""
+    if best is None:
+        return phases
+    for phase, value in phases.items():
+        if isinstance(value, dict):
+            merge_fastest(best[phase], value)
+        else:
+            best[phase] = min(best[phase], value)
+    return best
+
+
+def run(args):
+    timer = PhaseTimer()
+    install_timers(timer)
+
+    results = {}
+    for host, testhtml in iter_fixtures(args.host):
+        html = testhtml.read_text(encoding="utf-8")
+        best, outcomes = None, {}
+        for _ in range(args.repeat):
+            phases, outcomes = replay(timer, host, html)
+            best = merge_fastest(best, phases)
+
+        key = testhtml.relative_to(TEST_DATA_DIR).as_posix()
+        results[key] = {"host": host, "phases": best, "outcomes": outcomes}
+        if args.verbose:
+            print(f"{best['total'] * 1000:9.2f} ms  {key}", file=sys.stderr)
+
+    write_report(
+        args.output,
+        {
+            "version": REPORT_VERSION,
+            "python": platform.python_version(),
+            "recipe_scrapers": __version__,
+            "repeat": args.repeat,
+            "results": results,
+        },
+    )
+
+
+def retained_memory(host, html, close):
+    scraper_class = SCRAPERS.get(host, SchemaScraperFactory.SchemaScraper)
+    scraper_class(html=html, url=host).to_json()  # warm up class-level caches
+
+    gc.collect()
+    gc.disable()
+    try:
+        tracemalloc.start()
+        scraper = scraper_class(html=html, url=host)
+        result = scraper.to_json()
+        if close:
+            scraper.close()
+        del scraper
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    del result
+    return retained, peak
+
+
+def memory(args):
+    results = {}
+    for host, testhtml in iter_fixtures(args.host):
+        html = testhtml.read_text(encoding="utf-8")
+        retained, peak = retained_memory(host, html, close=False)
+        retained_closed, _ = retained_memory(host, html, close=True)
+
+        key = testhtml.relative_to(TEST_DATA_DIR).as_posix()
+        results[key] = {
+            "host": host,
+            "html_bytes": len(html.encode("utf-8")),
+            "peak": peak,
+            "retained": retained,
+            "retained_after_close": retained_closed,
+        }
+        if args.verbose:
+            print(
+                f"{retained / 1e6:8.2f} MB -> {retained_closed / 1e6:8.2f} MB  {key}",
+                file=sys.stderr,
+            )
+
+    summary = {
+        name: sum(result[name] for result in results.values())
+        for name in ("html_bytes", "peak", "retained", "retained_after_close")
+    }
+    write_report(
+        args.output,
+        {
+            "version": REPORT_VERSION,
+            "python": platform.python_version(),
+            "recipe_scrapers": __version__,
+            "summary": summary,
+            "results": results,
+        },
+    )
+
+
+def corpus_strings():
+    """Every string found in the expected .json outputs of the test corpus."""
+
+    def walk(value):
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                yield from walk(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                yield key
+                yield from walk(item)
+
+    strings = []
+    for testjson in sorted(TEST_DATA_DIR.glob("*/*.json")):
+        with open(testjson, encoding="utf-8") as f:
+            strings.extend(walk(json.load(f)))
+    return strings
+
+
+def ingredient_strings():
+    """Every ingredient line, plus titles and instructions, of the test corpus."""
+    strings = []
+    for testjson in sorted(TEST_DATA_DIR.glob("*/*.json")):
+        with open(testjson, encoding="utf-8") as f:
+            expected = json.load(f)
+        strings.extend(expected.get("ingredients", []))
+        strings.extend(
+            expected[field]
+            for field in ("title", "instructions")
+            if isinstance(expected.get(field), str)
+        )
+    return strings
+
+
+def dirty_strings():
+    """Corpus strings, plus variants with the markup that scrapers often see."""
+    strings = corpus_strings()
+    return strings + [
+        f"<p>\n\t{string} &amp;\xa0more\u200b</p>\r\n" for string in strings
+    ]
+
+
+DURATION_FRAGMENTS = (
+    "1", "25", " ", ".", "/", "½", "h", "hrs", "hours", "min", "m", ":",
+    "s", "secs", "days", "óra", "perc", "about", "-", "\n", "cook for",
+)  # fmt: skip
+
+
+def fuzzed_durations():
+    """Random duration-like strings from 16 characters up to 64 KB."""
+    rng = random.Random(0)
+    strings = []
+    length = 16
+    while length <= 65536:
+        for _ in range(max(1, 4096 // length)):
+            text = ""
+            while len(text) < length:
+                text += rng.choice(DURATION_FRAGMENTS)
+            strings.append(text[:length])
+        # runs of separators and non-digits are the worst case for backtracking
+        strings.append(" " * (length - 1) + "1")
+        strings.append("." * length)
+        strings.append("no numbers here " * (length // 16))
+        length *= 4
+    return strings
+
+
+class IngredientPage(list):
+    """Ingredients of a generated WP Recipe Maker page, parsed into soup."""
+
+    heading = ".wprm-recipe-group-name"
+    element = ".wprm-recipe-ingredient"
+
+    def __init__(self, ingredients, group_size=10):
+        super().__init__(ingredients)
+        groups = []
+        for start in range(0, len(ingredients), group_size):
+            items = "".join(
+                f'<li class="wprm-recipe-ingredient">{ingredient}</li>'
+                for ingredient in ingredients[start : start + group_size]
+            )
+            groups.append(
+                '<div class="wprm-recipe-ingredient-group">'
+                f'<h4 class="wprm-recipe-group-name">Group {start // group_size}</h4>'
+                f"<ul>{items}</ul></div>"
+            )
+        self.soup = BeautifulSoup(
+            f"<html><body>{''.join(groups)}</body></html>", "html.parser"
+        )
+
+
+def ingredient_pages():
+    """Pages of 15 up to 480 ingredients, drawn from the corpus ingredients."""
+    rng = random.Random(0)
+    ingredients = sorted(
+        {
+            normalize_string(ingredient)
+            for ingredient in ingredient_strings()
+            if len(ingredient) < 120
+        }
+    )
+    return [
+        IngredientPage(rng.sample(ingredients, count))
+        for count in (15, 30, 60, 120, 240, 480)
+    ]
+
+
+def group_page_ingredients(page):
+    return group_ingredients(page, page.soup, page.heading, page.element)
+
+
+# (tag name, class) lookups made by the scrapers of WP Recipe Maker hosts
+WPRM_LOOKUPS = (
+    ("li", "wprm-recipe-ingredient"),
+    ("div", "wprm-recipe-ingredient-group"),
+    (None, "wprm-recipe-group-name"),
+    (None, "wprm-recipe-instruction-text"),
+    (None, "wprm-recipe-equipment-name"),
+    (None, "wprm-recipe-name"),
+    (None, "wprm-recipe-servings"),
+    ("a", None),
+)
+
+
+def wprm_pages():
+    """The parsed pages of the corpus that contain a WP Recipe Maker card."""
+    pages = []
+    for testhtml in sorted(TEST_DATA_DIR.glob("*/*.testhtml")):
+        html = testhtml.read_text(encoding="utf-8")
+        if "wprm-recipe-container" in html:
+            pages.append(BeautifulSoup(html, "html.parser"))
+    return pages
+
+
+def wprm_lookups_soup(soup):
+    for name, class_ in WPRM_LOOKUPS:
+        if class_ is None:
+            soup.find_all(name)
+        else:
+            soup.find_all(name, class_=class_)
+
+
+def wprm_lookups_dom(soup):
+    dom = DOMIndex(soup)
+    for name, class_ in WPRM_LOOKUPS:
+        dom.find_all(name, class_=class_)
+
+
+def json_ld_scripts():
+    """The contents of the JSON-LD scripts of the corpus that are valid JSON."""
+    scripts = []
+    for testhtml in sorted(TEST_DATA_DIR.glob("*/*.testhtml")):
+        soup = BeautifulSoup(testhtml.read_text(encoding="utf-8"), "html.parser")
+        for script in soup.find_all("script", type="application/ld+json"):
+            try:
+                json.loads(script.string or "", strict=False)
+            except ValueError:
+                continue
+            scripts.append(script.string)
+    return scripts
+
+
+def expected_outputs():
+    """The expected .json outputs of the corpus, decoded."""
+    outputs = []
+    for testjson in sorted(TEST_DATA_DIR.glob("*/*.json")):
+        with open(testjson, encoding="utf-8") as f:
+            outputs.append(json.load(f))
+    return outputs
+
+
+def json_loads_stdlib(script):
+    return json.loads(script, strict=False)
+
+
+def json_dumps_stdlib(value):
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+# name -> (function under test, callable returning its inputs)
+MICRO_BENCHMARKS = {
+    "normalize_string": (normalize_string, dirty_strings),
+    "html_tags_stripper": (stripper, ingredient_strings),
+    "parse_time_units": (parse_time_units, fuzzed_durations),
+    "group_ingredients": (group_page_ingredients, ingredient_pages),
+    "wprm_lookups_soup": (wprm_lookups_soup, wprm_pages),
+    "wprm_lookups_dom": (wprm_lookups_dom, wprm_pages),
+    "json_loads": (lambda script: loads(script, strict=False), json_ld_scripts),
+    "json_loads_stdlib": (json_loads_stdlib, json_ld_scripts),
+    "json_dumps_bytes": (dumps_bytes, expected_outputs),
+    "json_dumps_stdlib": (json_dumps_stdlib, expected_outputs),
+}
+
+
+def micro(args):
+    func, make_inputs = MICRO_BENCHMARKS[args.name]
+    inputs = make_inputs()
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+
+    print(
+        f"{args.name}: {len(inputs)} calls in {best * 1000:.2f} ms "
+        f"({best / len(inputs) * 1e6:.3f} us/call, best of {args.repeat})"
+    )
+
+    if args.by_length:
+        by_length = defaultdict(float)
+        for value in inputs:
+            duration = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                func(value)
+                duration = min(duration, time.perf_counter() - start)
+            by_length[len(value)] = max(by_length[len(value)], duration)
+        for length, duration in sorted(by_length.items()):
+            print(
+                f"len {length:8d}: {duration * 1e6:10.1f} us "
+                f"({duration / max(length, 1) * 1e9:7.1f} ns per unit of len)"
+            )
+
+
+def write_report(output, report):
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+
+
+def host_totals(report):
+    totals = defaultdict(lambda: defaultdict(float))
+    for result in report["results"].values():
+        host_total = totals[result["host"]]
+        for phase, value in result["phases"].items():
+            if isinstance(value, dict):
+                for field, duration in value.items():
+                    host_total[f"fields.{field}"] += duration
+                value = sum(value.values())
+            host_total[phase] += value
+    return totals
+
+
+def compare(args):
+    with open(args.base, encoding="utf-8") as f:
+        base = host_totals(json.load(f))
+    with open(args.new, encoding="utf-8") as f:
+        new = host_totals(json.load(f))
+
+    regressions = []
+    for host in sorted(base.keys() & new.keys()):
+        for phase in sorted(base[host].keys() & new[host].keys()):
+            before, after = base[host][phase], new[host][phase]
+            if after - before < args.min_delta:
+                continue
+            if before and after / before < args.threshold:
+                continue
+            regressions.append((host, phase, before, after))
+
+    base_total = sum(totals["total"] for totals in base.values())
+    new_total = sum(totals["total"] for totals in new.values())
+    print(f"corpus total: {base_total:.3f}s -> {new_total:.3f}s")
+
+    for host, phase, before, after in regressions:
+        ratio = f"{after / before:.2f}x" if before else "new"
+        print(
+            f"REGRESSION {host} {phase}: "
+            f"{before * 1000:.2f} ms -> {after * 1000:.2f} ms ({ratio})"
+        )
+
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="replay the test corpus")
+    run_parser.add_argument("--output", "-o", help="write the report to this file")
+    run_parser.add_argument("--repeat", "-r", type=int, default=3)
+    run_parser.add_argument("--host", help="only replay hosts containing this text")
+    run_parser.add_argument("--verbose", "-v", action="store_true")
+
+    memory_parser = subparsers.add_parser(
+        "memory", help="measure memory retained by scrapers"
+    )
+    memory_parser.add_argument("--output", "-o", help="write the report to this file")
+    memory_parser.add_argument("--host", help="only replay hosts containing this text")
+    memory_parser.add_argument("--verbose", "-v", action="store_true")
+
+    micro_parser = subparsers.add_parser(
+        "micro", help="time a single helper on corpus strings"
+    )
+    micro_parser.add_argument("name", choices=sorted(MICRO_BENCHMARKS))
+    micro_parser.add_argument("--repeat", "-r", type=int, default=5)
+    micro_parser.add_argument(
+        "--by-length",
+        action="store_true",
+        help="also report the slowest input of every length",
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="compare two reports")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio that counts as a regression (default: 1.25)",
+    )
+    compare_parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.002,
+        help="ignore slowdowns smaller than this many seconds (default: 0.002)",
+    )
+
+    args = parser.parse_args(argv)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if args.command == "run":
+            run(args)
+            return 0
+        if args.command == "memory":
+            memory(args)
+            return 0
+        if args.command == "micro":
+            micro(args)
+            return 0
+        return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -89,7 +89,8 @@ def test_func_factory(
             )
         supported_only = host in SCRAPERS
         actual = scrape_html(
-            html=testhtml.read_text(encoding="utf-8"),
+            html=testhtml,
+            encoding="utf-8",
             org_url=host,
             online=False,
             supported_only=supported_only,
@@ -0,0 +1,87 @@
+import unittest
+
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._app_state import AppState
+
+HTML = """
+<html>
+<head>
+  <!-- <script id="__NEXT_DATA__">{"commented": true}</script> -->
+  <script src="/app.js" data-note='a > b' id="app-js"></script>
+  <script id="ignored" id="__NEXT_DATA__" type="application/json">{"props": {"pageProps": {"recipe": {"title": "Pancakes"}}}}</script>
+  <script id="__NEXT_DATA__">{"second": true}</script>
+  <SCRIPT ID='__NUXT_DATA__' type="application/json">[{"state": 1}, "Pancakes"]</SCRIPT>
+  <script>window.__INITIAL_STATE__ = {"recipe": {"servings": 4}};</script>
+  <script>window["__APOLLO_STATE__"]={"ROOT_QUERY":{}}</script>
+  <script>window.__NUXT__=(function(a){return {data:[a]}}(1));</script>
+</head>
+<body></body>
+</html>
+"""
+
+
+class TestAppState(unittest.TestCase):
+    def setUp(self):
+        self.app_state = AppState(HTML)
+
+    def test_next_data(self):
+        self.assertEqual(
+            {"props": {"pageProps": {"recipe": {"title": "Pancakes"}}}},
+            self.app_state.next_data(),
+        )
+        self.assertIs(self.app_state.next_data(), self.app_state.next_data())
+
+    def test_nuxt_data(self):
+        self.assertEqual([{"state": 1}, "Pancakes"], self.app_state.nuxt_data())
+
+    def test_script(self):
+        self.assertEqual("", self.app_state.script("app-js"))
+        self.assertIsNone(self.app_state.script("ignored"))
+        self.assertIsNone(self.app_state.script("missing"))
+        self.assertIsNone(self.app_state.script_json("missing"))
+
+    def test_window_global(self):
+        self.assertEqual(
+            {"recipe": {"servings": 4}},
+            self.app_state.window_global("__INITIAL_STATE__"),
+        )
+        self.assertEqual(
+            {"ROOT_QUERY": {}}, self.app_state.window_global("__APOLLO_STATE__")
+        )
+        self.assertIsNone(self.app_state.window_global("__MISSING__"))
+        with self.assertRaises(ValueError):
+            self.app_state.window_global("__NUXT__")
+
+    def test_window_global_only_in_scripts(self):
+        app_state = AppState(
+            "<html><body>"
+            '<!-- <script>window.__STATE__ = {"from": "comment"}</script> -->'
+            '<p>window.__STATE__ = {"from": "text"}</p>'
+            "<script>if (window.__STATE__ == null) {"
+            ' window.__STATE__ = {"from": "script"}; init(); }</script>'
+            "</body></html>"
+        )
+        self.assertEqual({"from": "script"}, app_state.window_global("__STATE__"))
+
+
+class AppStateScraper(AbstractScraper):
+    @classmethod
+    def host(cls):
+        return "example.com"
+
+    def title(self):
+        return self.app_state.next_data()["props"]["pageProps"]["recipe"]["title"]
+
+
+class TestLazySoup(unittest.TestCase):
+    def test_app_state_fields_do_not_parse_the_page(self):
+        scraper = AppStateScraper(HTML, "https://example.com/")
+        self.assertEqual("Pancakes", scraper.title())
+        self.assertNotIn("soup", scraper.__dict__)
+        self.assertNotIn("schema", scraper.__dict__)
+        scraper.close()
+
+    def test_soup_is_parsed_on_first_use(self):
+        scraper = AppStateScraper(HTML, "https://example.com/")
+        self.assertIs(scraper.soup, scraper.soup)
+        self.assertEqual("app-js", scraper.dom.find("script")["id"])
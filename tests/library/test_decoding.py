@@ -0,0 +1,119 @@
+import codecs
+import gzip
+import mmap
+import pathlib
+import tempfile
+import unittest
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers._decoding import decode_html, read_html, sniff_charset
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+PAGE = (
+    '<html><head><meta charset="utf-8"><title>Crème brûlée</title></head>'
+    "<body><h1>Crème brûlée</h1></body></html>"
+)
+
+
+class TestDecoding(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = pathlib.Path(directory.name)
+
+    def write(self, name, data):
+        path = self.directory / name
+        path.write_bytes(data)
+        return path
+
+    def test_str(self):
+        self.assertIs(PAGE, read_html(PAGE))
+
+    def test_bytes(self):
+        self.assertEqual(PAGE, read_html(PAGE.encode("utf-8")))
+        self.assertEqual(PAGE, read_html(bytearray(PAGE.encode("utf-8"))))
+
+    def test_byte_order_mark(self):
+        for bom, charset in (
+            (codecs.BOM_UTF8, "utf-8"),
+            (codecs.BOM_UTF16_LE, "utf-16-le"),
+            (codecs.BOM_UTF16_BE, "utf-16-be"),
+        ):
+            with self.subTest(charset):
+                # the byte order mark wins over the HTTP encoding
+                data = bom + PAGE.encode(charset)
+                self.assertEqual(PAGE, decode_html(data, encoding="cp1252"))
+
+    def test_meta_charset(self):
+        page = PAGE.replace("utf-8", "windows-1252")
+        self.assertEqual(page, decode_html(page.encode("cp1252")))
+
+        page = PAGE.replace(
+            '<meta charset="utf-8">',
+            '<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">',
+        )
+        self.assertEqual(page, decode_html(page.encode("latin-1")))
+
+    def test_http_encoding(self):
+        # the HTTP encoding wins over the declaration of the page
+        page = PAGE.replace("utf-8", "iso-8859-1")
+        self.assertEqual(page, decode_html(page.encode("utf-8"), encoding="utf-8"))
+        # unknown encodings are ignored
+        self.assertEqual(PAGE, decode_html(PAGE.encode("utf-8"), encoding="bogus"))
+
+    def test_sniff_charset(self):
+        self.assertEqual(("utf-8", 0), sniff_charset(b"<html></html>"))
+        # Latin-1 and ASCII pages are decoded as windows-1252
+        self.assertEqual(("cp1252", 0), sniff_charset(b"", encoding="latin-1"))
+        self.assertEqual(("cp1252", 0), sniff_charset(b"<meta charset=us-ascii>"))
+        # pages without a byte order mark are not UTF-16
+        self.assertEqual(("utf-8", 0), sniff_charset(b"<meta charset='utf-16'>"))
+        # nor are they in codecs that are not text encodings
+        self.assertEqual(("utf-8", 0), sniff_charset(b"<meta charset=base64>"))
+        # declarations after the first 1024 bytes are not looked for
+        self.assertEqual(
+            ("utf-8", 0), sniff_charset(b" " * 1024 + b"<meta charset=cp1252>")
+        )
+
+    def test_invalid_bytes(self):
+        self.assertEqual("caf�", decode_html(b"caf\xe9"))
+
+    def test_line_breaks(self):
+        self.assertEqual("a\nb\nc\n", decode_html(b"a\r\nb\rc\n"))
+
+    def test_file(self):
+        path = self.write("page.html", PAGE.encode("utf-8"))
+        self.assertEqual(PAGE, read_html(path))
+        self.assertEqual("", read_html(self.write("empty.html", b"")))
+
+    def test_mmap(self):
+        path = self.write("page.html", PAGE.encode("utf-8"))
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(PAGE, read_html(mapped))
+
+    def test_gzip(self):
+        data = gzip.compress(PAGE.encode("utf-8"))
+        self.assertEqual(PAGE, read_html(data))
+        self.assertEqual(PAGE, read_html(self.write("page.html.gz", data)))
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd(self):
+        data = zstandard.ZstdCompressor().compress(PAGE.encode("utf-8"))
+        self.assertEqual(PAGE, read_html(data))
+        self.assertEqual(PAGE, read_html(self.write("page.html.zst", data)))
+
+    def test_scrape_html(self):
+        page = PAGE.replace(
+            "</head>",
+            '<script type="application/ld+json">'
+            '{"@context": "https://schema.org", "@type": "Recipe",'
+            ' "name": "Crème brûlée"}</script></head>',
+        )
+        path = self.write("page.html", page.encode("utf-8"))
+        scraper = scrape_html(path, "https://example.com/", supported_only=False)
+        self.assertEqual("Crème brûlée", scraper.title())
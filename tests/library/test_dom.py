@@ -0,0 +1,204 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._dom import DOMIndex, RegionStrainer, SelectorCache
+
+HTML = """
+<html>
+<body>
+  <div id="recipe" class="wprm-recipe wprm-recipe-template">
+    <h2 class="wprm-recipe-name">Pancakes</h2>
+    <ul>
+      <li class="wprm-recipe-ingredient" data-uid="1">1 cup flour</li>
+      <li class="wprm-recipe-ingredient wprm-recipe-ingredient wide" data-uid="2">1 egg</li>
+      <li class="other">not an ingredient</li>
+    </ul>
+    <span class="wprm-recipe-ingredient">a span</span>
+    <a href="#">top</a>
+    <a>no link</a>
+  </div>
+</body>
+</html>
+"""
+
+SELECTORS = (
+    "li",
+    "LI",
+    ".wprm-recipe-ingredient",
+    "li.wprm-recipe-ingredient",
+    ".wprm-recipe-ingredient.wide",
+    "#recipe",
+    "div#recipe.wprm-recipe",
+    "#missing",
+    "ul > li",
+    "li[data-uid='2']",
+)
+
+
+class TestDOMIndex(unittest.TestCase):
+    def setUp(self):
+        self.soup = BeautifulSoup(HTML, "html.parser")
+        self.dom = DOMIndex(self.soup)
+
+    def test_select_matches_soup(self):
+        for selector in SELECTORS:
+            with self.subTest(selector=selector):
+                self.assertEqual(self.soup.select(selector), self.dom.select(selector))
+                self.assertIs(
+                    self.soup.select_one(selector), self.dom.select_one(selector)
+                )
+
+    def test_find_all_matches_soup(self):
+        self.assertEqual(
+            self.soup.find_all("li", class_="wprm-recipe-ingredient"),
+            self.dom.find_all("li", class_="wprm-recipe-ingredient"),
+        )
+        # a class string with spaces matches the whole class attribute
+        self.assertEqual(
+            self.soup.find_all(class_="wprm-recipe wprm-recipe-template"),
+            self.dom.find_all(class_="wprm-recipe wprm-recipe-template"),
+        )
+        self.assertEqual(
+            self.soup.find_all(attrs={"data-uid": True}),
+            self.dom.find_all(data={"data-uid": True}),
+        )
+        self.assertEqual(
+            self.soup.find_all("li", attrs={"data-uid": "2"}),
+            self.dom.find_all("li", data={"data-uid": "2"}),
+        )
+        self.assertEqual(self.soup.find(id="recipe"), self.dom.find(id="recipe"))
+        self.assertIsNone(self.dom.find("table"))
+
+    def test_repeated_class_is_indexed_once(self):
+        self.assertEqual(3, len(self.dom.find_all(class_="wprm-recipe-ingredient")))
+
+    def test_find_all_needs_a_criterion(self):
+        with self.assertRaises(ValueError):
+            self.dom.find_all()
+
+    def test_clear(self):
+        self.dom.find_all("li")
+        self.soup.find("ul").decompose()
+        self.assertEqual(3, len(self.dom.find_all("li")))
+        self.dom.clear()
+        self.assertEqual([], self.dom.find_all("li"))
+
+
+class TestSelectorCache(unittest.TestCase):
+    def test_compiles_once(self):
+        selectors = SelectorCache()
+        compiled = selectors["li.wprm-recipe-ingredient"]
+        self.assertIs(compiled, selectors["li.wprm-recipe-ingredient"])
+        soup = BeautifulSoup(HTML, "html.parser")
+        self.assertEqual(
+            soup.select("li.wprm-recipe-ingredient"), compiled.select(soup)
+        )
+
+    def test_scraper_classes_have_their_own_cache(self):
+        class FirstScraper(AbstractScraper):
+            @classmethod
+            def host(cls):
+                return "example.com"
+
+        class SecondScraper(FirstScraper):
+            pass
+
+        scraper = SecondScraper(HTML, "https://example.com/")
+        self.assertEqual(scraper.soup.select("ul > li"), scraper.select("ul > li"))
+        self.assertIs(
+            scraper.soup.select_one("#recipe h2"), scraper.select_one("#recipe h2")
+        )
+        self.assertIsNone(scraper.select_one("table"))
+        self.assertIn("ul > li", SecondScraper.selectors)
+        self.assertNotIn("ul > li", FirstScraper.selectors)
+        self.assertNotIn("ul > li", AbstractScraper.selectors)
+
+
+PAGE = """
+<!DOCTYPE html>
+<html lang="nl" class="no-js">
+<head>
+  <title>Pancakes</title>
+  <meta property="og:site_name" content="Example">
+  <link rel="canonical" href="https://example.com/pancakes">
+</head>
+<body>
+  <nav><a href="/menu">Menu</a></nav>
+  <div class="recipe-card wide"><h2>Pancakes</h2><a href="/flour">flour</a></div>
+  <div id="comments"><p>Tasty!</p></div>
+</body>
+</html>
+"""
+
+
+class TestRegionStrainer(unittest.TestCase):
+    def parse(self, regions):
+        strainer = RegionStrainer(regions)
+        soup = BeautifulSoup(PAGE, "html.parser", parse_only=strainer)
+        return strainer, soup
+
+    def test_parses_the_regions_and_the_metadata(self):
+        strainer, soup = self.parse(("div.recipe-card",))
+        self.assertTrue(strainer.found_regions(soup))
+        strainer.add_html_element(soup)
+        self.assertEqual(
+            ["html", "meta", "link", "div", "h2", "a"],
+            [element.name for element in soup.find_all()],
+        )
+        self.assertEqual("nl", soup.find("html")["lang"])
+        self.assertIsNone(soup.find(id="comments"))
+
+    def test_selectors(self):
+        for regions in ((".recipe-card.wide",), ("#comments",), ("div#comments",)):
+            with self.subTest(regions=regions):
+                strainer, soup = self.parse(regions)
+                self.assertTrue(strainer.found_regions(soup))
+                self.assertIsNone(soup.find("nav"))
+
+    def test_missing_region(self):
+        strainer, soup = self.parse(("div.recipe-card", "table.nutrition"))
+        self.assertFalse(strainer.found_regions(soup))
+
+    def test_unsupported_region(self):
+        for region in ("", "div > p", "[data-id]"):
+            with self.subTest(region=region):
+                with self.assertRaises(ValueError):
+                    RegionStrainer((region,))
+
+
+class RegionScraper(AbstractScraper):
+    parse_regions = ("div.recipe-card",)
+
+    @classmethod
+    def host(cls):
+        return "example.com"
+
+
+class TestParseRegions(unittest.TestCase):
+    def test_scraper_parses_its_regions(self):
+        scraper = RegionScraper(PAGE, "https://example.com/")
+        self.assertIsNone(scraper.region_soup.find("nav"))
+        self.assertEqual("Pancakes", scraper.select_one(".recipe-card h2").text)
+        self.assertNotIn("soup", scraper.__dict__)
+        self.assertEqual("nl", scraper.language())
+        self.assertEqual("https://example.com/pancakes", scraper.canonical_url())
+        # links come from the whole page
+        self.assertEqual(
+            ["/menu", "/flour"], [link["href"] for link in scraper.links()]
+        )
+
+    def test_scraper_parses_the_whole_page_on_a_miss(self):
+        class MissingRegionScraper(RegionScraper):
+            parse_regions = ("table.nutrition",)
+
+        scraper = MissingRegionScraper(PAGE, "https://example.com/")
+        self.assertIsNotNone(scraper.region_soup.find("nav"))
+        self.assertIs(scraper.soup, scraper.region_soup)
+
+    def test_soup_is_the_whole_page(self):
+        scraper = RegionScraper(PAGE, "https://example.com/")
+        scraper.select_one(".recipe-card h2")
+        self.assertIsNotNone(scraper.soup.find("nav"))
+        self.assertIsNone(scraper.region_soup.find("nav"))
@@ -0,0 +1,119 @@
+import io
+import sys
+import unittest
+from unittest import mock
+
+from recipe_scrapers import (
+    ParquetRecipeWriter,
+    RecipeBatchBuilder,
+    export_parquet,
+    recipe_schema,
+    scrape_html,
+)
+from recipe_scrapers._recipe import Recipe
+from recipe_scrapers._utils import get_abstract_methods
+from recipe_scrapers.settings import settings
+
+try:
+    import pyarrow.parquet  # type: ignore[import-not-found]
+except ImportError:
+    pyarrow = None  # type: ignore[assignment]
+
+RESULTS = {
+    "title": "Pancakes",
+    "host": "example.com",
+    "ingredients": ["1 cup flour", "1 egg"],
+    "ingredient_groups": [
+        {"ingredients": ["1 cup flour", "1 egg"], "purpose": None},
+    ],
+    "instructions_list": ["Whisk.", "Fry."],
+    "category": ["Breakfast", "Dessert"],
+    "total_time": "15",
+    "cook_time": 10,
+    "prep_time": 2.5,
+    "ratings": 4,
+    "ratings_count": 12.0,
+    "nutrients": {"calories": "200 kcal", "Potassium": "80 mg"},
+    "reviews": [{"author": "Ann", "reviewRating": 5.0}],
+}
+
+PAGE = (
+    '<html><head><script type="application/ld+json">'
+    '{"@context": "https://schema.org", "@type": "Recipe", "name": "Pancakes",'
+    ' "recipeIngredient": ["1 cup flour", "1 egg"]}'
+    "</script></head></html>"
+)
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestExport(unittest.TestCase):
+    def test_schema(self):
+        self.assertEqual(get_abstract_methods(), recipe_schema().names)
+
+    def test_conversion(self):
+        builder = RecipeBatchBuilder()
+        builder.append(RESULTS)
+        row = builder.flush().to_pylist()[0]
+        self.assertEqual(["1 cup flour", "1 egg"], row["ingredients"])
+        self.assertEqual(RESULTS["ingredient_groups"], row["ingredient_groups"])
+        self.assertEqual("Breakfast,Dessert", row["category"])
+        self.assertEqual(
+            (15.0, 10.0, 2.5), (row["total_time"], row["cook_time"], row["prep_time"])
+        )
+        self.assertEqual((4.0, 12), (row["ratings"], row["ratings_count"]))
+        self.assertEqual("200 kcal", row["nutrients"]["calories"])
+        self.assertIsNone(row["nutrients"]["fatContent"])
+        self.assertEqual([("Potassium", "80 mg")], row["nutrients"]["other"])
+        self.assertEqual([[("author", "Ann"), ("reviewRating", "5.0")]], row["reviews"])
+        self.assertIsNone(row["author"])
+
+    def test_batches(self):
+        builder = RecipeBatchBuilder(batch_size=2)
+        self.assertIsNone(builder.append(RESULTS))
+        batch = builder.append(Recipe(title="Waffles"))
+        self.assertEqual(["Pancakes", "Waffles"], batch.column("title").to_pylist())
+        self.assertEqual(0, len(builder))
+        self.assertIsNone(builder.flush())
+
+    def test_scrapers(self):
+        builder = RecipeBatchBuilder()
+        builder.append(scrape_html(PAGE, "https://example.com/", supported_only=False))
+        with mock.patch.object(settings, "MAX_ELEMENTS", 1):
+            # the results retrieved within the limits are exported
+            builder.append(
+                scrape_html(PAGE, "https://example.com/", supported_only=False)
+            )
+        titles = builder.flush().column("title").to_pylist()
+        self.assertEqual(["Pancakes", "Pancakes"], titles)
+
+    def test_parquet(self):
+        where = io.BytesIO()
+        with ParquetRecipeWriter(where, batch_size=2) as writer:
+            for title in ("Pancakes", "Waffles", "Crêpes"):
+                writer.write({**RESULTS, "title": title})
+        parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(where.getvalue()))
+        self.assertEqual(2, parquet_file.num_row_groups)
+        self.assertEqual(recipe_schema(), parquet_file.schema_arrow)
+        self.assertEqual(
+            ["Pancakes", "Waffles", "Crêpes"],
+            parquet_file.read().column("title").to_pylist(),
+        )
+
+    def test_export_parquet(self):
+        where = io.BytesIO()
+        scrapers = [
+            scrape_html(PAGE, "https://example.com/", supported_only=False)
+            for _ in range(3)
+        ]
+        self.assertEqual(3, export_parquet(scrapers, where))
+        table = pyarrow.parquet.read_table(io.BytesIO(where.getvalue()))
+        self.assertEqual(3, table.num_rows)
+
+
+class TestExportWithoutPyarrow(unittest.TestCase):
+    def test_import_error(self):
+        with mock.patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None}):
+            with self.assertRaises(ImportError):
+                RecipeBatchBuilder()
+            with self.assertRaises(ImportError):
+                ParquetRecipeWriter(io.BytesIO())
@@ -1,6 +1,13 @@
+import itertools
 import unittest
+from unittest import mock
 
-from recipe_scrapers._grouping_utils import best_match, score_sentence_similarity
+from recipe_scrapers import _grouping_utils
+from recipe_scrapers._grouping_utils import (
+    BigramIndex,
+    best_match,
+    score_sentence_similarity,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -66,3 +73,39 @@ class TestUtils(unittest.TestCase):
     def test_best_match_raises_error_with_empty_list(self):
         with self.assertRaises(ValueError):
             best_match("any string", [])
+
+    def test_bigram_index_matches_best_match(self):
+        target_strings = ["aa", "aaa", "ab", "a", "b a", "ba", "", "aab", "ab"]
+        index = BigramIndex(target_strings)
+        for length in range(4):
+            for chars in itertools.product("ab ", repeat=length):
+                test_string = "".join(chars)
+                with self.subTest(test_string=test_string):
+                    self.assertEqual(
+                        best_match(test_string, target_strings),
+                        index.best_match(test_string),
+                    )
+
+    @unittest.skipIf(_grouping_utils._import_numpy() is None, "numpy is not installed")
+    def test_bigram_index_vectorized_matches(self):
+        target_strings = ["aa", "aaa", "ab", "a", "b a", "ba", "", "aab", "ab"]
+        test_strings = [
+            "".join(chars)
+            for length in range(4)
+            for chars in itertools.product("ab ", repeat=length)
+        ]
+        index = BigramIndex(target_strings)
+        with mock.patch.object(_grouping_utils, "VECTORIZED_SCORING_MIN_PAIRS", 0):
+            self.assertEqual(
+                [best_match(test, target_strings) for test in test_strings],
+                index.best_matches(test_strings),
+            )
+
+    def test_bigram_index_without_numpy(self):
+        target_strings = ["1 cup flour", "2 eggs", "1 tsp salt"]
+        index = BigramIndex(target_strings)
+        with mock.patch.object(_grouping_utils, "VECTORIZED_SCORING_MIN_PAIRS", 0):
+            with mock.patch.object(_grouping_utils, "_import_numpy", return_value=None):
+                self.assertEqual(
+                    ["2 eggs", "1 tsp salt"], index.best_matches(["eggs", "salt"])
+                )
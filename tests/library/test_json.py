@@ -0,0 +1,111 @@
+import json
+import math
+import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers._json import dumps_bytes, loads, loads_prefix
+
+
+class TestJSON(unittest.TestCase):
+    def test_loads(self):
+        document = '{"name": "Crème brûlée", "yield": [4, 2.5, null, true]}'
+        self.assertEqual(json.loads(document), loads(document))
+        self.assertEqual(json.loads(document), loads(document.encode("utf-8")))
+
+    def test_loads_str_subclass(self):
+        script = BeautifulSoup("<script>[1, 2]</script>", "html.parser").script
+        self.assertEqual([1, 2], loads(script.string))
+
+    def test_loads_extensions(self):
+        self.assertTrue(math.isnan(loads("[NaN]")[0]))
+        self.assertEqual({"a": "x\ty"}, loads('{"a": "x\ty"}', strict=False))
+
+    def test_loads_errors(self):
+        for document in ("{", '{"a": "x\ty"}', ""):
+            with self.subTest(document=document):
+                with self.assertRaises(json.JSONDecodeError):
+                    loads(document)
+
+    def test_loads_long_integers(self):
+        document = (
+            "[123456789012345678901234567890, -9223372036854775809,"
+            ' 18446744073709551616, 9223372036854775807, "1234567890123456789012"]'
+        )
+        expected = [
+            123456789012345678901234567890,
+            -9223372036854775809,
+            18446744073709551616,
+            9223372036854775807,
+            "1234567890123456789012",
+        ]
+        self.assertEqual(expected, loads(document))
+        self.assertEqual(expected, loads(document.encode("utf-8")))
+        self.assertEqual({"a": 1.25e-7}, loads('{"a": 1.2500000000000000000e-7}'))
+
+    def test_loads_prefix(self):
+        self.assertEqual({"a": [1, 2]}, loads_prefix(' {"a": [1, 2]};\n'))
+        self.assertEqual([1, {"b": None}], loads_prefix('[1, {"b": null}]; init();'))
+        with self.assertRaises(ValueError):
+            loads_prefix("(function(a){return {data:[a]}}(1));")
+
+    def test_dumps_bytes(self):
+        value = {"name": "Crème brûlée", "yield": [4, 2.5, None, True]}
+        encoded = dumps_bytes(value)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(value, json.loads(encoded))
+        self.assertIn("Crème".encode("utf-8"), encoded)
+        self.assertEqual(b'{"a":[1,2]}', dumps_bytes({"a": [1, 2]}))
+
+    def test_dumps_bytes_fallback(self):
+        self.assertEqual({"1": 2**70}, json.loads(dumps_bytes({1: 2**70})))
+
+    def test_dumps_bytes_same_output(self):
+        value = {
+            "title": "Crème brûlée",
+            "total_time": 45,
+            "ratings": 4.67,
+            "ratings_count": 0.0,
+            "ingredients": ["4 egg yolks"],
+            "nutrients": {},
+            "cuisine": None,
+            "vegan": False,
+        }
+        self.assertEqual(
+            '{"title":"Crème brûlée","total_time":45,"ratings":4.67,'
+            '"ratings_count":0.0,"ingredients":["4 egg yolks"],"nutrients":{},'
+            '"cuisine":null,"vegan":false}'.encode("utf-8"),
+            dumps_bytes(value),
+        )
+
+    def test_dumps_bytes_non_finite(self):
+        value = {"a": float("nan"), "b": [float("inf"), -float("inf"), 1.5]}
+        self.assertEqual(b'{"a":null,"b":[null,null,1.5]}', dumps_bytes(value))
+        self.assertEqual(
+            b'{"1":null,"2":1180591620717411303424}',
+            dumps_bytes({1: float("nan"), 2: 2**70}),
+        )
+
+    def test_scraper_to_json_bytes(self):
+        scraper = scrape_html(
+            '<html><head><script type="application/ld+json">'
+            '{"@context": "https://schema.org", "@type": "Recipe",'
+            ' "name": "Crème brûlée", "recipeIngredient": ["4 egg yolks"]}'
+            "</script></head></html>",
+            "https://example.com/",
+            supported_only=False,
+        )
+        self.assertEqual(scraper.to_json(), json.loads(scraper.to_json_bytes()))
+
+
+class TestJSONStdlib(TestJSON):
+    """The same tests, with the json module as the backend."""
+
+    def setUp(self):
+        patcher = mock.patch.multiple(
+            "recipe_scrapers._json", orjson=None, simdjson=None
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -0,0 +1,133 @@
+import itertools
+import time
+import unittest
+from unittest import mock
+
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._exceptions import ScrapeLimitExceeded
+from recipe_scrapers._limits import ScrapeLimits
+from recipe_scrapers.settings import settings
+
+PAGE = (
+    '<html><head><meta property="og:site_name" content="Example"></head><body>'
+    + "<ul>"
+    + "<li>1 egg</li>" * 2000
+    + "</ul></body></html>"
+)
+
+
+class LimitedScraper(AbstractScraper):
+    @classmethod
+    def host(cls):
+        return "example.com"
+
+    def title(self):
+        return "Omelette"
+
+    def ingredients(self):
+        return [li.get_text() for li in self.soup.find_all("li")]
+
+    def instructions(self):
+        time.sleep(0.05)
+        return "Whisk the eggs."
+
+
+class RegionScraper(LimitedScraper):
+    parse_regions = ("div.recipe-card",)
+
+
+class TestScrapeLimits(unittest.TestCase):
+    def test_no_limits(self):
+        scraper = LimitedScraper(PAGE, "https://example.com/")
+        self.assertEqual({}, scraper.limits.soup_options())
+        self.assertEqual(2000, len(scraper.ingredients()))
+
+    def test_max_html_bytes(self):
+        with mock.patch.object(settings, "MAX_HTML_BYTES", len(PAGE) - 1):
+            with self.assertRaises(ScrapeLimitExceeded) as context:
+                LimitedScraper(PAGE, "https://example.com/")
+        self.assertEqual("MAX_HTML_BYTES", context.exception.setting)
+
+        # the limit is on the UTF-8 encoding of the page
+        with mock.patch.object(settings, "MAX_HTML_BYTES", 10):
+            ScrapeLimits().check_html("œ" * 5)
+            with self.assertRaises(ScrapeLimitExceeded):
+                ScrapeLimits().check_html("œ" * 6)
+
+    def test_max_elements(self):
+        with mock.patch.object(settings, "MAX_ELEMENTS", 1000):
+            scraper = LimitedScraper(PAGE, "https://example.com/")
+            with self.assertRaises(ScrapeLimitExceeded) as context:
+                scraper.ingredients()
+            self.assertEqual("MAX_ELEMENTS", context.exception.setting)
+            # the page is not parsed again
+            elements = scraper.limits.elements
+            with self.assertRaises(ScrapeLimitExceeded):
+                scraper.ingredients()
+            self.assertEqual(elements, scraper.limits.elements)
+
+    def test_max_elements_per_parse(self):
+        with mock.patch.object(settings, "MAX_ELEMENTS", 10**6):
+            scraper = LimitedScraper(PAGE, "https://example.com/")
+            scraper.soup
+            elements = scraper.limits.elements
+        with mock.patch.object(settings, "MAX_ELEMENTS", elements):
+            # the page has no recipe card, so that the whole of it is parsed
+            # after its regions were: the limit is on each parse on its own
+            scraper = RegionScraper(PAGE, "https://example.com/")
+            self.assertEqual(2000, len(scraper.ingredients()))
+            self.assertEqual("Example", scraper.site_name())
+            self.assertEqual([], scraper.links())
+
+    def test_max_elements_is_not_suppressed(self):
+        with mock.patch.object(settings, "MAX_ELEMENTS", 1000):
+            with mock.patch.object(settings, "SUPPRESS_EXCEPTIONS", True):
+                scraper = LimitedScraper(PAGE, "https://example.com/")
+                with self.assertRaises(ScrapeLimitExceeded):
+                    scraper.language()
+
+    def test_field_time_budget(self):
+        with mock.patch.object(settings, "FIELD_TIME_BUDGET", 0.01):
+            scraper = LimitedScraper(PAGE, "https://example.com/")
+            self.assertEqual("Omelette", scraper.title())
+            with self.assertRaises(ScrapeLimitExceeded) as context:
+                scraper.instructions()
+        self.assertEqual("FIELD_TIME_BUDGET", context.exception.setting)
+
+    def test_scrape_time_budget(self):
+        with mock.patch.object(settings, "SCRAPE_TIME_BUDGET", 0.01):
+            scraper = LimitedScraper(PAGE, "https://example.com/")
+            with self.assertRaises(ScrapeLimitExceeded):
+                scraper.instructions()
+            # once the budget is spent, methods are no longer called
+            with self.assertRaises(ScrapeLimitExceeded) as context:
+                scraper.title()
+        self.assertEqual("SCRAPE_TIME_BUDGET", context.exception.setting)
+
+    def test_time_budget_interrupts_parsing(self):
+        with mock.patch.object(settings, "FIELD_TIME_BUDGET", 3):
+            scraper = LimitedScraper(PAGE, "https://example.com/")
+            # every reading of the clock is a second later
+            with mock.patch(
+                "recipe_scrapers._limits.time.monotonic",
+                side_effect=itertools.count(),
+            ):
+                with self.assertRaises(ScrapeLimitExceeded):
+                    scraper.ingredients()
+        self.assertEqual(768, scraper.limits.elements)
+
+    def test_partial_results(self):
+        with mock.patch.object(settings, "MAX_ELEMENTS", 1000):
+            scraper = LimitedScraper(PAGE, "https://example.com/")
+            with self.assertRaises(ScrapeLimitExceeded) as context:
+                scraper.to_json()
+            self.assertEqual("Omelette", context.exception.partial_results["title"])
+            self.assertEqual(
+                "Whisk the eggs.", context.exception.partial_results["instructions"]
+            )
+            self.assertNotIn("ingredients", context.exception.partial_results)
+
+            with self.assertRaises(ScrapeLimitExceeded) as context:
+                scraper.to_recipe()
+            self.assertEqual("Omelette", context.exception.partial_results.title)
+            self.assertNotIn("ingredients", context.exception.partial_results.to_dict())
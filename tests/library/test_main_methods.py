@@ -107,3 +107,18 @@ class TestMainMethods(unittest.TestCase):
                 scrape_html(html=html, org_url=url, online=False, wild_mode=True)
 
         self.assertTrue(any(w.category is DeprecationWarning for w in ws))
+
+    def test_context_manager_releases_page(self):
+        recipe_html = pathlib.Path(
+            "tests/test_data/recipe-scrapers.example/online.testhtml"
+        )
+        with scrape_html(
+            html=recipe_html.read_text(),
+            org_url="https://recipe-scrapers.example/algorithmic-cupcakes.html",
+            supported_only=False,
+        ) as scraper:
+            self.assertEqual("Algorithmic Cupcakes", scraper.title())
+
+        self.assertEqual("", scraper.page_data)
+        self.assertEqual([], scraper.soup.contents)
+        self.assertEqual({}, scraper.schema.data)
@@ -0,0 +1,169 @@
+import gc
+import types
+import unittest
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._factory import SchemaScraperFactory
+from recipe_scrapers._metadata import PageMetadata, StartTagScan
+
+HTML = """
+<html lang="fr">
+<head>
+  <meta http-equiv="Content-Language" content="fr-CA">
+  <meta property="og:image">
+  <meta property="og:image" content="https://example.com/first.jpg">
+  <link rel="alternate canonical" href="https://example.com/recipe">
+</head>
+<body>
+  <meta name="og:site_name" content="Example">
+  <meta property="og:image" content="https://example.com/second.jpg">
+</body>
+</html>
+"""
+
+
+class TestPageMetadata(unittest.TestCase):
+    def setUp(self):
+        self.metadata = PageMetadata(BeautifulSoup(HTML, "html.parser"))
+
+    def test_html_lang(self):
+        self.assertEqual("fr", self.metadata.html_lang()["lang"])
+
+    def test_meta(self):
+        self.assertEqual(
+            "fr-CA",
+            self.metadata.meta("http-equiv", "content-language")["content"],
+        )
+        self.assertIsNone(self.metadata.meta("property", "og:image").get("content"))
+        self.assertEqual(
+            "https://example.com/first.jpg",
+            self.metadata.meta("property", "og:image", content=True)["content"],
+        )
+        self.assertEqual(
+            "Example", self.metadata.meta("name", "og:site_name")["content"]
+        )
+        self.assertIsNone(self.metadata.meta("name", "description"))
+
+    def test_link(self):
+        self.assertEqual(
+            "https://example.com/recipe",
+            self.metadata.link("canonical", href=True)["href"],
+        )
+        self.assertIsNone(self.metadata.link("icon"))
+
+
+class TestHeadMetadata(unittest.TestCase):
+    def setUp(self):
+        self.fallbacks = 0
+        position = HTML.index("</head>")
+
+        def fallback():
+            self.fallbacks += 1
+            return PageMetadata(BeautifulSoup(HTML, "html.parser"))
+
+        self.metadata = PageMetadata(
+            BeautifulSoup(HTML[:position], "html.parser"),
+            page_html=HTML,
+            position=position,
+            fallback=fallback,
+        )
+
+    def test_lookups_found_in_the_head(self):
+        self.assertEqual("fr", self.metadata.html_lang()["lang"])
+        self.assertEqual(
+            "https://example.com/first.jpg",
+            self.metadata.meta("property", "og:image", content=True)["content"],
+        )
+        self.assertEqual(0, self.fallbacks)
+
+    def test_lookups_missing_from_the_page(self):
+        self.assertIsNone(self.metadata.meta("name", "description"))
+        self.assertIsNone(self.metadata.link("icon"))
+        self.assertEqual(0, self.fallbacks)
+
+    def test_lookups_found_in_the_body(self):
+        self.assertEqual(
+            "Example", self.metadata.meta("name", "og:site_name")["content"]
+        )
+        self.assertEqual(1, self.fallbacks)
+
+
+class TestStartTagScan(unittest.TestCase):
+    def test_may_have(self):
+        scan = StartTagScan(
+            """
+            <META Name="og&#58;site_name" content='a > b'>
+            <link rel="alternate  icon">
+            <!-- <meta http-equiv="Content-Language"> -->
+            <metadata name="description">
+            """
+        )
+        self.assertTrue(scan.may_have("meta", "name", "og:site_name"))
+        self.assertTrue(scan.may_have("link", "rel", "icon"))
+        self.assertTrue(scan.may_have("link", "rel", "alternate icon"))
+        # the scan finds tags in comments too
+        self.assertTrue(scan.may_have("meta", "http-equiv", "content-language"))
+        self.assertFalse(scan.may_have("meta", "name", "description"))
+        self.assertFalse(scan.may_have("html", "lang", None))
+
+    def test_position(self):
+        html = '<meta name="description"><p>'
+        self.assertFalse(
+            StartTagScan(html, html.index("<p>")).may_have(
+                "meta", "name", "description"
+            )
+        )
+
+
+class SchemaOnlyScraper(AbstractScraper):
+    parse_regions = ()
+
+    @classmethod
+    def host(cls):
+        return "example.com"
+
+
+class TestHeadOnlyParse(unittest.TestCase):
+    def test_metadata_does_not_parse_the_body(self):
+        scraper = SchemaOnlyScraper(HTML, "https://example.com/")
+        self.assertEqual("fr", scraper.language())
+        self.assertEqual("https://example.com/recipe", scraper.canonical_url())
+        self.assertNotIn("soup", scraper.__dict__)
+        self.assertEqual(
+            "Example", scraper.metadata.meta("name", "og:site_name")["content"]
+        )
+        self.assertNotIn("soup", scraper.__dict__)
+        # fields reading the soup still parse the whole page
+        self.assertEqual(
+            ["Example"],
+            [
+                meta["content"]
+                for meta in scraper.soup.find_all("meta", attrs={"name": True})
+            ],
+        )
+
+    def test_soup_is_the_whole_page(self):
+        scraper = SchemaScraperFactory.SchemaScraper(HTML, "https://example.com/")
+        self.assertEqual("fr", scraper.language())
+        self.assertIsNotNone(scraper.soup.body)
+        self.assertEqual(2, len(scraper.soup.body.find_all("meta")))
+
+    def test_close_releases_the_page(self):
+        html = HTML + "<p>" + "Whisk the eggs. " * 1000 + "</p>"
+        scraper = SchemaOnlyScraper(html, "https://example.com/")
+        # the head, then the whole page, are parsed for the metadata
+        self.assertEqual("fr", scraper.language())
+        self.assertEqual("Example", scraper.opengraph.site_name())
+        scraper.close()
+        self.assertEqual(
+            [],
+            [
+                referrer
+                for referrer in gc.get_referrers(html)
+                if not isinstance(referrer, types.FrameType)
+            ],
+        )
+        self.assertIsNone(scraper.metadata.soup)
+        self.assertNotIn("opengraph", scraper.__dict__)
@@ -1,6 +1,7 @@
 import unittest
 
 from recipe_scrapers.plugins import HTMLTagStripperPlugin
+from recipe_scrapers.plugins.html_tags_stripper import stripper
 
 
 class TestHTMLTagStripperPlugin(unittest.TestCase):
@@ -104,3 +105,10 @@ class TestHTMLTagStripperPlugin(unittest.TestCase):
             "Sticky Pomegranate & Black Pepper Chicken Wing",
             "Result must have html tags stripped when invoked after plugin used",
         )
+
+    def test_stripper(self):
+        self.assertEqual("Plain ingredient", stripper("Plain ingredient"))
+        self.assertEqual("Salt & pepper", stripper("Salt &amp;amp; pepper"))
+        self.assertEqual("bold", stripper("&lt;b&gt;bold&lt;/b&gt;"))
+        self.assertEqual("1 < 2", stripper("<p>1 &amp;lt; 2</p>"))
+        self.assertEqual("None", stripper(None))
@@ -0,0 +1,97 @@
+import io
+import unittest
+from unittest import mock
+
+from recipe_scrapers.plugins import InstrumentationPlugin
+from recipe_scrapers.plugins.instrumentation import (
+    HistogramAggregator,
+    InstrumentationEvent,
+    StatsDSink,
+)
+from recipe_scrapers.settings import settings
+
+
+class InstrumentedScraper:
+    @classmethod
+    def host(cls):
+        return "example.com"
+
+    def title(self):
+        return "Algorithmic Cupcakes"
+
+    def yields(self):
+        raise ValueError("no yields here")
+
+
+# decorate the sample methods as we would in _abstract.py
+for name in ("title", "yields"):
+    setattr(
+        InstrumentedScraper,
+        name,
+        InstrumentationPlugin.run(getattr(InstrumentedScraper, name)),
+    )
+
+
+class TestInstrumentationPlugin(unittest.TestCase):
+    def test_no_sinks_passthrough(self):
+        with mock.patch.object(settings, "INSTRUMENTATION_SINKS", ()):
+            self.assertEqual("Algorithmic Cupcakes", InstrumentedScraper().title())
+
+    def test_events_are_emitted(self):
+        events = []
+        with mock.patch.object(settings, "INSTRUMENTATION_SINKS", (events.append,)):
+            self.assertEqual("Algorithmic Cupcakes", InstrumentedScraper().title())
+            with self.assertRaises(ValueError):
+                InstrumentedScraper().yields()
+
+        title_event, yields_event = events
+        self.assertEqual(
+            ("example.com", "title", "ok", None),
+            (
+                title_event.host,
+                title_event.method,
+                title_event.outcome,
+                title_event.exception_type,
+            ),
+        )
+        self.assertGreaterEqual(title_event.duration, 0)
+        self.assertEqual("error", yields_event.outcome)
+        self.assertEqual("ValueError", yields_event.exception_type)
+
+    def test_histogram_prometheus_format(self):
+        histogram = HistogramAggregator(buckets=(0.01, 0.1))
+        histogram(InstrumentationEvent("example.com", "title", 0.005, "ok"))
+        histogram(InstrumentationEvent("example.com", "title", 0.05, "ok"))
+        histogram(
+            InstrumentationEvent("example.com", "title", 2, "error", "ValueError")
+        )
+
+        text = histogram.to_prometheus()
+        labels = 'host="example.com",method="title"'
+        self.assertIn(
+            f'recipe_scrapers_method_duration_seconds_bucket{{{labels},le="0.01"}} 1',
+            text,
+        )
+        self.assertIn(
+            f'recipe_scrapers_method_duration_seconds_bucket{{{labels},le="0.1"}} 2',
+            text,
+        )
+        self.assertIn(
+            f'recipe_scrapers_method_duration_seconds_bucket{{{labels},le="+Inf"}} 3',
+            text,
+        )
+        self.assertIn(
+            f'recipe_scrapers_method_calls_total{{{labels},outcome="ValueError"}} 1',
+            text,
+        )
+
+    def test_statsd_lines(self):
+        output = io.StringIO()
+        sink = StatsDSink(file=output)
+        sink(InstrumentationEvent("example.com", "title", 0.0125, "ok"))
+
+        self.assertEqual(
+            "recipe_scrapers.example_com.title.duration:12.500|ms\n"
+            "recipe_scrapers.example_com.title.ok:1|c\n",
+            output.getvalue(),
+        )
@@ -0,0 +1,65 @@
+import json
+import pathlib
+import unittest
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers._grouping_utils import IngredientGroup
+from recipe_scrapers._recipe import Recipe
+
+
+class TestRecipe(unittest.TestCase):
+    def test_unset_fields_are_omitted(self):
+        recipe = Recipe(title="Algorithmic Cupcakes", host="example.com")
+
+        self.assertEqual("Algorithmic Cupcakes", recipe.title)
+        with self.assertRaises(AttributeError):
+            recipe.yields
+        self.assertEqual(
+            {"host": "example.com", "title": "Algorithmic Cupcakes"}, recipe.to_dict()
+        )
+
+    def test_slots(self):
+        recipe = Recipe(ingredient_groups=[IngredientGroup(["flour"])])
+
+        self.assertFalse(hasattr(recipe, "__dict__"))
+        self.assertFalse(hasattr(recipe.ingredient_groups[0], "__dict__"))
+        with self.assertRaises(AttributeError):
+            Recipe(unknown_field="value")
+
+    def test_interned_strings(self):
+        host = "".join(["example", ".com"])
+        self.assertIs(Recipe(host=host).host, Recipe(host="example.com").host)
+
+    def test_ingredient_groups_conversion(self):
+        recipe = Recipe(ingredient_groups=[IngredientGroup(["flour"], "For the cake")])
+        expected = {
+            "ingredient_groups": [{"ingredients": ["flour"], "purpose": "For the cake"}]
+        }
+
+        self.assertEqual(expected, recipe.to_dict())
+        self.assertEqual(expected, json.loads(recipe.to_json()))
+
+    def test_to_dict_does_not_copy(self):
+        ingredients = ["flour", "eggs"]
+        recipe = Recipe(
+            ingredients=ingredients,
+            ingredient_groups=[IngredientGroup(ingredients)],
+        )
+        result = recipe.to_dict()
+
+        self.assertIs(ingredients, result["ingredients"])
+        self.assertIs(ingredients, result["ingredient_groups"][0]["ingredients"])
+
+    def test_scraper_to_recipe(self):
+        recipe_html = pathlib.Path(
+            "tests/test_data/recipe-scrapers.example/online.testhtml"
+        )
+        scraper = scrape_html(
+            html=recipe_html.read_text(),
+            org_url="https://recipe-scrapers.example/algorithmic-cupcakes.html",
+            supported_only=False,
+        )
+        recipe = scraper.to_recipe()
+
+        self.assertEqual("Algorithmic Cupcakes", recipe.title)
+        self.assertEqual(scraper.to_json(), recipe.to_dict())
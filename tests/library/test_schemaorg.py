@@ -0,0 +1,60 @@
+import json
+import unittest
+
+from recipe_scrapers._schemaorg import SchemaOrg
+
+JSON_LD_RECIPE = '<script type="application/ld+json">{}</script>'.format(
+    json.dumps(
+        {"@context": "https://schema.org", "@type": "Recipe", "name": "Pancakes"}
+    )
+)
+MICRODATA_RECIPE = (
+    '<div itemscope itemtype="https://schema.org/Recipe">'
+    '<h2 itemprop="name">French toast</h2></div>'
+)
+MICRODATA_BREADCRUMBS = (
+    '<ol itemscope itemtype="https://schema.org/BreadcrumbList">'
+    '<li itemprop="itemListElement" itemscope itemtype="https://schema.org/ListItem">'
+    '<span itemprop="name">Recipes</span></li></ol>'
+)
+MICRODATA_WEBSITE = (
+    "<div itemscope itemtype='https://schema.org/WebSite'>"
+    '<meta itemprop="name" content="Example"></div>'
+)
+
+
+def page(*parts):
+    return "<html><body>{}</body></html>".format("".join(parts))
+
+
+class TestSchemaOrgExtraction(unittest.TestCase):
+    def test_json_ld_recipe(self):
+        schema = SchemaOrg(page(JSON_LD_RECIPE))
+        self.assertEqual("json-ld", schema.format)
+        self.assertEqual(["json-ld"], schema.syntaxes)
+
+    def test_microdata_recipe(self):
+        schema = SchemaOrg(page(MICRODATA_RECIPE))
+        self.assertEqual("microdata", schema.format)
+        self.assertEqual(["json-ld", "microdata"], schema.syntaxes)
+        self.assertEqual("French toast", schema.title())
+
+    def test_microdata_is_skipped(self):
+        schema = SchemaOrg(page(JSON_LD_RECIPE, MICRODATA_BREADCRUMBS))
+        self.assertEqual("json-ld", schema.format)
+        self.assertEqual(["json-ld"], schema.syntaxes)
+
+        # it is extracted for the further recipes it may hold
+        schema = SchemaOrg(page(JSON_LD_RECIPE, MICRODATA_RECIPE))
+        self.assertEqual(["json-ld"], schema.syntaxes)
+        self.assertEqual(
+            ["French toast"], [other.title() for other in schema.recipe_schemas()]
+        )
+        self.assertEqual(["json-ld", "microdata"], schema.syntaxes)
+        self.assertEqual("Pancakes", schema.title())
+
+    def test_microdata_details(self):
+        schema = SchemaOrg(page(JSON_LD_RECIPE, MICRODATA_WEBSITE))
+        self.assertEqual("json-ld", schema.format)
+        self.assertEqual(["json-ld", "microdata"], schema.syntaxes)
+        self.assertEqual("Example", schema.site_name())
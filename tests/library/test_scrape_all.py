@@ -0,0 +1,194 @@
+import json
+import pathlib
+import unittest
+from unittest import mock
+
+import extruct
+
+from recipe_scrapers import WebsiteNotImplementedError, scrape_all
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._app_state import AppState
+from recipe_scrapers._limits import ScrapeLimits
+
+
+def recipe(name, ingredients):
+    return {"@type": "Recipe", "name": name, "recipeIngredient": ingredients}
+
+
+def page(*json_ld, body=""):
+    scripts = "".join(
+        f'<script type="application/ld+json">{json.dumps(data)}</script>'
+        for data in json_ld
+    )
+    return (
+        '<html lang="en"><head><meta property="og:site_name" content="Example">'
+        f"{scripts}</head><body>{body}</body></html>"
+    )
+
+
+PANCAKES = recipe("Pancakes", ["1 cup flour", "1 egg"])
+CREPES = recipe("Crêpes", ["1 cup flour", "2 eggs", "1 cup milk"])
+WAFFLES = recipe("Waffles", ["2 cups flour", "2 eggs"])
+
+ROUNDUP = page(
+    {"@context": "https://schema.org", **PANCAKES},
+    {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebSite", "name": "Example"},
+            CREPES,
+            {
+                "@type": "ItemList",
+                "itemListElement": [
+                    {"@type": "ListItem", "position": 1, "item": WAFFLES},
+                    # recipes given again are not scraped again
+                    {"@type": "ListItem", "position": 2, "item": PANCAKES},
+                    # nor are list items that only link to a recipe
+                    {
+                        "@type": "ListItem",
+                        "position": 3,
+                        "url": "https://example.com/pancakes",
+                    },
+                ],
+            },
+        ],
+    },
+    body=(
+        '<div itemscope itemtype="https://schema.org/Recipe">'
+        '<h2 itemprop="name">French toast</h2>'
+        '<span itemprop="recipeIngredient">2 slices of bread</span></div>'
+    ),
+)
+
+
+class TestScrapeAll(unittest.TestCase):
+    def test_recipes(self):
+        scrapers = scrape_all(ROUNDUP, "https://example.com/", supported_only=False)
+        self.assertEqual(
+            ["Pancakes", "Crêpes", "Waffles", "French toast"],
+            [scraper.title() for scraper in scrapers],
+        )
+        self.assertEqual(
+            ["1 cup flour", "2 eggs", "1 cup milk"], scrapers[1].ingredients()
+        )
+        self.assertEqual(["2 slices of bread"], scrapers[3].ingredients())
+        self.assertEqual(
+            ["json-ld", "json-ld", "json-ld", "microdata"],
+            [scraper.schema.format for scraper in scrapers],
+        )
+        for scraper in scrapers:
+            self.assertEqual("Example", scraper.site_name())
+            self.assertEqual("en", scraper.language())
+
+    def test_single_parse(self):
+        with mock.patch(
+            "recipe_scrapers._schemaorg.extruct.extract",
+            wraps=extruct.extract,
+        ) as extract:
+            scrapers = scrape_all(ROUNDUP, "https://example.com/", supported_only=False)
+            for scraper in scrapers:
+                scraper.to_json()
+        # no syntax is extracted twice
+        syntaxes = [
+            syntax
+            for call in extract.call_args_list
+            for syntax in call.kwargs["syntaxes"]
+        ]
+        self.assertEqual(len(set(syntaxes)), len(syntaxes))
+        self.assertTrue(all(scraper.soup is scrapers[0].soup for scraper in scrapers))
+
+    def test_page_state_is_shared(self):
+        # the state of the page is built once, by the scraper of the page
+        with mock.patch.object(ScrapeLimits, "check_html", autospec=True) as check:
+            with mock.patch(
+                "recipe_scrapers._abstract.AppState", wraps=AppState
+            ) as app_state:
+                scrapers = scrape_all(
+                    ROUNDUP, "https://example.com/", supported_only=False
+                )
+        self.assertEqual(4, len(scrapers))
+        self.assertEqual(1, app_state.call_count)
+        self.assertEqual(1, check.call_count)
+        self.assertTrue(all(s.limits is scrapers[0].limits for s in scrapers))
+
+    def test_single_recipe(self):
+        scrapers = scrape_all(
+            page({"@context": "https://schema.org", **PANCAKES}),
+            "https://example.com/",
+            supported_only=False,
+        )
+        self.assertEqual(["Pancakes"], [scraper.title() for scraper in scrapers])
+
+    def test_no_recipes(self):
+        self.assertEqual(
+            [], scrape_all(page(), "https://example.com/", supported_only=False)
+        )
+
+    def test_item_list_only(self):
+        scrapers = scrape_all(
+            page(
+                {
+                    "@context": "https://schema.org",
+                    "@type": "ItemList",
+                    "itemListElement": [PANCAKES, WAFFLES],
+                }
+            ),
+            "https://example.com/",
+            supported_only=False,
+        )
+        self.assertEqual(
+            ["Pancakes", "Waffles"], [scraper.title() for scraper in scrapers]
+        )
+
+    def test_recipes_with_same_name(self):
+        # recipes with an @id are told apart by it alone
+        scrapers = scrape_all(
+            page(
+                {
+                    "@context": "https://schema.org",
+                    "@graph": [
+                        {"@id": "#a", **recipe("Chocolate cake", ["200g flour"])},
+                        {"@id": "#b", **recipe("Chocolate cake", ["200g spelt"])},
+                        {"@id": "#a", **recipe("Chocolate cake", ["200g flour"])},
+                    ],
+                }
+            ),
+            "https://example.com/",
+            supported_only=False,
+        )
+        self.assertEqual(
+            [["200g flour"], ["200g spelt"]],
+            [scraper.ingredients() for scraper in scrapers],
+        )
+
+    def test_recipes_without_ingredients(self):
+        scrapers = scrape_all(
+            page(
+                {"@context": "https://schema.org", **recipe("Tea", [])},
+                {"@context": "https://schema.org", **recipe("Coffee", [])},
+                {"@context": "https://schema.org", **recipe("Tea", [])},
+            ),
+            "https://example.com/",
+            supported_only=False,
+        )
+        self.assertEqual(["Tea", "Coffee"], [scraper.title() for scraper in scrapers])
+
+    def test_supported_website(self):
+        html = pathlib.Path(
+            "tests/test_data/ethanchlebowski.com/ethanchlebowski.testhtml"
+        )
+        scrapers = scrape_all(
+            html, "https://ethanchlebowski.com/cooking-techniques-recipes/"
+        )
+        self.assertEqual(
+            ["Huevos Rancheros", "Salsa Ranchera", "Seasoned Pinto Beans"],
+            [scraper.title() for scraper in scrapers],
+        )
+        # the recipe of the page is scraped by the scraper of the website
+        self.assertEqual("ethanchlebowski.com", scrapers[0].host())
+        self.assertNotIsInstance(scrapers[0], type(scrapers[1]))
+        self.assertTrue(all(isinstance(s, AbstractScraper) for s in scrapers))
+
+    def test_unsupported_website(self):
+        with self.assertRaises(WebsiteNotImplementedError):
+            scrape_all(ROUNDUP, "https://example.com/")
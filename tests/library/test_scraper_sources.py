@@ -0,0 +1,34 @@
+import re
+import unittest
+from pathlib import Path
+
+import recipe_scrapers
+
+# e.g. BeautifulSoup(str(self.soup), "html.parser"), which serializes and
+# parses the whole page again; self.soup or the _utils fragment helpers do
+# the same work on the tree that already exists
+REPARSE_PAGE_REGEX = re.compile(r"BeautifulSoup\(\s*str\(\s*self\.soup\b")
+
+
+class TestScraperSources(unittest.TestCase):
+    def test_no_page_reparsing(self):
+        package_dir = Path(recipe_scrapers.__file__).parent
+        offenders = [
+            path.name
+            for path in sorted(package_dir.glob("*.py"))
+            if not path.name.startswith("_")
+            and REPARSE_PAGE_REGEX.search(path.read_text(encoding="utf-8"))
+        ]
+        self.assertEqual([], offenders)
+
+    def test_reparse_page_regex(self):
+        self.assertTrue(
+            REPARSE_PAGE_REGEX.search(
+                'soup = BeautifulSoup(\n    str(self.soup), features="html.parser"\n)'
+            )
+        )
+        self.assertFalse(
+            REPARSE_PAGE_REGEX.search(
+                'BeautifulSoup(str(self.schema.cuisine()), "html.parser")'
+            )
+        )
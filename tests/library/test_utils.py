@@ -1,14 +1,53 @@
+import html
+import itertools
+import re
 import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
 
 from recipe_scrapers._utils import (
+    YIELD_TYPE_MATCHERS,
+    YieldTypeMatcher,
     _extract_fractional,
+    fragment_elements,
+    fragment_text,
     get_abstract_methods,
     get_minutes,
     get_nutrition_keys,
     get_url_slug,
+    get_yields,
+    normalize_string,
+    parse_time_units,
     url_path_to_dict,
 )
 
+# The regular expression that parse_time_units replaces
+REFERENCE_TIME_REGEX = re.compile(
+    r"(?:\D*(?P<days>\d+)\s*(?:days|D))?"
+    r"(?:\D*(?P<hours>[\d.\s/?¼½¾⅓⅔⅕⅖⅗]+)\s*(?:hours|hrs|hr|h|óra|:))?"
+    r"(?:\D*(?P<minutes>\d+)\s*(?:minutes|mins|min|m|perc|$))?"
+    r"(?:\D*(?P<seconds>\d+)\s*(?:seconds|secs|sec|s))?",
+    re.IGNORECASE,
+)
+
+
+def reference_normalize_string(string):
+    # The original, regex-based implementation of normalize_string
+    unescaped_string = html.unescape(string)
+    no_html_string = re.sub("<[^>]*>", "", unescaped_string)
+    return re.sub(
+        r"\s+",
+        " ",
+        no_html_string.replace("\xc2\xa0", " ")
+        .replace("\xa0", " ")
+        .replace("\u200b", "")
+        .replace("\r\n", " ")
+        .replace("\n", " ")
+        .replace("\t", " ")
+        .strip(),
+    )
+
 
 class TestUtils(unittest.TestCase):
     @classmethod
@@ -54,6 +93,47 @@ class TestUtils(unittest.TestCase):
             with self.subTest(text=text):
                 self.assertEqual(expected, get_minutes(text))
 
+    def test_parse_time_units_equivalence(self):
+        fragments = ["1", "25", " ", ".", "/", "½", "x", "h", "hr", "óra", ":"]
+        fragments += ["m", "mins", "perc", "\n", "D", "days", "s", "secs"]
+        for length in range(1, 4):
+            for parts in itertools.product(fragments, repeat=length):
+                text = "".join(parts)
+                with self.subTest(text=text):
+                    self.assertEqual(
+                        REFERENCE_TIME_REGEX.search(text).groupdict(),
+                        parse_time_units(text),
+                    )
+
+    def test_long_time_text(self):
+        self.assertEqual(
+            {"days": None, "hours": None, "minutes": "1", "seconds": None},
+            parse_time_units(" " * 50000 + "1"),
+        )
+        self.assertIsNone(get_minutes("Bake until golden. " * 100 + "20 minutes"))
+
+    def test_get_yields(self):
+        fixtures = {
+            "4": "4 servings",
+            "Serves 1": "1 serving",
+            "Makes 24 cupcakes": "24 cupcakes",
+            "1 cupcake": "1 cupcake",
+            "2 loaves": "2 loaves",
+            "6-8 patties": "8 patties",
+            "2 batches of brownies": "2 batches",
+            "Makes 12": "12 items",
+        }
+        for text, expected in fixtures.items():
+            with self.subTest(text=text):
+                self.assertEqual(expected, get_yields(text))
+
+    def test_get_yields_language(self):
+        german = YieldTypeMatcher((("stück", "stück"), ("portion", "portionen")))
+        with mock.patch.dict(YIELD_TYPE_MATCHERS, {"de": german}):
+            self.assertEqual("12 stück", get_yields("12 Stück", language="de-DE"))
+            self.assertEqual("4 portionen", get_yields("4 Portionen", language="de"))
+            self.assertEqual("2 cakes", get_yields("2 cakes", language="fr"))
+
     def test_split_fractions(self):
         input_string = "3 1 / 2"
         expected_result = 3.5
@@ -110,7 +190,17 @@ class TestUtils(unittest.TestCase):
             for method in dir(AbstractScraper)
             if callable(getattr(AbstractScraper, method))
             and not method.startswith("_")
-            and method not in ["soup", "links", "to_json"]
+            and method
+            not in [
+                "soup",
+                "links",
+                "to_json",
+                "to_json_bytes",
+                "to_recipe",
+                "close",
+                "select",
+                "select_one",
+            ]
         ]
         self.assertEqual((expected_methods), (public_methods))
 
@@ -168,3 +258,63 @@ class TestUtils(unittest.TestCase):
             "cholesterolContent",
         ]
         self.assertEqual((expected_order), (nutrition_keys))
+
+    def test_normalize_string_equivalence(self):
+        fragments = [
+            "a",
+            "é",
+            " ",
+            "\n",
+            "\r\n",
+            "\t",
+            "\xa0",
+            "\u3000",
+            "\xc2",
+            "\u200b",
+            "<b>",
+            "</b>",
+            "<",
+            ">",
+            "&",
+            "&amp;",
+            "&amp;lt;",
+            "&lt;",
+            "&gt;",
+            "&nbsp;",
+            "&#160;",
+            "&#8203;",
+        ]
+        for length in range(1, 4):
+            for parts in itertools.product(fragments, repeat=length):
+                text = "".join(parts)
+                with self.subTest(text=text):
+                    self.assertEqual(
+                        reference_normalize_string(text), normalize_string(text)
+                    )
+
+    def test_fragment_text(self):
+        fragments = [
+            "American",
+            "Tex-Mex &amp; Southern",
+            "<p>Italian</p>",
+            "<b>A</b> &lt;b&gt; <script>var b = '<b>';</script><!-- c -->",
+            "<![CDATA[x]]>y",
+        ]
+        for fragment in fragments:
+            with self.subTest(fragment=fragment):
+                self.assertEqual(
+                    BeautifulSoup(fragment, "html.parser").get_text(),
+                    fragment_text(fragment),
+                )
+        tag = BeautifulSoup("<p>a <b>b</b></p>", "html.parser").p
+        self.assertEqual("a b", fragment_text(tag))
+        self.assertEqual("None", fragment_text(None))
+
+    def test_fragment_elements(self):
+        self.assertEqual([], fragment_elements("Mix well.", "p"))
+        self.assertEqual(
+            ["Mix.", "Bake."],
+            [p.get_text() for p in fragment_elements("<p>Mix.</p><p>Bake.</p>", "p")],
+        )
+        tag = BeautifulSoup("<div><p>Mix.</p></div>", "html.parser").div
+        self.assertEqual([tag.p], fragment_elements(tag, "p"))
@@ -0,0 +1,38 @@
+import unittest
+
+from recipe_scrapers._utils_jp import (
+    get_marker,
+    get_minutes_jp,
+    is_non_japanese_character,
+)
+
+
+class TestUtilsJP(unittest.TestCase):
+    def test_get_minutes_jp(self):
+        fixtures = {
+            "30分": 30,
+            "約15分": 15,
+            "1時間30分": 90,
+            "1.5時間": 90,
+            "12〜15分": 15,
+            "10-20 分": 20,
+            "2日": 2880,
+            "90秒": 2,
+            "PT45M": 45,
+            "すぐ": None,
+        }
+        for text, expected in fixtures.items():
+            with self.subTest(text=text):
+                self.assertEqual(expected, get_minutes_jp(text))
+
+    def test_is_non_japanese_character(self):
+        for char in ("醤", "し", "ョ", "ｼ"):
+            with self.subTest(char=char):
+                self.assertFalse(is_non_japanese_character(char))
+        for char in ("A", "1", "●", "★", "（"):
+            with self.subTest(char=char):
+                self.assertTrue(is_non_japanese_character(char))
+
+    def test_get_marker(self):
+        self.assertEqual("(A)", get_marker("(A)醤油 大さじ1"))
+        self.assertIsNone(get_marker("醤油 (A)"))
@@ -0,0 +1,116 @@
+import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers._grouping_utils import IngredientGroup, group_ingredients
+from recipe_scrapers._wprm import (
+    WPRMRecipe,
+    wprm_equipment,
+    wprm_ingredient_groups,
+    wprm_instructions,
+)
+from recipe_scrapers.plugins import InstrumentationPlugin
+from recipe_scrapers.settings import settings
+
+HTML = """
+<html>
+<body>
+  <p class="wprm-recipe-ingredient">Jump to recipe</p>
+  <div class="wprm-recipe-container">
+    <div class="wprm-recipe">
+      <div class="wprm-recipe-equipment-container">
+        <div class="wprm-recipe-equipment-name">Skillet</div>
+        <div class="wprm-recipe-equipment-name"><a href="#">Whisk</a></div>
+        <div class="wprm-recipe-equipment-name"> Skillet </div>
+        <div class="wprm-recipe-equipment-name"></div>
+      </div>
+      <div class="wprm-recipe-ingredient-group">
+        <h4 class="wprm-recipe-group-name wprm-recipe-ingredient-group-name">For the batter</h4>
+        <ul class="wprm-recipe-ingredients">
+          <li class="wprm-recipe-ingredient">1 cup flour</li>
+          <li class="wprm-recipe-ingredient">1 egg</li>
+        </ul>
+      </div>
+      <div class="wprm-recipe-ingredient-group">
+        <h4 class="wprm-recipe-group-name wprm-recipe-ingredient-group-name">To serve</h4>
+        <ul class="wprm-recipe-ingredients">
+          <li class="wprm-recipe-ingredient">2 tbsp maple syrup</li>
+        </ul>
+      </div>
+      <div class="wprm-recipe-instruction-group">
+        <h4 class="wprm-recipe-group-name wprm-recipe-instruction-group-name">Batter</h4>
+        <div class="wprm-recipe-instruction-text">Whisk the flour and the egg.</div>
+        <div class="wprm-recipe-instruction-text">Cook in the  skillet.</div>
+      </div>
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+INGREDIENTS = ["1 cup flour", "1 egg", "2 tbsp maple syrup"]
+
+
+class TestWPRMRecipe(unittest.TestCase):
+    def setUp(self):
+        self.soup = BeautifulSoup(HTML, "html.parser")
+        self.wprm = WPRMRecipe(self.soup)
+
+    def test_ingredient_groups(self):
+        expected = [
+            IngredientGroup(
+                ingredients=["1 cup flour", "1 egg"], purpose="For the batter"
+            ),
+            IngredientGroup(ingredients=["2 tbsp maple syrup"], purpose="To serve"),
+        ]
+        self.assertEqual(expected, self.wprm.ingredient_groups(INGREDIENTS))
+
+    def test_ingredient_groups_match_group_ingredients(self):
+        card = BeautifulSoup(
+            str(self.soup.find(class_="wprm-recipe-container")), "html.parser"
+        )
+        self.assertEqual(
+            group_ingredients(
+                INGREDIENTS,
+                card,
+                ".wprm-recipe-ingredient-group h4",
+                ".wprm-recipe-ingredient",
+            ),
+            self.wprm.ingredient_groups(INGREDIENTS),
+        )
+
+    def test_ingredient_count_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.wprm.ingredient_groups(INGREDIENTS[:2])
+
+    def test_equipment(self):
+        self.assertEqual(["Skillet", "Whisk"], self.wprm.equipment())
+
+    def test_instructions(self):
+        self.assertEqual(
+            "Whisk the flour and the egg.\nCook in the skillet.",
+            self.wprm.instructions(),
+        )
+
+    def test_page_without_container(self):
+        soup = BeautifulSoup(
+            '<ul><li class="wprm-recipe-ingredient">1 egg</li></ul>', "html.parser"
+        )
+        self.assertEqual(
+            [IngredientGroup(ingredients=["1 egg"], purpose=None)],
+            WPRMRecipe(soup).ingredient_groups(["1 egg"]),
+        )
+
+    def test_method_names(self):
+        # plugins tell the methods they decorate apart by their __name__
+        scraper = mock.Mock()
+        scraper.host.return_value = "example.com"
+        events = []
+        with mock.patch.object(settings, "INSTRUMENTATION_SINKS", (events.append,)):
+            for method in (wprm_ingredient_groups, wprm_equipment, wprm_instructions):
+                InstrumentationPlugin.run(method)(scraper)
+        self.assertEqual(
+            ["ingredient_groups", "equipment", "instructions"],
+            [event.method for event in events],
+        )